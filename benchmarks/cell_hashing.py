@@ -0,0 +1,78 @@
+"""Time every registered maze and solve algorithm with the previous tuple based Cell hashing and with the
+id based hashing.
+
+Algorithms are stepped on headless grids. Solvers run on a recursive backtracker maze.
+
+Usage: python benchmarks/cell_hashing.py [WIDTH HEIGHT]
+"""
+
+import contextlib
+import sys
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS, SOLVE_ALGORITHMS, run_headless
+from terminalmaze.resources.cell import Cell
+from terminalmaze.resources.grid import Grid
+
+SEED = 1234
+
+
+def legacy_hash(self) -> int:
+    return hash((self.row, self.column))
+
+
+def legacy_eq(self, other) -> bool:
+    return isinstance(other, self.__class__) and (other.row, other.column) == (self.row, self.column)
+
+
+@contextlib.contextmanager
+def legacy_hashing():
+    """Temporarily restore the tuple based Cell.__hash__ and Cell.__eq__."""
+    current_hash, current_eq = Cell.__hash__, Cell.__eq__
+    Cell.__hash__, Cell.__eq__ = legacy_hash, legacy_eq  # type: ignore[method-assign]
+    try:
+        yield
+    finally:
+        Cell.__hash__, Cell.__eq__ = current_hash, current_eq  # type: ignore[method-assign]
+
+
+def build_grid(width: int, height: int, algorithm: str) -> Grid:
+    grid = Grid(width, height, themes["default"][algorithm], headless=True)
+    grid.seed = SEED
+    return grid
+
+
+def time_generate(name: str, width: int, height: int) -> float:
+    grid = build_grid(width, height, name)
+    generator = MAZE_ALGORITHMS[name](grid, themes["default"][name])
+    start = time.perf_counter()
+    run_headless(generator.generate_maze(), generator.visual_effects)
+    return time.perf_counter() - start
+
+
+def time_solve(name: str, width: int, height: int) -> float:
+    grid = build_grid(width, height, "recursive_backtracker")
+    generator = MAZE_ALGORITHMS["recursive_backtracker"](grid, themes["default"]["recursive_backtracker"])
+    run_headless(generator.generate_maze(), generator.visual_effects)
+    conditions = "early_exit" if name == "breadth_first_early_exit" else None
+    solver = SOLVE_ALGORITHMS[name](grid, themes["default"][name], conditions)
+    start = time.perf_counter()
+    run_headless(solver.solve(), solver.visual_effects)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    width, height = (int(arg) for arg in sys.argv[1:3]) if len(sys.argv) > 2 else (60, 40)
+    print(f"{width}x{height} grid, seconds per run")
+    print(f"{'algorithm':>26} | {'tuple hash':>10} | {'id hash':>10} | {'speedup':>8}")
+    runs = [(name, time_generate) for name in MAZE_ALGORITHMS] + [(name, time_solve) for name in SOLVE_ALGORITHMS]
+    for name, timer in runs:
+        with legacy_hashing():
+            legacy = timer(name, width, height)
+        current = timer(name, width, height)
+        print(f"{name:>26} | {legacy:>10.3f} | {current:>10.3f} | {legacy / current:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
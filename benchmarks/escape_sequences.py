@@ -0,0 +1,84 @@
+"""Measure escape sequence generation throughput of the previous parse-per-call colorterm and the memoized tables.
+
+Every xterm color and the hex colors of the default theme are converted, foreground and background, per round.
+
+Usage: python benchmarks/escape_sequences.py [ROUNDS]
+"""
+
+import functools
+import sys
+import time
+from collections.abc import Callable
+
+from terminalmaze.config import tm_themes
+from terminalmaze.visual import colorterm
+from terminalmaze.visual.framebuffer import FrameBuffer, Palette
+
+
+def legacy_color(color_code: str | int, location: int) -> str:
+    """colorterm._color before the tables, parsing and formatting on every call."""
+    if isinstance(color_code, str):
+        hex_color = color_code.strip("#")
+        color_ints = [int(hex_color[i : i + 2], 16) for i in range(0, 6, 2)]
+        return f"\x1b[{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}m"
+    if color_code not in range(0, 256):
+        raise ValueError(f"Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255")
+    return f"\x1b[{location};5;{color_code}m"
+
+
+def theme_hex_colors() -> list[str]:
+    """Collect the hex colors used anywhere in the default theme."""
+    colors: set[str] = set()
+
+    def collect(value) -> None:
+        if isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+        elif isinstance(value, list):
+            for item in value:
+                collect(item)
+        elif isinstance(value, str) and value.startswith("#"):
+            colors.add(value)
+
+    collect(tm_themes["default"])
+    return sorted(colors)
+
+
+def measure(convert: Callable[[str | int], str], colors: list[str | int], rounds: int) -> float:
+    """Return the number of sequences generated per second."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for color in colors:
+            convert(color)
+    return rounds * len(colors) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    xterm_colors: list[str | int] = list(range(256))
+    hex_colors: list[str | int] = list(theme_hex_colors())
+    print(f"{rounds} rounds, {len(xterm_colors)} xterm colors, {len(hex_colors)} hex colors")
+    print(f"{'colors':>8} | {'function':>8} | {'legacy/s':>12} | {'tables/s':>12} | {'speedup':>7}")
+    for label, colors in (("xterm", xterm_colors), ("hex", hex_colors)):
+        for name, location, current in (("fg", 38, colorterm.fg), ("bg", 48, colorterm.bg)):
+            legacy_rate = measure(functools.partial(legacy_color, location=location), colors, rounds)
+            current_rate = measure(current, colors, rounds)
+            print(
+                f"{label:>8} | {name:>8} | {legacy_rate:>12,.0f} | {current_rate:>12,.0f} |"
+                f" {current_rate / legacy_rate:>6.1f}x"
+            )
+
+    palette = Palette()
+    glyph = palette.glyph_id("█")
+    frame = FrameBuffer(len(hex_colors), 1, glyph)
+    for column, color in enumerate(hex_colors):
+        frame.fg[column] = palette.color_id(color)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        frame.serialize_row(0, palette)
+    rate = rounds * frame.width / (time.perf_counter() - start)
+    print(f"FrameBuffer.serialize_row: {rate:,.0f} cells/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Time exporting a solved maze to each image format over increasing grid sizes, at one pixel per bitmap pixel. Near
+constant time per cell indicates the export scales linearly with the maze.
+
+The maze is generated headless with the binary tree algorithm, the fastest generator, and solved with breadth first
+search. Images are written to a temporary directory that is removed afterwards.
+
+Usage: python benchmarks/export.py [SIZE ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS, SOLVE_ALGORITHMS, run_headless
+from terminalmaze.resources.grid import Cell, Grid
+from terminalmaze.visual.export import EXPORT_FORMATS, export_maze
+
+SEED = 1234
+
+
+def solved_maze(size: int) -> tuple[Grid, list[Cell]]:
+    """Return a size x size headless binary tree maze and its breadth first solution."""
+    grid = Grid(size, size, themes["default"]["binary_tree"], headless=True)
+    grid.seed = SEED
+    generator = MAZE_ALGORITHMS["binary_tree"](grid, themes["default"]["binary_tree"])
+    run_headless(generator.generate_maze(), generator.visual_effects)
+    solver = SOLVE_ALGORITHMS["breadth_first"](grid, themes["default"]["breadth_first"])
+    run_headless(solver.solve(), solver.visual_effects)
+    return grid, solver.solution
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [100, 250, 500, 1000]
+    print(f"{'size':>10} | {'format':>6} | {'seconds':>8} | {'us/cell':>8} | {'bytes':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            grid, solution = solved_maze(size)
+            for extension in EXPORT_FORMATS:
+                path = os.path.join(directory, "maze" + extension)
+                start = time.perf_counter()
+                export_maze(grid, path, "#2B2B2B", "#F2EFDC", solution, "#FF9607", scale=1)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"{size:>4}x{size:<5} | {extension:>6} | {elapsed:>8.3f} | {elapsed / (size * size) * 1e6:>8.3f} |"
+                    f" {os.path.getsize(path):>11}"
+                )
+
+
+if __name__ == "__main__":
+    main()
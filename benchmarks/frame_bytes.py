@@ -0,0 +1,61 @@
+"""Compare the bytes written per frame by full redraws, by the diff renderer and by the diff renderer drawing through
+the minimaps while a maze generates.
+
+Output is written to an in-memory buffer, the terminal is not touched.
+
+Usage: python benchmarks/frame_bytes.py ALGORITHM [WIDTH HEIGHT] [VERBOSITY]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS
+from terminalmaze.resources.grid import Grid
+
+SEED = 1234
+
+
+def measure(
+    name: str, width: int, height: int, verbosity: int, full_redraw_threshold: float, minimap: str | None = None
+) -> tuple[int, int, float]:
+    """Return the frame count, bytes written and seconds taken to generate and show the maze."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        grid = Grid(width, height, themes["default"][name])
+        grid.seed = SEED
+        visual = grid.visual
+        visual.renderer.full_redraw_threshold = full_redraw_threshold
+        if minimap is not None:
+            visual.use_minimap(minimap)
+        generator = MAZE_ALGORITHMS[name](grid, themes["default"][name])
+        start = time.perf_counter()
+        for maze in generator.generate_maze():
+            visual.show(generator.visual_effects, generator.status_text, verbosity=verbosity, redrawdelay=0)
+        visual.show(generator.visual_effects, generator.status_text, verbosity=verbosity, redrawdelay=0, complete=True)
+        elapsed = time.perf_counter() - start
+    return visual.renderer.frames, visual.renderer.total_bytes, elapsed
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] not in MAZE_ALGORITHMS:
+        print(__doc__)
+        sys.exit(1)
+    name = sys.argv[1]
+    width, height = (int(sys.argv[2]), int(sys.argv[3])) if len(sys.argv) > 3 else (60, 20)
+    verbosity = int(sys.argv[4]) if len(sys.argv) > 4 else 4
+    print(f"{name} {width}x{height} verbosity {verbosity}")
+    print(f"{'renderer':>10} | {'frames':>7} | {'bytes/frame':>11} | {'seconds':>8}")
+    for label, threshold, minimap in (
+        ("full", -1.0, None),
+        ("diff", 0.3, None),
+        ("halfblock", 0.3, "halfblock"),
+        ("braille", 0.3, "braille"),
+    ):
+        frames, total_bytes, elapsed = measure(name, width, height, verbosity, threshold, minimap)
+        print(f"{label:>10} | {frames:>7} | {total_bytes / frames:>11.0f} | {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Time Grid.get_neighbors on masked and unmasked grids against the previous dict building lookup.
+
+Usage: python benchmarks/get_neighbors.py [WIDTH HEIGHT]
+"""
+
+import sys
+import time
+
+from terminalmaze.config import themes, tm_masks
+from terminalmaze.resources.grid import Grid
+
+
+def legacy_get_neighbors(cell_neighbors: dict, masked_cells: dict, ignore_mask=False) -> dict:
+    """The previous get_neighbors: two dicts per call and a linear scan over the masked cells."""
+    neighbors = {}
+    for direction, neighbor in cell_neighbors.items():
+        if not neighbor:
+            continue
+        neighbors[direction] = neighbor
+    if not ignore_mask:
+        unmasked_neighbors = {}
+        for direction, neighbor in neighbors.items():
+            if neighbor not in masked_cells.values():
+                unmasked_neighbors[direction] = neighbor
+        neighbors = unmasked_neighbors
+    return neighbors
+
+
+def time_lookups(lookup, cells) -> float:
+    """Return the mean time in microseconds of one lookup."""
+    start = time.perf_counter()
+    for cell in cells:
+        lookup(cell)
+    return (time.perf_counter() - start) / len(cells) * 1e6
+
+
+def main() -> None:
+    width, height = (int(arg) for arg in sys.argv[1:3]) if len(sys.argv) > 2 else (160, 50)
+    mask_string = tm_masks["terminalmaze"].read_text()
+    print(f"{width}x{height} grid, mean time per get_neighbors call")
+    print(f"{'grid':>10} | {'legacy us':>10} | {'table us':>10} | {'speedup':>8}")
+    for label, mask in (("unmasked", None), ("masked", mask_string)):
+        grid = Grid(width, height, themes["default"]["binary_tree"], mask_string=mask, headless=True)
+        masked_cells = {(cell.row, cell.column): cell for cell in grid.cells if grid.is_masked(cell)}
+        cells = list(grid.each_cell())
+        # the previous Cell stored its neighbors dict as an attribute
+        neighbor_dicts = {cell: cell.neighbors for cell in cells}
+        legacy = time_lookups(lambda cell: legacy_get_neighbors(neighbor_dicts[cell], masked_cells), cells)
+        table = time_lookups(grid.get_neighbors, cells)
+        print(f"{label:>10} | {legacy:>10.3f} | {table:>10.3f} | {legacy / table:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Compare build time and memory of the array backed Grid against the previous dict of Cell objects layout.
+
+Usage: python benchmarks/grid_storage.py [SIZE ...]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from terminalmaze.config import themes
+from terminalmaze.resources.grid import Grid
+
+
+class LegacyCell:
+    """Cell as stored before the array backend: a links set and a neighbors dict per cell."""
+
+    def __init__(self, row: int, col: int) -> None:
+        self.row = row
+        self.column = col
+        self.links: set = set()
+        self.neighbors: dict = {}
+
+    def __hash__(self):
+        return hash((self.row, self.column))
+
+
+def build_legacy(width: int, height: int) -> tuple:
+    """Reproduce the storage built by the previous Grid.prepare_grid/configure_cells."""
+    cells = {}
+    unmasked_cells = {}
+    for row in range(height):
+        for col in range(width):
+            cell = LegacyCell(row, col)
+            cells[(row, col)] = cell
+            unmasked_cells[(row, col)] = cell
+    for cell in cells.values():
+        row, col = cell.row, cell.column
+        for direction, coordinates in {
+            "north": (row - 1, col),
+            "south": (row + 1, col),
+            "west": (row, col - 1),
+            "east": (row, col + 1),
+        }.items():
+            cell.neighbors[direction] = cells.get(coordinates)
+    return cells, unmasked_cells
+
+
+def build_array(width: int, height: int) -> Grid:
+    """Build a headless Grid, the Visual is excluded to match what build_legacy measures."""
+    return Grid(width, height, themes["default"]["binary_tree"], headless=True)
+
+
+def measure(build, size: int) -> tuple[float, float]:
+    """Return build time in seconds and peak traced memory in MB."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build(size, size)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 2**20
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [100, 250, 500]
+    print(f"{'size':>10} | {'legacy s':>9} {'legacy MB':>10} | {'array s':>9} {'array MB':>10}")
+    for size in sizes:
+        legacy_time, legacy_mem = measure(build_legacy, size)
+        array_time, array_mem = measure(build_array, size)
+        print(f"{size:>4}x{size:<5} | {legacy_time:>9.3f} {legacy_mem:>10.1f} | {array_time:>9.3f} {array_mem:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
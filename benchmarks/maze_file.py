@@ -0,0 +1,53 @@
+"""Time saving and loading a maze file over increasing grid sizes, and report the file size.
+
+"read" is MazeReader decoding every row, "from_file" also builds the Grid the rows are loaded into. The maze is
+generated headless with the binary tree algorithm and written to a temporary directory that is removed afterwards.
+
+Usage: python benchmarks/maze_file.py [SIZE ...]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS, run_headless
+from terminalmaze.resources.grid import Grid
+from terminalmaze.resources.mazefile import MazeReader
+
+SEED = 1234
+
+
+def main() -> None:
+    sizes = [int(size) for size in sys.argv[1:]] or [100, 250, 500, 1000]
+    theme = themes["default"]["binary_tree"]
+    print(f"{'size':>10} | {'write':>8} | {'read':>8} | {'from_file':>9} | {'bytes':>9} | {'bits/cell':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "maze.tmz")
+        for size in sizes:
+            grid = Grid(size, size, theme, headless=True)
+            grid.seed = SEED
+            generator = MAZE_ALGORITHMS["binary_tree"](grid, theme)
+            run_headless(generator.generate_maze(), generator.visual_effects)
+            start = time.perf_counter()
+            grid.to_file(path)
+            write = time.perf_counter() - start
+            start = time.perf_counter()
+            reader = MazeReader(path)
+            for _ in reader.rows():
+                pass
+            reader.close()
+            read = time.perf_counter() - start
+            start = time.perf_counter()
+            Grid.from_file(path, theme, headless=True)
+            load = time.perf_counter() - start
+            file_size = os.path.getsize(path)
+            print(
+                f"{size:>4}x{size:<5} | {write:>8.3f} | {read:>8.3f} | {load:>9.3f} | {file_size:>9} |"
+                f" {file_size * 8 / (size * size):>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
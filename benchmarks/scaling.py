@@ -0,0 +1,51 @@
+"""Time headless runs of one algorithm over increasing grid sizes. Near constant time per cell indicates
+near linear scaling.
+
+Solve algorithms run on a recursive backtracker maze.
+
+Usage: python benchmarks/scaling.py ALGORITHM [SIZE ...]
+"""
+
+import sys
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS, SOLVE_ALGORITHMS, run_headless
+from terminalmaze.resources.grid import Grid
+
+SEED = 1234
+
+
+def time_run(name: str, size: int) -> float:
+    """Return the seconds taken to run the algorithm on a size x size headless grid."""
+    generator_name = name if name in MAZE_ALGORITHMS else "recursive_backtracker"
+    grid = Grid(size, size, themes["default"][generator_name], headless=True)
+    grid.seed = SEED
+    generator = MAZE_ALGORITHMS[generator_name](grid, themes["default"][generator_name])
+    if name in MAZE_ALGORITHMS:
+        start = time.perf_counter()
+        run_headless(generator.generate_maze(), generator.visual_effects)
+        return time.perf_counter() - start
+    run_headless(generator.generate_maze(), generator.visual_effects)
+    conditions = "early_exit" if name == "breadth_first_early_exit" else None
+    solver = SOLVE_ALGORITHMS[name](grid, themes["default"][name], conditions)
+    start = time.perf_counter()
+    run_headless(solver.solve(), solver.visual_effects)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] not in MAZE_ALGORITHMS.keys() | SOLVE_ALGORITHMS.keys():
+        print(__doc__)
+        sys.exit(1)
+    name = sys.argv[1]
+    sizes = [int(size) for size in sys.argv[2:]] or [50, 100, 200, 300]
+    print(name)
+    print(f"{'size':>10} | {'cells':>8} | {'seconds':>8} | {'us/cell':>8}")
+    for size in sizes:
+        elapsed = time_run(name, size)
+        print(f"{size:>4}x{size:<5} | {size * size:>8} | {elapsed:>8.3f} | {elapsed / (size * size) * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Time the frames of a maze generating through a viewport the size of a 200x60 terminal over increasing grid sizes.
+Near constant time and bytes per frame indicate the render cost is bounded by the terminal size.
+
+Output is written to an in-memory buffer, the terminal is not touched. Every step is shown and only the first frames
+are measured, generating the whole of a large maze frame by frame takes long.
+
+Usage: python benchmarks/viewport.py ALGORITHM [SIZE ...]
+"""
+
+import contextlib
+import io
+import sys
+import time
+
+from terminalmaze.config import themes
+from terminalmaze.main import MAZE_ALGORITHMS
+from terminalmaze.resources.grid import Grid
+
+SEED = 1234
+TERMINAL_WIDTH, TERMINAL_HEIGHT = 200, 60
+FRAMES = 2000
+
+
+def measure(name: str, size: int) -> tuple[int, float, float]:
+    """Return the frames shown, seconds per frame spent in show and bytes written per frame."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        grid = Grid(size, size, themes["default"][name])
+        grid.seed = SEED
+        visual = grid.visual
+        visual.terminal_width, visual.terminal_height = TERMINAL_WIDTH, TERMINAL_HEIGHT
+        visual.use_viewport()
+        generator = MAZE_ALGORITHMS[name](grid, themes["default"][name])
+        # show every step, the frame scheduler would batch more steps per frame on larger grids
+        generator.skip_frames = 0
+        frames = 0
+        elapsed = 0.0
+        for maze in generator.generate_maze():
+            start = time.perf_counter()
+            visual.show(generator.visual_effects, generator.status_text, verbosity=4, redrawdelay=0)
+            elapsed += time.perf_counter() - start
+            frames += 1
+            if frames == FRAMES:
+                break
+    return frames, elapsed / frames, len(output.getvalue().encode()) / frames
+
+
+def main() -> None:
+    if len(sys.argv) < 2 or sys.argv[1] not in MAZE_ALGORITHMS:
+        print(__doc__)
+        sys.exit(1)
+    name = sys.argv[1]
+    sizes = [int(size) for size in sys.argv[2:]] or [100, 250, 500, 1000]
+    print(f"{name}, {TERMINAL_WIDTH}x{TERMINAL_HEIGHT} viewport")
+    print(f"{'size':>10} | {'frames':>7} | {'ms/frame':>8} | {'bytes/frame':>11}")
+    for size in sizes:
+        frames, seconds, frame_bytes = measure(name, size)
+        print(f"{f'{size}x{size}':>10} | {frames:>7} | {seconds * 1000:>8.3f} | {frame_bytes:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
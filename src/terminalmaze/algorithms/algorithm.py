@@ -1,9 +1,11 @@
 import random
 import time
+from collections.abc import Sized
 from typing import Generator
 
 from pydantic import BaseModel
 
+from terminalmaze.algorithms.scheduler import FrameScheduler
 from terminalmaze.resources.grid import Cell, Grid
 from terminalmaze.visual.visualeffects import VisualEffect
 
@@ -15,8 +17,10 @@ class Algorithm:
         self.visual_effects: dict[str, VisualEffect] = dict()
         self.status_text: dict[str, str | int | None] = dict()
         self.status_text = {"Algorithm": "", "Seed": self.maze.seed, "Time Elapsed": ""}
-        self.skip_frames = 0
+        # fixed number of frames to skip, None lets the scheduler choose
+        self.skip_frames: int | None = None
         self.frames_skipped = 0
+        self.scheduler = FrameScheduler(len(self.maze.unmasked_cells))
         self.start_time = time.time()
         random.seed(self.maze.seed)
 
@@ -30,25 +34,53 @@ class Algorithm:
         """
         yield self.maze
 
-    def frame_wanted_relative(self, relative_to: list[Cell] | None, divisor: int = 1) -> bool:
-        """Skip frames relative to the length of a list of Cells. Used to avoid slowdowns in algorithms
+    def progress(self) -> float:
+        """Fraction of the algorithm's work done, reported to the frame scheduler. Based on the number of links
+        in a spanning tree of the unmasked cells, algorithms that do other work override it.
+
+        Returns:
+            float: 0 to 1
+        """
+        return min(1.0, self.maze.link_count / max(1, len(self.maze.unmasked_cells) - 1))
+
+    def scheduled_frame_wanted(self) -> bool:
+        """Ask the frame scheduler if the current step should be displayed.
+
+        Returns:
+            bool: True if a frame should be displayed, else False.
+        """
+        visual = self.maze.visual
+        if visual is None:
+            return self.scheduler.frame_wanted(self.progress())
+        return self.scheduler.frame_wanted(self.progress(), visual.render_time, visual.frames_rendered)
+
+    def pace_step(self) -> None:
+        """Called after each shown step, waits when the run is ahead of its duration target."""
+        self.scheduler.pace(self.progress())
+
+    def frame_wanted_relative(self, relative_to: Sized | None, divisor: int | None = None) -> bool:
+        """Skip frames relative to the length of a collection of Cells. Used to avoid slowdowns in algorithms
         that have many 'ends' or workingcells alternative paths.
 
         Args:
-            relative_to (list[Cell]): List of cells on which to base the frame skip.
-            divisor (int): relative to // divisor, used to reduce the number of skipped frames for tuning.
-            Defaults to 1.
+            relative_to (Sized): Collection of cells, such as a list or deque, on which to base the frame skip.
+            divisor (int | None): relative to // divisor, used to reduce the number of skipped frames for tuning.
+            Defaults to None, the frame scheduler decides instead.
 
         Returns:
             bool: True if frame should be displayed, else False.
         """
 
-        if not isinstance(relative_to, list):
+        if not isinstance(relative_to, Sized):
             raise TypeError(relative_to)
+        if divisor is None:
+            return self.scheduled_frame_wanted()
         if not divisor >= 1 and isinstance(divisor, int):
             raise ValueError(divisor)
 
         skip_frames_now = len(relative_to) // divisor
+        if self.skip_frames is None:
+            self.skip_frames = skip_frames_now
         if self.frames_skipped >= self.skip_frames:
             self.frames_skipped = 0
             self.skip_frames = skip_frames_now
@@ -67,11 +99,13 @@ class Algorithm:
 
     def frame_wanted(self) -> bool:
         """Return True if the number of frames skipped is equal to the
-        self.skip_frames variable.
+        self.skip_frames variable. Without a fixed self.skip_frames, the frame scheduler decides.
 
         Returns:
-            bool: True if self.frames_skipped == self.skip_frames, else False.
+            bool: True if a frame should be displayed, else False.
         """
+        if self.skip_frames is None:
+            return self.scheduled_frame_wanted()
         if self.skip_frames == 0:
             return True
         if self.frames_skipped >= self.skip_frames:
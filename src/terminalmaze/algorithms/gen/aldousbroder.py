@@ -16,6 +16,16 @@ class AldousBroder(Algorithm):
         self.frame_time = time.time()
         self.theme = theme
 
+    def searching_frame_wanted(self) -> bool:
+        """Show a searching step once maximum_searching_frame_delay passed since the last one if the theme sets
+        it, else as the frame scheduler decides."""
+        if self.theme.maximum_searching_frame_delay is None:
+            return self.frame_wanted()
+        if time.time() - self.frame_time > self.theme.maximum_searching_frame_delay:
+            self.frame_time = time.time()
+            return True
+        return False
+
     def generate_maze(self) -> Generator[Grid, None, None]:
         unvisited = set(self.maze.each_cell())
         working_cell = unvisited.pop()
@@ -30,7 +40,7 @@ class AldousBroder(Algorithm):
         self.visual_effects["invalid_visited"] = ve_invalid_visited
         revisited = 0
         while unvisited:
-            neighbors = [neighbor for neighbor in self.maze.get_neighbors(working_cell).values() if neighbor]
+            neighbors = self.maze.get_neighbors(working_cell)
             ve_invalid_neighbors.cells.extend([neighbor for neighbor in neighbors if neighbor not in unvisited])
             neighbor = random.choice(neighbors)
             if neighbor in unvisited:
@@ -48,9 +58,7 @@ class AldousBroder(Algorithm):
                 if neighbor not in ve_invalid_visited.cells:
                     ve_invalid_visited.cells.append(neighbor)
                 ve_invalid_visited.cells = ve_invalid_visited.cells[-50:]
-                time_since_last_frame = time.time() - self.frame_time
-                if time_since_last_frame > self.theme.maximum_searching_frame_delay:
-                    self.frame_time = time.time()
+                if self.searching_frame_wanted():
                     self.status_text["Unvisited"] = len(unvisited)
                     self.status_text["Cell"] = f"({working_cell.row},{working_cell.column})"
 
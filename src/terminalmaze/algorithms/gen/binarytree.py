@@ -33,18 +33,15 @@ class BinaryTree(Algorithm):
 
         for cell in self.maze.each_cell(ignore_mask=True):
             ve_workingcell.cells.append(cell)
-            neighbors = self.maze.get_neighbors(cell, ignore_mask=True)
-            ve_neighbors.cells.extend([cell for cell in neighbors.values()])
-            neighbors.pop("south", None)
-            neighbors.pop("west", None)
+            ve_neighbors.cells.extend(self.maze.get_neighbors(cell, ignore_mask=True))
+            neighbors = [neighbor for neighbor in (cell.neighbor("north"), cell.neighbor("east")) if neighbor]
             if neighbors:
-                neighbor = random.choice(list(neighbors.values()))
-                if neighbor:
-                    self.status_text["State"] = "Linking"
-                    self.maze.link_cells(cell, neighbor)
-                    unlinked_cells.discard(neighbor)
-                    unlinked_cells.discard(cell)
-                    ve_last_linked.cells.append(neighbor)
+                neighbor = random.choice(neighbors)
+                self.status_text["State"] = "Linking"
+                self.maze.link_cells(cell, neighbor)
+                unlinked_cells.discard(neighbor)
+                unlinked_cells.discard(cell)
+                ve_last_linked.cells.append(neighbor)
             self.status_text["Unlinked Cells"] = len(unlinked_cells)
             yield self.maze
 
@@ -21,19 +21,19 @@ class Ellers(Algorithm):
 
     def generate_maze(self) -> Generator[Grid, None, None]:
         unlinked_cells = set(self.maze.each_cell())
-        cell_to_group: dict[tuple[int, int], int] = {}  # cell_address : group
+        cell_to_group: dict[int, int] = {}  # cell id : group
         group_to_cell: defaultdict[int, list[Cell]] = defaultdict(list)  # group : Cell
         ve_groups = ve.RandomColorGroup(self.theme.group_to_random_color)
-        ve_groups.groups = group_to_cell
         self.visual_effects["groups"] = ve_groups
         group_id = 0
         for i, row in enumerate(self.maze.each_row(ignore_mask=self.ignore_mask)):
             row_groups: defaultdict[int, list[Cell]] = defaultdict(list)
             for cell in row:
-                cell_address = (cell.row, cell.column)
+                cell_address = cell.id
                 if cell_address not in cell_to_group:
                     cell_to_group[cell_address] = group_id
                     group_to_cell[group_id].append(cell)
+                    ve_groups.assign(group_id, [cell])
                     row_groups[group_id].append(cell)
                     group_id += 1
                 else:
@@ -50,12 +50,13 @@ class Ellers(Algorithm):
             while links_to_make:
                 self.status_text["State"] = "Merging Groups"
                 cell = random.choice(unchecked_cells)
-                cell_address = (cell.row, cell.column)
+                cell_address = cell.id
                 cell_group = cell_to_group[cell_address]
-                for direction, neighbor in self.maze.get_neighbors(cell, ignore_mask=self.ignore_mask).items():
-                    if direction not in ("east", "west") or not neighbor:
+                for direction in ("west", "east"):
+                    neighbor = cell.neighbor(direction)
+                    if not neighbor:
                         continue
-                    neighbor_address = (neighbor.row, neighbor.column)
+                    neighbor_address = neighbor.id
                     neighbor_group = cell_to_group[neighbor_address]
                     if cell in neighbor.links or cell_group == neighbor_group:
                         continue
@@ -67,8 +68,9 @@ class Ellers(Algorithm):
                     for group_member in [member for member in row_groups[neighbor_group]]:
                         row_groups[neighbor_group].remove(group_member)
                         row_groups[cell_group].append(group_member)
-                        cell_to_group[(group_member.row, group_member.column)] = cell_group
+                        cell_to_group[group_member.id] = cell_group
                     group_to_cell[cell_group].extend(group_to_cell[neighbor_group])
+                    ve_groups.assign(cell_group, group_to_cell[neighbor_group])
                     del group_to_cell[neighbor_group]
                     if not row_groups[neighbor_group]:
                         del row_groups[neighbor_group]
@@ -84,12 +86,13 @@ class Ellers(Algorithm):
                 while cells_to_drop:
                     self.status_text["State"] = "Dropping"
                     cell = group_cells.pop(random.randint(0, len(group_cells) - 1))
-                    neighbor = self.maze.get_neighbors(cell, ignore_mask=self.ignore_mask)["south"]
+                    neighbor = cell.neighbor("south")
                     if not neighbor:
                         continue
-                    neighbor_address = (neighbor.row, neighbor.column)
+                    neighbor_address = neighbor.id
                     cell_to_group[neighbor_address] = group
-                    group_to_cell[cell_to_group[(cell.row, cell.column)]].append(neighbor)
+                    group_to_cell[cell_to_group[cell.id]].append(neighbor)
+                    ve_groups.assign(cell_to_group[cell.id], [neighbor])
                     cells_to_drop -= 1
                     self.maze.link_cells(cell, neighbor)
                     unlinked_cells.discard(cell)
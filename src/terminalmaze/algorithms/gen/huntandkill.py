@@ -4,7 +4,8 @@ Hunt and Kill
 -------------
 Step 1 - Pick a random starting cell.
 Step 2 - Randomly walk to unvisited neighbors until a cell with no unvisited neighbors is reached.
-Step 3 - Check unvisited cells until a cell with a visited neighbor is discovered.
+Step 3 - Check unvisited cells until a cell with a visited neighbor is discovered. Each hunt scans the cells
+         in row order, resuming from the cell where the previous hunt stopped.
 Step 4 - Repeat steps 2 -> 3 until there are no unvisited cells left.
 
 
@@ -20,6 +21,7 @@ import terminalmaze.visual.visualeffects as ve
 from terminalmaze.algorithms.algorithm import Algorithm
 from terminalmaze.config import HuntAndKillTheme
 from terminalmaze.resources.grid import Cell, Grid
+from terminalmaze.resources.indexedset import IndexedSet
 
 
 class HuntandKill(Algorithm):
@@ -55,9 +57,11 @@ class HuntandKill(Algorithm):
         Yields:
             Grid: grid of cells
         """
-        unvisited = list(self.maze.each_cell())
-        cell = random.choice(unvisited)
+        cells = list(self.maze.each_cell())
+        unvisited = IndexedSet(cells)
+        cell = unvisited.random_choice()
         unvisited.remove(cell)
+        hunt_cursor = 0  # position in cells where the next hunt starts
 
         ve_workingcell = ve.Animation(self.theme.working_cell)
         ve_workingcell.cells.append(cell)
@@ -76,7 +80,7 @@ class HuntandKill(Algorithm):
             self.status_text["Unvisited Cells"] = len(unvisited)
             ve_workingcell.cells.append(cell)
             unvisited_neighbors = [
-                neighbor for neighbor in self.maze.get_neighbors(cell).values() if neighbor in unvisited
+                neighbor for neighbor in self.maze.get_neighbors(cell) if neighbor in unvisited
             ]
             if unvisited_neighbors:
                 self.status_text["State"] = "Linking"
@@ -88,10 +92,13 @@ class HuntandKill(Algorithm):
                 yield self.maze
 
             else:
-                for cell in unvisited[:]:
+                for scanned in range(len(cells)):
+                    cell = cells[(hunt_cursor + scanned) % len(cells)]
+                    if cell not in unvisited:
+                        continue
                     self.status_text["State"] = "Hunting"
                     ve_workingcell.cells.append(cell)
-                    neighbors = [neighbor for neighbor in self.maze.get_neighbors(cell).values() if neighbor]
+                    neighbors = self.maze.get_neighbors(cell)
                     visited_neighbors = [neighbor for neighbor in neighbors if neighbor.links]
                     ve_invalidneighbors.cells.extend([neighbor for neighbor in neighbors if not neighbor.links])
                     ve_hunt_cells.cells.append(cell)
@@ -102,18 +109,18 @@ class HuntandKill(Algorithm):
                         self.maze.link_cells(cell, neighbor)
                         ve_last_linked.cells.append(neighbor)
                         unvisited.remove(cell)
+                        hunt_cursor = (hunt_cursor + scanned) % len(cells)
                         yield self.maze
                         break
+                else:
+                    # remaining cells are cut off from the maze by the mask
+                    break
 
         self.status_text["Unvisited Cells"] = 0
         del self.visual_effects["working_cell"]
         del self.visual_effects["invalid_neighbors"]
-        while (
-            ve_hunt_cells.animating
-            or ve_invalidneighbors.animating
-            or ve_last_linked.animating
-            or ve_workingcell.animating
-        ):
+        # removed effects are no longer animated, waiting on them would never finish
+        while ve_hunt_cells.animating or ve_last_linked.animating:
             yield self.maze
         self.status_text["State"] = "Complete"
         yield self.maze
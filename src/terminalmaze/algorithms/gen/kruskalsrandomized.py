@@ -6,6 +6,7 @@ import terminalmaze.visual.visualeffects as ve
 from terminalmaze.algorithms.algorithm import Algorithm
 from terminalmaze.config import KruskalsRandomizedTheme
 from terminalmaze.resources.cell import Cell
+from terminalmaze.resources.disjointset import DisjointSet
 from terminalmaze.resources.grid import Grid
 
 
@@ -14,66 +15,63 @@ class KruskalsRandomized(Algorithm):
         super().__init__(maze, theme)
         self.theme = theme
         self.group_to_cell_map_logic: defaultdict[int, set[Cell]] = defaultdict(set)  # group : {cells}
-        self.cell_to_group_map: dict[Cell, int] = dict()  # cell_address : group
+        self.group_labels: dict[int, int] = dict()  # disjoint set root : group
+        self.disjoint_set = DisjointSet(self.maze.size())
+        self.ve_groups = ve.RandomColorGroup(self.theme.group_random_color)
+        self.visual_effects["groups"] = self.ve_groups
         self.status_text["Algorithm"] = "Kruskal's Randomized"
         self.status_text["Available Links"] = 0
         self.status_text["Groups"] = 0
         self.status_text["State"] = ""
 
     def generate_maze(self) -> Generator[Grid, None, None]:
-        links: set[tuple[Cell, Cell]] = set()
-        groups = list()
-        group_id = 0
+        links: list[tuple[Cell, Cell]] = list()
+        groups = 0
         for cell in self.maze.each_cell():
-            # initialize groups
-            groups.append(group_id)
-            self.cell_to_group_map[cell] = group_id
-            # group_to_cell_map_logic[group_id].append(cell)
-            group_id += 1
-            # find all links
-            for neighbor in self.maze.get_neighbors(cell).values():
-                if (neighbor, cell) not in links and neighbor:  # check if reversed link is already in list
-                    links.add((cell, neighbor))
+            groups += 1
+            for neighbor in self.maze.get_neighbors(cell):
+                if neighbor.id > cell.id:  # add each link once
+                    links.append((cell, neighbor))
+        random.shuffle(links)
 
-        ve_groups = ve.RandomColorGroup(self.theme.group_random_color)
-        ve_groups.groups = self.group_to_cell_map_logic
-        self.visual_effects["groups"] = ve_groups
-
-        while len(groups) > 1:
+        for links_checked, (cell_a, cell_b) in enumerate(links, start=1):
+            if groups <= 1:
+                break
             self.status_text["State"] = "Merging Groups"
-            link = random.choice(list(links))
-            links.discard(link)
-            cell_a = link[0]
-            cell_a_group = self.cell_to_group_map[cell_a]
-            cell_b = link[1]
-            cell_b_group = self.cell_to_group_map[cell_b]
-            if cell_a not in self.group_to_cell_map_logic[cell_a_group]:
-                self.group_to_cell_map_logic[cell_a_group].add(cell_a)
-            if cell_b not in self.group_to_cell_map_logic[cell_b_group]:
-                self.group_to_cell_map_logic[cell_b_group].add(cell_b)
-            if cell_a_group == cell_b_group:
+            cell_a_root = self.disjoint_set.find(cell_a.id)
+            cell_b_root = self.disjoint_set.find(cell_b.id)
+            for cell, root in ((cell_a, cell_a_root), (cell_b, cell_b_root)):
+                group = self.group_labels.get(root, root)
+                if cell not in self.group_to_cell_map_logic[group]:
+                    self.group_to_cell_map_logic[group].add(cell)
+                    self.ve_groups.assign(group, [cell])
+            if cell_a_root == cell_b_root:
                 continue
             self.maze.link_cells(cell_a, cell_b)
-            self.merge_groups(cell_a, cell_b, groups)
+            self.merge_groups(cell_a_root, cell_b_root)
+            groups -= 1
 
-            self.status_text["Available Links"] = len(links)
-            self.status_text["Groups"] = len(groups)
+            self.status_text["Available Links"] = len(links) - links_checked
+            self.status_text["Groups"] = groups
             yield self.maze
         self.status_text["State"] = "Complete"
         yield self.maze
 
-    def merge_groups(self, cell_a: Cell, cell_b: Cell, groups):
-        cell_a_group = self.cell_to_group_map[cell_a]
-        cell_b_group = self.cell_to_group_map[cell_b]
+    def merge_groups(self, cell_a_root: int, cell_b_root: int) -> None:
+        """Union the disjoint sets rooted at cell_a_root and cell_b_root and merge their visual groups. The
+        merged group keeps the id, and so the color, of the larger group, only the cells of the smaller group are
+        reported to the visual as regrouped.
+
+        Args:
+            cell_a_root (int): disjoint set root of the first group
+            cell_b_root (int): disjoint set root of the second group
+        """
+        cell_a_group = self.group_labels.pop(cell_a_root, cell_a_root)
+        cell_b_group = self.group_labels.pop(cell_b_root, cell_b_root)
         smaller_group, larger_group = sorted(
             [cell_a_group, cell_b_group], key=lambda cell_group: len(self.group_to_cell_map_logic[cell_group])
         )
-        self.group_to_cell_map_logic[larger_group].update(self.group_to_cell_map_logic[smaller_group])
-        del self.group_to_cell_map_logic[smaller_group]
-        for cell, group in self.cell_to_group_map.items():
-            if group == smaller_group:
-                if cell_a_group == larger_group:
-                    self.cell_to_group_map[cell] = cell_a_group
-                elif cell_b_group == larger_group:
-                    self.cell_to_group_map[cell] = cell_b_group
-        groups.remove(smaller_group)
+        smaller_group_cells = self.group_to_cell_map_logic.pop(smaller_group)
+        self.group_to_cell_map_logic[larger_group].update(smaller_group_cells)
+        self.ve_groups.assign(larger_group, smaller_group_cells)
+        self.group_labels[self.disjoint_set.union(cell_a_root, cell_b_root)] = larger_group
@@ -42,7 +42,7 @@ class PrimsSimple(Algorithm):
             self.status_text["State"] = "Linking"
             working_cell = edge_cells.pop(random.randrange(len(edge_cells)))
             ve_workingcell.cells.append(working_cell)
-            neighbors = [neighbor for neighbor in self.maze.get_neighbors(working_cell).values() if neighbor]
+            neighbors = self.maze.get_neighbors(working_cell)
             unlinked_neighbors = [neighbor for neighbor in neighbors if not neighbor.links]
             ve_invalidneighbors.cells.extend([neighbor for neighbor in neighbors if neighbor.links])
             if unlinked_neighbors:
@@ -54,7 +54,7 @@ class PrimsSimple(Algorithm):
                 if unlinked_neighbors:
                     edge_cells.append(working_cell)
                     ve_edges.cells.append(working_cell)
-                unlinked_neighbors = list(n for n in self.maze.get_neighbors(next_cell).values() if n and not n.links)
+                unlinked_neighbors = list(n for n in self.maze.get_neighbors(next_cell) if not n.links)
                 if unlinked_neighbors:
                     edge_cells.append(next_cell)
                     ve_edges.cells.append(working_cell)
@@ -1,4 +1,6 @@
+import heapq
 import random
+from itertools import count
 from typing import Generator
 
 import terminalmaze.visual.visualeffects as ve
@@ -26,7 +28,7 @@ class PrimsWeighted(Algorithm):
         ve_last_linked = ve.Animation(self.theme.last_linked)
         self.visual_effects["last_linked"] = ve_last_linked
 
-        ve_pending_weighted_links = ve.ModifyMultipleCells(self.theme.pending_weighted_links)
+        ve_pending_weighted_links = ve.ModifyTrackedCells(self.theme.pending_weighted_links)
         self.visual_effects["pending_weighted_links"] = ve_pending_weighted_links
 
         ve_new_weighted_links = ve.Animation(self.theme.new_weighted_links)
@@ -38,29 +40,36 @@ class PrimsWeighted(Algorithm):
             cell_weights[cell] = random.randint(0, 99)
             total_cells_unlinked += 1
         cell = self.maze.random_cell()
-        pending_weighted_links = list()
-        unlinked_neighbors = list(n for n in self.maze.get_neighbors(cell).values() if n and not n.links)
+        # heap of (weight, insertion order, cell, neighbor), the insertion order breaks ties between equal
+        # weights in favor of the link added first. Links to cells linked since they were pushed are stale and
+        # skipped when popped.
+        pending_weighted_links: list[tuple[int, int, Cell, Cell]] = list()
+        link_order = count()
+        unlinked_neighbors = list(n for n in self.maze.get_neighbors(cell) if not n.links)
         for neighbor in unlinked_neighbors:
-            pending_weighted_links.append((cell, neighbor, cell_weights[neighbor]))
+            heapq.heappush(pending_weighted_links, (cell_weights[neighbor], next(link_order), cell, neighbor))
+            ve_pending_weighted_links.add(cell)
         while pending_weighted_links:
             self.status_text["State"] = "Linking"
-            ve_pending_weighted_links.cells = [link[0] for link in pending_weighted_links]
             next_cell: Cell
             working_cell: Cell
 
-            working_cell, next_cell, cost = min(pending_weighted_links, key=lambda link: link[2])
+            _, _, working_cell, next_cell = heapq.heappop(pending_weighted_links)
+            ve_pending_weighted_links.remove(working_cell)
             ve_working_cell.cells.append(working_cell)
-            pending_weighted_links.remove((working_cell, next_cell, cost))
             if next_cell.links:
                 continue
             self.maze.link_cells(working_cell, next_cell)
             total_cells_unlinked -= 1
             ve_last_linked.cells.append(next_cell)
-            unlinked_neighbors = list(n for n in self.maze.get_neighbors(next_cell).values() if n and not n.links)
+            unlinked_neighbors = list(n for n in self.maze.get_neighbors(next_cell) if not n.links)
             ve_unlinked_neighbors.cells.extend(unlinked_neighbors)
             if unlinked_neighbors:
                 for neighbor in unlinked_neighbors:
-                    pending_weighted_links.append((next_cell, neighbor, cell_weights[neighbor]))
+                    heapq.heappush(
+                        pending_weighted_links, (cell_weights[neighbor], next(link_order), next_cell, neighbor)
+                    )
+                    ve_pending_weighted_links.add(next_cell)
                     ve_new_weighted_links.cells.append(next_cell)
             self.status_text["Edges"] = len(pending_weighted_links)
             self.status_text["Unlinked Cells"] = total_cells_unlinked
@@ -23,8 +23,8 @@ class RecursiveBacktracker(Algorithm):
         ve_working_cell.cells.append(cell)
         self.visual_effects["working_cell"] = ve_working_cell
 
-        ve_stack = ve.ModifyMultipleCells(self.theme.stack)
-        ve_stack.cells = stack
+        ve_stack = ve.ModifyTrackedCells(self.theme.stack)
+        ve_stack.add(cell)
         self.visual_effects["stack"] = ve_stack
 
         ve_invalid_neighbors = ve.Animation(self.theme.invalid_neighbors)
@@ -42,7 +42,7 @@ class RecursiveBacktracker(Algorithm):
 
         while stack:
             ve_working_cell.cells.append(cell)
-            neighbors = [neighbor for neighbor in self.maze.get_neighbors(cell).values() if neighbor]
+            neighbors = self.maze.get_neighbors(cell)
             unvisited_neighbors = [neighbor for neighbor in neighbors if not neighbor.links]
             ve_invalid_neighbors.cells.extend([neighbor for neighbor in neighbors if neighbor.links])
             if unvisited_neighbors:
@@ -52,13 +52,14 @@ class RecursiveBacktracker(Algorithm):
                 ve_stack_added_cells.cells.append(next_cell)
                 ve_last_linked.cells.append(next_cell)
                 stack.append(next_cell)
+                ve_stack.add(next_cell)
                 cell = next_cell
                 self.status_text["Pending Paths"] = len(unvisited_neighbors)
                 self.status_text["Stack Length"] = len(stack)
                 yield self.maze
 
             else:
-                stack.pop()
+                ve_stack.remove(stack.pop())
                 if stack:
                     self.status_text["State"] = "Backtracking"
                     cell = stack[-1]
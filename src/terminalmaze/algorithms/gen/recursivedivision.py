@@ -16,7 +16,6 @@ class RecursiveDivision(Algorithm):
 
         self.divisions = 0
         self.theme = theme
-        self.skip_frames = 30
         self.ve_working_cell = ve.Animation(self.theme.working_cell)
         self.visual_effects["working_cell"] = self.ve_working_cell
         self.ve_division_cell_east = ve.Animation(self.theme.division_cell_east)
@@ -32,13 +31,18 @@ class RecursiveDivision(Algorithm):
         self.ve_passage_cell = ve.Animation(self.theme.passage_cell)
         self.visual_effects["passage_cell"] = self.ve_passage_cell
 
+    def progress(self) -> float:
+        """Fraction of the links between all cells made. Only the initial linking of every cell is scheduled."""
+        width, height = self.maze.width, self.maze.height
+        return min(1.0, self.maze.link_count / max(1, (width - 1) * height + (height - 1) * width))
+
     def generate_maze(self) -> Generator[Grid, None, None]:
         all_cells = list(self.maze.each_cell(ignore_mask=True))
         while all_cells:
             working_cell = all_cells.pop(random.randint(0, len(all_cells) - 1))
             self.ve_generating_links_cells.cells.append(working_cell)
-            for _, neighbor in self.maze.get_neighbors(working_cell, ignore_mask=True).items():
-                if neighbor and neighbor not in working_cell.links:
+            for neighbor in self.maze.get_neighbors(working_cell, ignore_mask=True):
+                if not working_cell.is_linked(neighbor):
                     self.maze.link_cells(working_cell, neighbor)
                     self.ve_generating_links_cells.cells.append(neighbor)
                     if self.frame_wanted():
@@ -81,12 +85,12 @@ class RecursiveDivision(Algorithm):
                 self.ve_passage_cell.cells.append(self.maze.get_cell((row + wall_row_index, column + cell_column)))
                 continue
             cell = self.maze.get_cell((row + wall_row_index, column + cell_column))
-            neighbors = self.maze.get_neighbors(cell, ignore_mask=True)
-            if "south" in neighbors and neighbors["south"] and neighbors["south"] in cell.links:
-                self.maze.unlink_cells(cell, neighbors["south"])
+            neighbor_south = cell.neighbor("south")
+            if neighbor_south and cell.is_linked(neighbor_south):
+                self.maze.unlink_cells(cell, neighbor_south)
                 self.ve_working_cell.cells.append(cell)
                 self.ve_division_cell_north.cells.append(cell)
-                self.ve_division_cell_south.cells.append(neighbors["south"])
+                self.ve_division_cell_south.cells.append(neighbor_south)
                 yield self.maze
 
         if (wall_row_index + 1) * width < (height - wall_row_index - 1) * width:
@@ -108,12 +112,12 @@ class RecursiveDivision(Algorithm):
             if cell_row == passage_index:
                 continue
             cell = self.maze.get_cell((row + cell_row, column + wall_column_index))
-            neighbors = self.maze.get_neighbors(cell, ignore_mask=True)
-            if "east" in neighbors and neighbors["east"] and neighbors["east"] in cell.links:
-                self.maze.unlink_cells(cell, neighbors["east"])
+            neighbor_east = cell.neighbor("east")
+            if neighbor_east and cell.is_linked(neighbor_east):
+                self.maze.unlink_cells(cell, neighbor_east)
                 self.ve_working_cell.cells.append(cell)
                 self.ve_division_cell_west.cells.append(cell)
-                self.ve_division_cell_east.cells.append(neighbors["east"])
+                self.ve_division_cell_east.cells.append(neighbor_east)
                 yield self.maze
 
         if (height * (wall_column_index + 1)) < (height * (width - wall_column_index - 1)):
@@ -21,7 +21,7 @@ class Sidewinder(Algorithm):
         self.status_text["State"] = ""
 
     def generate_maze(self) -> Generator[Grid, None, None]:
-        ve_run = ve.ModifyMultipleCells(self.theme.run)
+        ve_run = ve.ModifyTrackedCells(self.theme.run)
         self.visual_effects["run"] = ve_run
 
         ve_working_cell = ve.Animation(self.theme.working_cell)
@@ -34,7 +34,6 @@ class Sidewinder(Algorithm):
         self.status_text["Unvisited Cells"] = total_cells_unvisited
 
         run: list[Cell] = []
-        ve_run.cells = run
         unvisited_cells: deque = deque()
         for row in self.maze.each_row(ignore_mask=True, bottom_up=True):
             unvisited_cells.extend(row.copy())
@@ -44,32 +43,36 @@ class Sidewinder(Algorithm):
                 self.status_text["Unvisited Cells"] = total_cells_unvisited
                 ve_working_cell.cells.append(working_cell)
                 run.append(working_cell)
+                ve_run.add(working_cell)
                 while run:
                     self.status_text["State"] = "Run"
-                    neighbors = self.maze.get_neighbors(working_cell, ignore_mask=True)
-                    if "west" in neighbors:
-                        del neighbors["west"]
-                    if "south" in neighbors:
-                        del neighbors["south"]
-                    if not neighbors:
+                    neighbor_east = working_cell.neighbor("east")
+                    directions = [
+                        direction
+                        for direction, neighbor in (("north", working_cell.neighbor("north")), ("east", neighbor_east))
+                        if neighbor
+                    ]
+                    if not directions:
                         break
-                    direction = random.choice(list(neighbors.keys()))
-                    if direction == "east" and neighbors["east"]:
-                        self.maze.link_cells(working_cell, neighbors["east"])
-                        ve_last_linked.cells.append(neighbors["east"])
-                        working_cell = neighbors["east"]
+                    direction = random.choice(directions)
+                    if direction == "east" and neighbor_east:
+                        self.maze.link_cells(working_cell, neighbor_east)
+                        ve_last_linked.cells.append(neighbor_east)
+                        working_cell = neighbor_east
                         ve_working_cell.cells.append(working_cell)
                         run.append(working_cell)
+                        ve_run.add(working_cell)
                         unvisited_cells.popleft()
                     elif direction == "north":
                         self.status_text["State"] = "Climb"
                         working_cell = random.choice(run)
                         ve_working_cell.cells.append(working_cell)
-                        neighbor_north = self.maze.get_neighbors(working_cell, ignore_mask=True)["north"]
+                        neighbor_north = working_cell.neighbor("north")
                         if neighbor_north:
                             self.maze.link_cells(working_cell, neighbor_north)
                             ve_last_linked.cells.append(neighbor_north)
                         run.clear()
+                        ve_run.clear()
                     yield self.maze
         self.visual_effects.clear()
         self.status_text["State"] = "Complete"
@@ -5,6 +5,7 @@ import terminalmaze.visual.visualeffects as ve
 from terminalmaze.algorithms.algorithm import Algorithm
 from terminalmaze.config import WilsonsTheme
 from terminalmaze.resources.grid import Cell, Grid
+from terminalmaze.resources.indexedset import IndexedSet
 
 
 class Wilsons(Algorithm):
@@ -28,10 +29,10 @@ class Wilsons(Algorithm):
         ve_working_cell = ve.Animation(self.theme.working_cell)
         self.visual_effects["working_cell"] = ve_working_cell
 
-        ve_searching_walk = ve.ModifyMultipleCells(self.theme.searching_walk)
+        ve_searching_walk = ve.ModifyTrackedCells(self.theme.searching_walk)
         self.visual_effects["searching_walk"] = ve_searching_walk
 
-        ve_linking_walk = ve.ModifyMultipleCells(self.theme.linking_walk)
+        ve_linking_walk = ve.ModifyTrackedCells(self.theme.linking_walk)
         self.visual_effects["linking_walk"] = ve_linking_walk
 
         ve_last_linked = ve.Animation(self.theme.last_linked)
@@ -40,30 +41,36 @@ class Wilsons(Algorithm):
         ve_new_linked_walks = ve.Animation(self.theme.new_linked_walk)
         self.visual_effects["new_linked_walk"] = ve_new_linked_walks
 
-        unvisited_cells = list(self.maze.each_cell())
+        unvisited_cells = IndexedSet(self.maze.each_cell())
         unvisited_cells.remove(target)
         links = 0
         while unvisited_cells:
             walk: list[Cell] = []
-            ve_searching_walk.cells = walk
+            walk_positions: dict[Cell, int] = {}  # cell : index in walk
             walking = True
-            working_cell = random.choice(unvisited_cells)
+            working_cell = unvisited_cells.random_choice()
             ve_working_cell.cells.append(working_cell)
+            walk_positions[working_cell] = len(walk)
             walk.append(working_cell)
+            ve_searching_walk.add(working_cell)
             while walking:
                 self.status_text["State"] = "Searching"
-                next_cell = random.choice(list(n for n in self.maze.get_neighbors(working_cell).values() if n))
-                if next_cell in walk:
-                    walk = walk[: walk.index(next_cell) + 1]
-                    ve_searching_walk.cells = walk
+                next_cell = random.choice(self.maze.get_neighbors(working_cell))
+                if next_cell in walk_positions:
+                    # erase the loop
+                    loop_start = walk_positions[next_cell] + 1
+                    for erased_cell in walk[loop_start:]:
+                        del walk_positions[erased_cell]
+                        ve_searching_walk.remove(erased_cell)
+                    del walk[loop_start:]
                     working_cell = walk[-1]
                     ve_working_cell.cells.append(working_cell)
                 elif next_cell not in unvisited_cells:
                     self.status_text["State"] = "Linking"
                     walking = False
-                    ve_searching_walk.cells = []
-                    ve_linking_walk.cells = [cell for cell in walk]
-                    ve_linking_walk.cells.append(next_cell)
+                    ve_searching_walk.clear()
+                    ve_linking_walk.extend(walk)
+                    ve_linking_walk.add(next_cell)
                     if "target" in self.visual_effects:
                         del self.visual_effects["target"]
                     for i, cell in enumerate(walk):
@@ -81,19 +88,21 @@ class Wilsons(Algorithm):
                     else:
                         ve_last_linked.cells.append(next_cell)
                         yield self.maze
-                    ve_linking_walk.cells = []
+                    ve_linking_walk.clear()
                     ve_new_linked_walks.cells.extend(walk)
                     ve_new_linked_walks.cells.append(next_cell)
                     links += 1
                 else:
+                    walk_positions[next_cell] = len(walk)
                     walk.append(next_cell)
+                    ve_searching_walk.add(next_cell)
                     working_cell = next_cell
                     ve_working_cell.cells.append(working_cell)
                     self.status_text["Unvisited"] = len(unvisited_cells)
                     self.status_text["Walked"] = len(walk)
                     self.status_text["Links"] = links
                     self.status_text["Cell"] = f"({working_cell.row},{working_cell.column})"
-                    if links > 3:
+                    if links > 3 and self.skip_frames is not None:
                         self.skip_frames = 5
                     if self.frame_wanted():
                         yield self.maze
@@ -0,0 +1,151 @@
+"""Adaptive frame skipping: measures what algorithm steps and displayed frames cost while the algorithm runs and
+chooses how many steps to run between displayed frames."""
+
+import time
+
+
+class FrameScheduler:
+    """Chooses how many algorithm steps to skip between displayed frames.
+
+    Algorithms ask frame_wanted at the points where a frame may be skipped, passing the total time spent rendering
+    and the number of frames rendered so far. The time between two calls without the rendering time is the cost of
+    a step, the rendering time per frame rendered is the cost of a frame. Each time a frame is shown the number of
+    steps to skip before the next is chosen so that:
+
+    - frames are not produced faster than fps, there is no point compositing frames the terminal never shows. Runs
+      paced by a step delay are exempt, their frames are already spaced by it and the render thread drops the
+      frames the terminal cannot keep up with.
+    - the run finishes close to its target duration. The total time is projected from the elapsed time and the
+      progress the algorithm reports, and the skip is raised while the projection runs over and lowered while it
+      runs under. Without a duration in seconds the target is FRAMES_PER_UNIT frames for each unit of work the
+      algorithm has, one unit per cell for the algorithms in this package. Frames take the measured frame cost, or
+      1 / fps when that is longer, as the render thread draws at fps whatever a frame costs to compose.
+    - without a duration in seconds each shown step takes at least step_delay seconds, the redraw delay, so the
+      animation keeps its speed when a render thread draws the frames. See pace.
+    - a run ahead of its duration in seconds waits after each shown step until it is back on schedule, see pace.
+      Without it a run with little work would finish well before its duration, whatever the skip. The skips are
+      then chosen as if each step took the time the schedule gives it.
+    """
+
+    # weight of the newest measurement in the running averages
+    SMOOTHING = 0.2
+    # the duration target is considered met within this fraction of the duration
+    TOLERANCE = 0.05
+    # at least one frame is shown this often, in seconds
+    MAXIMUM_FRAME_INTERVAL = 0.5
+    # frames per unit of work a run should take when no duration is set
+    FRAMES_PER_UNIT = 2.0
+
+    def __init__(self, work_units: int, fps: float = 60.0, duration: float | None = None) -> None:
+        """
+        Args:
+            work_units (int): amount of work the algorithm does, progress is reported as a fraction of it
+            fps (float): maximum displayed frames per second, 0 for no limit
+            duration (float | None): target run time in seconds, None to derive it from work_units
+        """
+        self.work_units = work_units
+        self.fps = fps
+        self.duration = duration
+        self.step_cost = 0.0
+        self.frame_cost = 0.0
+        self.skip = 0.0
+        self.steps_skipped = 0
+        self.start_time = time.perf_counter()
+        self.last_call: float | None = None
+        self.last_render_time = 0.0
+        self.last_frames_rendered = 0
+        # calls to frame_wanted, one per step that may be skipped
+        self.steps = 0
+        # minimum seconds between shown steps
+        self.step_delay = 0.0
+        self.last_shown: float | None = None
+
+    def _average(self, average: float, value: float) -> float:
+        return value if not average else average + (value - average) * self.SMOOTHING
+
+    def frame_wanted(self, progress: float | None = None, render_time: float = 0.0, frames_rendered: int = 0) -> bool:
+        """Measure the costs since the previous call and decide if the current step should be displayed.
+
+        Args:
+            progress (float | None): fraction of the algorithm's work done, 0 to 1. Used for the duration target.
+            render_time (float): total seconds spent rendering frames, including the delay between frames
+            frames_rendered (int): total number of frames rendered
+
+        Returns:
+            bool: True if a frame should be displayed, else False
+        """
+        now = time.perf_counter()
+        if self.last_call is not None:
+            render_time_since = render_time - self.last_render_time
+            frames_since = frames_rendered - self.last_frames_rendered
+            self.step_cost = self._average(self.step_cost, max(0.0, now - self.last_call - render_time_since))
+            if frames_since:
+                self.frame_cost = self._average(self.frame_cost, render_time_since / frames_since)
+        self.last_call = now
+        self.steps += 1
+        self.last_render_time = render_time
+        self.last_frames_rendered = frames_rendered
+        if self.steps_skipped < int(self.skip):
+            self.steps_skipped += 1
+            return False
+        self.steps_skipped = 0
+        self.skip = self.choose_skip(now, progress)
+        return True
+
+    def pace(self, progress: float) -> None:
+        """Wait after a shown step until step_delay seconds passed since the previous shown step. With a duration
+        in seconds the duration sets the pace instead: a run ahead of it waits until the elapsed time is the
+        duration times the progress, a run behind it does not wait. The wait is at most MAXIMUM_FRAME_INTERVAL and
+        is not counted in the cost of the next step.
+
+        Args:
+            progress (float): fraction of the algorithm's work done, 0 to 1
+        """
+        now = time.perf_counter()
+        wait = 0.0
+        if self.duration is not None:
+            if 0 < progress < 1:
+                wait = self.duration * progress - (now - self.start_time)
+        elif self.last_shown is not None:
+            wait = self.step_delay - (now - self.last_shown)
+        if wait > 0:
+            time.sleep(min(wait, self.MAXIMUM_FRAME_INTERVAL))
+            if self.last_call is not None:
+                self.last_call += time.perf_counter() - now
+        self.last_shown = time.perf_counter()
+
+    def choose_skip(self, now: float, progress: float | None) -> float:
+        """Choose the number of steps to skip before the next frame.
+
+        Args:
+            now (float): time of the current call
+            progress (float | None): fraction of the algorithm's work done, 0 to 1
+
+        Returns:
+            float: steps to skip, the fraction carries between frames so small adjustments take effect
+        """
+        if not self.step_cost:
+            return 0.0
+        step_cost = self.step_cost
+        if self.duration is not None and progress:
+            # a run paced to its duration spends at least the scheduled time on each step
+            step_cost = max(step_cost, self.duration * progress / self.steps)
+        maximum_skip = max(0.0, (self.MAXIMUM_FRAME_INTERVAL - self.frame_cost) / step_cost)
+        minimum_skip = 0.0
+        if self.fps > 0 and (self.duration is not None or not self.step_delay):
+            minimum_skip = min(maximum_skip, max(0.0, (1 / self.fps - self.frame_cost) / step_cost))
+        skip = self.skip
+        if progress is not None and progress < 1:
+            duration = self.duration
+            if duration is None:
+                # the render thread shows at most fps frames a second, composing one costs far less
+                frame_cost = max(self.frame_cost, 1 / self.fps) if self.fps > 0 else self.frame_cost
+                duration = self.FRAMES_PER_UNIT * self.work_units * frame_cost
+            projected = (now - self.start_time) / progress if progress > 0 else float("inf")
+            if projected > duration * (1 + self.TOLERANCE):
+                skip = max(skip + 1, skip * 1.25)
+            elif projected < duration * (1 - self.TOLERANCE):
+                skip = skip * 0.8
+        else:
+            skip = minimum_skip
+        return min(max(skip, minimum_skip), maximum_skip)
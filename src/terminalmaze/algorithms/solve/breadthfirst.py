@@ -1,3 +1,5 @@
+from array import array
+from collections import deque
 from collections.abc import Generator
 
 import terminalmaze.visual.visualeffects as ve
@@ -7,31 +9,48 @@ from terminalmaze.resources.grid import Cell, Grid
 
 
 class BreadthFirst(Algorithm):
-    def __init__(self, maze: Grid, theme: BreadthFirstTheme, *conditions) -> None:
+    def __init__(
+        self,
+        maze: Grid,
+        theme: BreadthFirstTheme,
+        *conditions,
+        start: Cell | None = None,
+        target: Cell | None = None,
+    ) -> None:
         super().__init__(maze, theme)
         self.theme = theme
+        self.start = start or self.maze.unmasked_cells[0]
+        self.target = target or self.maze.unmasked_cells[-1]
         self.status_text["Algorithm"] = "Breadth First"
         self.status_text["Frontier"] = 0
         self.status_text["Visited"] = 0
         self.status_text["Position"] = ""
         self.status_text["State"] = ""
         self.early_exit = False
+        self.cells_visited = 0
+        # cells from start to target, set once the solution is found
+        self.solution: list[Cell] = []
         if "early_exit" in conditions:
             self.status_text["Algorithm"] = "Breadth First (early exit)"
             self.early_exit = True
 
+    def progress(self) -> float:
+        """Fraction of the unmasked cells visited."""
+        return self.cells_visited / len(self.maze.unmasked_cells)
+
     def solve(self) -> Generator[Grid, None, None]:
-        target = list(self.maze.each_cell())[-1]
-        start = list(self.maze.each_cell())[0]
-        frontier = [start]
-        explored: dict[Cell, Cell] = {start: start}
-        transitions: set[Cell] = set()
+        target = self.target
+        start = self.start
+        frontier: deque[Cell] = deque([start])
+        # steps from start to each cell by cell id, -1 for cells not yet reached
+        distance = array("l", [-1]) * self.maze.size()
+        distance[start.id] = 0
 
-        ve_frontier = ve.ModifyMultipleCells(self.theme.frontier)
-        ve_frontier.cells = frontier
+        ve_frontier = ve.ModifyTrackedCells(self.theme.frontier)
+        ve_frontier.add(start)
         self.visual_effects["frontier"] = ve_frontier
 
-        ve_visited = ve.ModifyMultipleCells(self.theme.visited)
+        ve_visited = ve.ModifyTrackedCells(self.theme.visited)
         self.visual_effects["visited"] = ve_visited
 
         ve_visited_animation = ve.Animation(self.theme.visited_animation)
@@ -44,7 +63,7 @@ class BreadthFirst(Algorithm):
         ve_working_cell = ve.ModifySingleCell(self.theme.working_cell)
         self.visual_effects["position"] = ve_working_cell
 
-        ve_solution_path = ve.ModifyMultipleCells(self.theme.solution_path)
+        ve_solution_path = ve.ModifyTrackedCells(self.theme.solution_path)
         self.visual_effects["path"] = ve_solution_path
 
         ve_solution_animation = ve.Animation(self.theme.solution_animation)
@@ -53,24 +72,26 @@ class BreadthFirst(Algorithm):
         while frontier:
             self.status_text["State"] = "Exploring"
             self.status_text["Frontier"] = f"{len(frontier): >3}"
-            self.status_text["Visited"] = f"{len(ve_visited.cells): >4}"
-            position = frontier.pop(0)
+            self.status_text["Visited"] = f"{len(ve_visited): >4}"
+            position = frontier.popleft()
+            ve_frontier.remove(position)
             self.status_text["Position"] = f"{position.row: >3},{position.column: >3}"
-            ve_visited.cells.append(position)
-            if position not in transitions:
-                ve_visited_animation.cells.append(position)
+            ve_visited.add(position)
+            self.cells_visited += 1
+            ve_visited_animation.cells.append(position)
             ve_working_cell.cell = position
             if self.early_exit:
                 if position == target:
                     yield self.maze
                     break
-            edges = [neighbor for neighbor in position.links if neighbor not in explored and neighbor not in frontier]
+            edges = [neighbor for neighbor in position.links if distance[neighbor.id] < 0]
             for cell in edges:
-                explored[cell] = position
+                distance[cell.id] = distance[position.id] + 1
             frontier.extend(edges)
+            ve_frontier.extend(edges)
             self.status_text["Frontier"] = f"{len(frontier): >3}"
-            self.status_text["Visited"] = f"{len(ve_visited.cells): >4}"
-            if self.frame_wanted_relative(frontier, divisor=4):
+            self.status_text["Visited"] = f"{len(ve_visited): >4}"
+            if self.frame_wanted():
                 yield self.maze
 
         while ve_visited_animation.animating:
@@ -80,18 +101,18 @@ class BreadthFirst(Algorithm):
         del self.visual_effects["position"]
         position = target
         route: list[Cell] = [target]
-        if target not in explored:
+        if distance[target.id] < 0:
             return
         while position != start:
             self.status_text["State"] = "Pathing"
-            route.append(explored[position])
-            position = explored[position]
+            # step back to the linked neighbor one closer to start
+            position = next(cell for cell in position.links if distance[cell.id] == distance[position.id] - 1)
+            route.append(position)
         route.reverse()
-        path: list[Cell] = list()
-        ve_solution_path.cells = path
+        self.solution = route
         for step in route:
             self.status_text["State"] = "Solved"
-            path.append(step)
+            ve_solution_path.add(step)
             ve_solution_animation.cells.append(step)
             self.status_text["Solution Length"] = len(route)
             yield self.maze
@@ -1,5 +1,6 @@
+import heapq
 from collections.abc import Generator
-from queue import PriorityQueue
+from itertools import count
 
 import terminalmaze.visual.visualeffects as ve
 from terminalmaze.algorithms.algorithm import Algorithm
@@ -8,9 +9,18 @@ from terminalmaze.resources.grid import Cell, Grid
 
 
 class GreedyBestFirst(Algorithm):
-    def __init__(self, maze: Grid, theme: BreadthFirstTheme, *conditions) -> None:
+    def __init__(
+        self,
+        maze: Grid,
+        theme: BreadthFirstTheme,
+        *conditions,
+        start: Cell | None = None,
+        target: Cell | None = None,
+    ) -> None:
         super().__init__(maze, theme)
         self.theme = theme
+        self.start = start or self.maze.unmasked_cells[0]
+        self.target = target or self.maze.unmasked_cells[-1]
         self.conditions = conditions
         self.status_text["Algorithm"] = "Greedy Best First"
         self.status_text["Frontier"] = 0
@@ -19,21 +29,24 @@ class GreedyBestFirst(Algorithm):
         self.status_text["Target"] = ""
         self.status_text["State"] = ""
         self.skipped_frames = 0
+        # cells from start to target, set once the solution is found
+        self.solution: list[Cell] = []
 
     def solve(self) -> Generator[Grid, None, None]:
-        target = list(self.maze.each_cell())[-1]
-        start = list(self.maze.each_cell())[0]
-        frontier: PriorityQueue = PriorityQueue()
-        frontier.put((0, start))
+        target = self.target
+        start = self.start
+        # heap of (distance to target, push order, cell), the push order breaks distance ties first in first out
+        frontier: list[tuple[int, int, Cell]] = []
+        push_order = count()
+        heapq.heappush(frontier, (0, next(push_order), start))
         explored: dict[Cell, Cell] = {start: start}
-        transitions: set[Cell] = set()
         self.status_text["Target"] = f"({target.column}, {target.row})"
 
-        ve_frontier = ve.ModifyMultipleCells(self.theme.frontier)
-        ve_frontier.cells.append(start)
+        ve_frontier = ve.ModifyTrackedCells(self.theme.frontier)
+        ve_frontier.add(start)
         self.visual_effects["frontier"] = ve_frontier
 
-        ve_visited = ve.ModifyMultipleCells(self.theme.visited)
+        ve_visited = ve.ModifyTrackedCells(self.theme.visited)
         self.visual_effects["visited"] = ve_visited
 
         ve_visited_animation = ve.Animation(self.theme.visited_animation)
@@ -45,36 +58,35 @@ class GreedyBestFirst(Algorithm):
         ve_working_cell = ve.ModifySingleCell(self.theme.working_cell)
         self.visual_effects["position"] = ve_working_cell
 
-        ve_solution_path = ve.ModifyMultipleCells(self.theme.solution_path)
+        ve_solution_path = ve.ModifyTrackedCells(self.theme.solution_path)
         self.visual_effects["path"] = ve_solution_path
 
         ve_solution_animation = ve.Animation(self.theme.solution_animation)
         self.visual_effects["solutiontransition"] = ve_solution_animation
 
-        while not frontier.empty():
+        while frontier:
             self.status_text["State"] = "Exploring"
-            distance, position = frontier.get()
+            _, _, position = heapq.heappop(frontier)
             self.status_text["Position"] = f"({position.column}, {position.row})"
-            ve_frontier.cells.remove(position)
-            ve_visited.cells.append(position)
-            if position not in transitions:
-                ve_visited_animation.cells.append(position)
+            ve_frontier.remove(position)
+            ve_visited.add(position)
+            ve_visited_animation.cells.append(position)
             ve_working_cell.cell = position
             edges = [neighbor for neighbor in position.links if neighbor not in explored]
             for cell in edges:
                 explored[cell] = position
                 if cell == target:
-                    frontier = PriorityQueue()
+                    frontier.clear()
                     self.status_text["Position"] = f"({cell.column}, {cell.row})"
-                    ve_visited.cells.append(cell)
+                    ve_visited.add(cell)
                     ve_visited_animation.cells.append(cell)
                     yield self.maze
                     break
-                frontier.put((GreedyBestFirst.distance(cell, target), cell))
-                ve_frontier.cells.append(cell)
+                heapq.heappush(frontier, (GreedyBestFirst.distance(cell, target), next(push_order), cell))
+                ve_frontier.add(cell)
 
-            self.status_text["Frontier"] = frontier.qsize()
-            self.status_text["Visited"] = len(ve_visited.cells)
+            self.status_text["Frontier"] = len(frontier)
+            self.status_text["Visited"] = len(ve_visited)
             yield self.maze
 
         while ve_visited_animation.animating:
@@ -91,11 +103,10 @@ class GreedyBestFirst(Algorithm):
             route.append(explored[position])
             position = explored[position]
         route.reverse()
-        path: list[Cell] = list()
-        ve_solution_path.cells = path
+        self.solution = route
         for step in route:
             self.status_text["State"] = "Solved"
-            path.append(step)
+            ve_solution_path.add(step)
             ve_solution_animation.cells.append(step)
             self.status_text["Solution Length"] = len(route)
             yield self.maze
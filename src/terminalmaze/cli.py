@@ -0,0 +1,21 @@
+"""Command line entry point. "terminalmaze replay ..." plays back a recording, anything else generates a maze.
+
+The subcommands are imported on use, so replay does not load the maze algorithms or the theme configuration.
+"""
+
+import sys
+
+
+def main() -> None:
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        from terminalmaze.replay import main as replay_main
+
+        replay_main(sys.argv[2:])
+        return
+    from terminalmaze.main import main as maze_main
+
+    maze_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@ import pathlib
 from typing import Any, Type, Union
 
 import tomli
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+from terminalmaze.visual import colorterm
 
 tm_masks: dict[str, pathlib.Path] = dict()
 masks_path = pathlib.Path(__file__).parent / "masks"
@@ -18,10 +20,24 @@ for theme in themes_path.iterdir():
             tm_themes[theme.stem] = tomli.load(theme_file)
 
 
+def resolve_color(color: int | str) -> int | str:
+    """Validate a theme color and resolve its escape sequences while the theme loads.
+
+    Args:
+        color (int | str): xterm color code or hex color string
+
+    Returns:
+        int | str: the color, hex strings normalized by colorterm.resolve
+    """
+    return colorterm.resolve(color).code
+
+
 class WallPathModel(BaseModel):
     character: str
     color: int | str
 
+    _resolve_color = field_validator("color")(resolve_color)
+
 
 class RandomGroupModel(BaseModel):
     layer: int
@@ -35,6 +51,8 @@ class ModifyCellModel(BaseModel):
     color: int | str
     character: str
 
+    _resolve_color = field_validator("color")(resolve_color)
+
 
 class AnimationModel(BaseModel):
     layer: int
@@ -42,6 +60,18 @@ class AnimationModel(BaseModel):
     animation_details: list[list[list[str | int] | str | int] | None]
     verbosity: list[int]
 
+    @field_validator("animation_details")
+    @classmethod
+    def _resolve_colors(
+        cls, animation_details: list[list[list[str | int] | str | int] | None]
+    ) -> list[list[list[str | int] | str | int] | None]:
+        """Resolve the color, or the list of colors to choose from, of every animation state."""
+        for state in animation_details:
+            if state:
+                color = state[0]
+                state[0] = [resolve_color(c) for c in color] if isinstance(color, list) else resolve_color(color)
+        return animation_details
+
 
 class AldousBroderTheme(BaseModel):
     wall: WallPathModel
@@ -50,7 +80,7 @@ class AldousBroderTheme(BaseModel):
     last_linked: AnimationModel
     invalid_neighbors: AnimationModel
     invalid_visited: AnimationModel
-    maximum_searching_frame_delay: float
+    maximum_searching_frame_delay: float | None = None
 
 
 class BinaryTreeTheme(BaseModel):
@@ -74,7 +104,7 @@ class HuntAndKillTheme(BaseModel):
     invalid_neighbors: AnimationModel
     last_linked: AnimationModel
     hunt_cells: AnimationModel
-    hunting_frames_skip: int
+    hunting_frames_skip: int | None = None
 
 
 class KruskalsRandomizedTheme(BaseModel):
@@ -90,7 +120,7 @@ class PrimsSimpleTheme(BaseModel):
     edges: AnimationModel
     invalid_neighbors: AnimationModel
     last_linked: AnimationModel
-    edge_frame_ratio: int
+    edge_frame_ratio: int | None = None
 
 
 class PrimsWeightedTheme(BaseModel):
@@ -112,7 +142,7 @@ class RecursiveBacktrackerTheme(BaseModel):
     last_linked: AnimationModel
     stack_added_cells: AnimationModel
     stack_removed_cells: AnimationModel
-    backtrack_skip_frames: int
+    backtrack_skip_frames: int | None = None
 
 
 class RecursiveDivisionTheme(BaseModel):
@@ -144,7 +174,7 @@ class WilsonsTheme(BaseModel):
     linking_walk: ModifyCellModel
     new_linked_walk: AnimationModel
     last_linked: AnimationModel
-    searching_frames_skipped: int
+    searching_frames_skipped: int | None = None
 
 
 class BreadthFirstTheme(BaseModel):
@@ -2,13 +2,17 @@ import argparse
 import random
 import shutil
 import sys
+from collections.abc import Iterator
 
 import terminalmaze.algorithms.gen as maze_algos
 import terminalmaze.algorithms.solve as solve_algos
 import terminalmaze.config as config
+import terminalmaze.visual.visualeffects as ve
 from terminalmaze.algorithms.algorithm import Algorithm
-from terminalmaze.resources.grid import Grid
-from terminalmaze.visual import ansitools
+from terminalmaze.resources.grid import Cell, Grid
+from terminalmaze.visual import ansitools, export
+from terminalmaze.visual.minimap import MINIMAPS
+from terminalmaze.visual.visualmaze import Visual
 
 MAZE_ALGORITHMS: dict[str, type[Algorithm]] = {
     "binary_tree": maze_algos.binarytree.BinaryTree,
@@ -31,6 +35,25 @@ SOLVE_ALGORITHMS: dict[str, type[Algorithm]] = {
 }
 
 
+def cell_coordinates(value: str) -> tuple[int, int]:
+    """
+    Parse a ROW,COLUMN command line value.
+
+    Parameters
+    ----------
+    value : str : comma separated row and column
+
+    Returns
+    -------
+    tuple[int, int] : (row, column)
+    """
+    try:
+        row, column = (int(part) for part in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROW,COLUMN, got {value!r}")
+    return row, column
+
+
 def parse_args() -> argparse.Namespace:
     """
     Parse the arguments passed to at the command line.
@@ -81,6 +104,20 @@ Supported Solve Algorithms
         default=None,
         choices=list(SOLVE_ALGORITHMS.keys()),
     )
+    parser.add_argument(
+        "--start",
+        metavar="ROW,COLUMN",
+        type=cell_coordinates,
+        help="Cell where the solve algorithm starts. Default = first unmasked cell",
+        default=None,
+    )
+    parser.add_argument(
+        "--target",
+        metavar="ROW,COLUMN",
+        type=cell_coordinates,
+        help="Cell the solve algorithm searches for. Default = last unmasked cell",
+        default=None,
+    )
     parser.add_argument(
         "-t",
         "--theme",
@@ -136,15 +173,98 @@ Supported Solve Algorithms
         "--redraw_delay",
         metavar="REDRAW",
         type=float,
-        help="The minimum time, in seconds, between screen redraws. This controls the speed of the animation. Default = 0.015",
+        help="The minimum time, in seconds, between shown algorithm steps. This controls the speed of the animation,"
+        " a render thread drops the frames the terminal cannot keep up with, not the steps. Not used with --duration,"
+        " which sets the pace instead. Default = 0.015",
         default=0.015,
     )
+    parser.add_argument(
+        "--fps",
+        metavar="FPS",
+        type=float,
+        help="Frames drawn per second by a render thread, independent of the algorithm speed. Steps between frames"
+        " are not drawn. With a redraw delay of 0, steps are batched where the algorithm allows it so frames are not"
+        " produced faster than this. Use 0 to draw every step from the algorithm loop. Default = 60",
+        default=60.0,
+    )
+    parser.add_argument(
+        "--duration",
+        metavar="SECONDS",
+        type=float,
+        help="Target time, in seconds, for the maze generation and for the solve. More algorithm steps are run between"
+        " frames where the algorithm allows it when running behind, and each shown step waits when running ahead."
+        " Default = no target",
+        default=None,
+    )
+    parser.add_argument(
+        "--minimap",
+        metavar="MINIMAP",
+        type=str,
+        help="""Draw more of the maze per terminal character, at a lower resolution.
+halfblock: two rows of the maze drawing per line
+braille: two columns by four rows of the maze drawing per character, one color per character""",
+        default=None,
+        choices=list(MINIMAPS.keys()),
+    )
+    parser.add_argument(
+        "--viewport",
+        action="store_true",
+        dest="viewport",
+        help="Draw only the part of the maze that fits the terminal. The view follows the cell the algorithm is working"
+        " on, the arrow keys or h, j, k and l pan it and f resumes following. Used automatically when the maze does not"
+        " fit the terminal.",
+    )
+    parser.add_argument(
+        "--view",
+        metavar="ROW,COLUMN",
+        type=cell_coordinates,
+        help="Cell at the top left of the viewport. The view stays there instead of following the algorithm until it"
+        " is panned. Implies --viewport",
+        default=None,
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        type=str,
+        help="Record the frames drawn to FILE. Play it back with: terminalmaze replay FILE",
+        default=None,
+    )
+    parser.add_argument(
+        "--save",
+        metavar="FILE",
+        type=str,
+        help="Save the finished maze, with its seed, algorithm and mask, to FILE as a compressed maze file",
+        default=None,
+    )
+    parser.add_argument(
+        "--export",
+        metavar="FILE",
+        type=str,
+        help="Write the finished maze, with the solution path when solved, to an image. The format is chosen by the"
+        " file extension: .png, .ppm or .svg. With --headless the maze is exported instead of drawn",
+        default=None,
+    )
+    parser.add_argument(
+        "--export_scale",
+        metavar="PIXELS",
+        type=int,
+        help="Image pixels per cell, passage and wall corner of an exported maze. Default = largest that keeps the"
+        f" image within {export.DEFAULT_IMAGE_SIZE} pixels",
+        default=None,
+    )
     parser.add_argument(
         "--nostatus",
         action="store_true",
         dest="nostatus",
         help="Use to prevent showing status text",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        dest="headless",
+        help="Generate and solve without animation or visual effects. The finished maze is drawn once at the end, or"
+        " only exported with --export.",
+    )
     args = parser.parse_args()
     return args
 
@@ -184,6 +304,105 @@ def _get_terminal_dimensions() -> tuple[int, int]:
     return terminal_width, terminal_height
 
 
+def run_headless(steps: Iterator[Grid], visual_effects: dict[str, ve.VisualEffect]) -> None:
+    """
+    Step an algorithm to completion without rendering frames. Animation cells are normally consumed by
+    Visual.show, they are dropped here so they do not accumulate.
+
+    Parameters
+    ----------
+    steps : generator returned by generate_maze() or solve()
+    visual_effects : the visual effects of the algorithm being stepped
+    """
+    for _ in steps:
+        for effect in visual_effects.values():
+            if isinstance(effect, ve.Animation):
+                effect.cells.clear()
+
+
+def configure_visual(visual: Visual, args: argparse.Namespace) -> None:
+    """
+    Apply the display options from the command line. The maze is drawn through a viewport when asked to, or when it
+    does not fit the terminal.
+
+    Parameters
+    ----------
+    visual : visual of the maze, before its first frame is shown
+    args : arguments parsed by parse_args
+    """
+    visual.target_fps = args.fps
+    if args.minimap is not None:
+        visual.use_minimap(args.minimap)
+    if args.record is not None:
+        visual.start_recording(args.record)
+    if args.view is not None:
+        visual.use_viewport(args.view)
+    elif args.viewport or (sys.stdout.isatty() and not visual.fits_terminal()):
+        visual.use_viewport()
+
+
+def configure_scheduler(algorithm: Algorithm, args: argparse.Namespace, verbosity: int) -> None:
+    """
+    Apply the frame rate, duration and redraw delay from the command line to the frame scheduler of an algorithm.
+
+    Parameters
+    ----------
+    algorithm : algorithm about to be stepped
+    args : arguments parsed by parse_args
+    verbosity : verbosity the algorithm is shown at, steps are not held when only the status is printed
+    """
+    algorithm.scheduler.fps = args.fps
+    algorithm.scheduler.duration = args.duration
+    algorithm.scheduler.step_delay = args.redraw_delay if verbosity else 0.0
+
+
+def save_maze(maze: Grid, path: str) -> None:
+    """
+    Save the finished maze to the maze file given with --save.
+
+    Parameters
+    ----------
+    maze : finished maze
+    path : maze file to write
+    """
+    try:
+        maze.to_file(path)
+    except OSError as error:
+        print(f"Unable to save maze: {error}")
+        return
+    print(f"Saved maze to {path}")
+
+
+def export_image(maze: Grid, args: argparse.Namespace, solution: list[Cell]) -> None:
+    """
+    Write the finished maze to the image file given with --export, in the wall and path colors of the maze
+    algorithm's theme and the solution path color of the solve algorithm's theme.
+
+    Parameters
+    ----------
+    maze : finished maze
+    args : arguments parsed by parse_args
+    solution : cells of the solution path from start to target, empty if the maze was not solved
+    """
+    theme = config.themes[args.theme]
+    maze_theme = theme[args.maze_algorithm]
+    solution_color = theme[args.solve_algorithm].solution_path.color if args.solve_algorithm else None
+    try:
+        export.export_maze(
+            maze,
+            args.export,
+            maze_theme.wall.color,
+            maze_theme.path.color,
+            solution,
+            solution_color,
+            args.export_scale,
+        )
+    except OSError as error:
+        print(f"Unable to export maze: {error}")
+        return
+    print(f"Exported maze to {args.export}")
+
+
 def main():
     args = parse_args()
     maze_algorithm = MAZE_ALGORITHMS[args.maze_algorithm]
@@ -205,6 +424,16 @@ def main():
         print(f"Unable to locate theme: {args.theme}. Verify file exists in themes dir and was spelled correctly.")
         return
 
+    if args.export is not None:
+        try:
+            export.export_format(args.export)
+        except ValueError as error:
+            print(error)
+            return
+    if args.export_scale is not None and args.export_scale < 1:
+        print(f"Invalid export scale {args.export_scale}: must be at least 1 pixel.")
+        return
+
     mask = get_mask(args)
     if args.mask and not mask:
         print(f"Unable to locate mask: {args.mask}. Verify file exists in masks dir and was spelled correctly.")
@@ -212,30 +441,81 @@ def main():
 
     if args.height == 0 and args.width == 0:
         columns, lines = _get_terminal_dimensions()
+        if args.minimap is not None:
+            minimap = MINIMAPS[args.minimap]
+            columns, lines = columns * minimap.cell_width, (lines - 2) * minimap.cell_height + 2
         width = (columns // 2) - 1  # subtract 1 for the maze border wall
         height = (lines // 2) - 1  # subtract 2 for the status line
 
     else:
         height = args.height
         width = args.width
-    maze = Grid(width, height, theme[args.maze_algorithm], mask_string=get_mask(args))
+    maze = Grid(width, height, theme[args.maze_algorithm], mask_string=get_mask(args), headless=args.headless)
     if not args.seed:
         seed = int().from_bytes(random.randbytes(5), byteorder="big")
     else:
         seed = args.seed
     maze.seed = seed
+    maze.algorithm = args.maze_algorithm
+    if maze.visual:
+        configure_visual(maze.visual, args)
+    solve_endpoints = {}
+    for endpoint in ("start", "target"):
+        coordinates = getattr(args, endpoint)
+        if coordinates is None:
+            continue
+        cell = maze.get_cell(coordinates)
+        if not cell or maze.is_masked(cell):
+            print(f"Invalid {endpoint} cell {coordinates}: must be an unmasked cell within the {width}x{height} grid.")
+            sys.stdout.write(ansitools.SHOW_CURSOR())
+            return
+        solve_endpoints[endpoint] = cell
     mazeverb = args.maze_verbosity
     solveverb = args.solve_verbosity
+    # a duration sets the pace of the shown steps instead of the redraw delay
+    redraw_delay = args.redraw_delay if args.duration is None else 0.0
+    conditions = None
+    if args.solve_algorithm == "breadth_first_early_exit":
+        conditions = "early_exit"
     try:
         maze_generator = maze_algorithm(maze, theme[args.maze_algorithm])
+        configure_scheduler(maze_generator, args, mazeverb)
+        if args.headless:
+            run_headless(maze_generator.generate_maze(), maze_generator.visual_effects)
+            final_algorithm, final_verbosity = maze_generator, mazeverb
+            if solve_algorithm:
+                solve_generator = solve_algorithm(maze, theme[args.solve_algorithm], conditions, **solve_endpoints)
+                configure_scheduler(solve_generator, args, solveverb)
+                run_headless(solve_generator.solve(), solve_generator.visual_effects)
+                final_algorithm, final_verbosity = solve_generator, solveverb
+            if args.save is not None:
+                save_maze(maze, args.save)
+            if args.export is not None:
+                export_image(maze, args, solve_generator.solution if solve_algorithm else [])
+                return
+            visual = maze.attach_visual()
+            configure_visual(visual, args)
+            visual.start_time = maze_generator.start_time
+            visual.show(
+                final_algorithm.visual_effects,
+                final_algorithm.status_text,
+                verbosity=final_verbosity,
+                complete=True,
+                nostatus=args.nostatus,
+                redrawdelay=0,
+            )
+            print()
+            sys.stdout.write(ansitools.SHOW_CURSOR())
+            return
         for maze in maze_generator.generate_maze():
             maze.visual.show(
                 maze_generator.visual_effects,
                 maze_generator.status_text,
                 verbosity=mazeverb,
                 nostatus=args.nostatus,
-                redrawdelay=args.redraw_delay,
+                redrawdelay=redraw_delay,
             )
+            maze_generator.pace_step()
         else:
             maze.visual.show(
                 maze_generator.visual_effects,
@@ -243,22 +523,21 @@ def main():
                 verbosity=mazeverb,
                 complete=True,
                 nostatus=args.nostatus,
-                redrawdelay=args.redraw_delay,
+                redrawdelay=redraw_delay,
             )
             print()
         if solve_algorithm:
-            conditions = None
-            if args.solve_algorithm == "breadth_first_early_exit":
-                conditions = "early_exit"
-            solve_generator = solve_algorithm(maze, theme[args.solve_algorithm], conditions)
+            solve_generator = solve_algorithm(maze, theme[args.solve_algorithm], conditions, **solve_endpoints)
+            configure_scheduler(solve_generator, args, solveverb)
             for maze in solve_generator.solve():
                 maze.visual.show(
                     solve_generator.visual_effects,
                     solve_generator.status_text,
                     nostatus=args.nostatus,
                     verbosity=solveverb,
-                    redrawdelay=args.redraw_delay,
+                    redrawdelay=redraw_delay,
                 )
+                solve_generator.pace_step()
             else:
                 maze.visual.show(
                     solve_generator.visual_effects,
@@ -266,14 +545,23 @@ def main():
                     verbosity=solveverb,
                     nostatus=args.nostatus,
                     complete=True,
-                    redrawdelay=args.redraw_delay,
+                    redrawdelay=redraw_delay,
                 )
                 print()
+        if args.save is not None:
+            save_maze(maze, args.save)
+        if args.export is not None:
+            export_image(maze, args, solve_generator.solution if solve_algorithm else [])
         sys.stdout.write(ansitools.SHOW_CURSOR())
     except KeyboardInterrupt:
+        if maze.visual:
+            maze.visual.stop_render_thread()
         print("Maze generation stopped.")
         sys.stdout.write(ansitools.SHOW_CURSOR())
         sys.exit()
+    finally:
+        if maze.visual:
+            maze.visual.stop_recording()
 
 
 if __name__ == "__main__":
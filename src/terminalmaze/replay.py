@@ -0,0 +1,185 @@
+"""Play back recordings made with --record, or export them as asciicast v2 files.
+
+Only the recording reader and the renderer are imported, not the maze algorithms or the theme configuration, so
+replay starts immediately.
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Iterable
+from itertools import chain
+
+from terminalmaze.visual import ansitools
+from terminalmaze.visual.recording import RecordedFrame, Recording
+from terminalmaze.visual.renderer import DiffRenderer
+
+# seconds a frame may be late before it is dropped
+FRAME_LAG = 1 / 60
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    """
+    Parse the arguments passed to terminalmaze replay.
+
+    Parameters
+    ----------
+    argv : arguments after "replay"
+
+    Returns
+    -------
+    args (argparse.Namespace) : arguments parsed
+    """
+    parser = argparse.ArgumentParser(
+        prog="terminalmaze replay",
+        description="Play back a maze recorded with --record",
+    )
+    parser.add_argument("file", metavar="FILE", type=str, help="Recording to play")
+    parser.add_argument(
+        "--speed",
+        metavar="SPEED",
+        type=float,
+        help="Playback speed, 2 plays twice as fast. Frames are dropped when the terminal cannot keep up. Use 0 to"
+        " draw every frame as fast as possible. Default = 1",
+        default=1.0,
+    )
+    parser.add_argument(
+        "--start",
+        metavar="FRAME",
+        type=int,
+        help="Number of the first frame to play, from 0. Default = 0",
+        default=0,
+    )
+    parser.add_argument(
+        "--cast",
+        metavar="CAST_FILE",
+        type=str,
+        help="Write an asciicast v2 file, timed by --speed, instead of playing the recording",
+        default=None,
+    )
+    return parser.parse_args(argv)
+
+
+def prepare_output(frame_height: int) -> str:
+    """Return the output that makes room for a frame and saves the cursor position frames are drawn relative to."""
+    return ansitools.HIDE_CURSOR() + "\n" * (frame_height + 3) + ansitools.DEC_SAVE_CURSOR_POSITION()
+
+
+def changed_cells(runs: list[tuple[int, int]]) -> Iterable[int]:
+    """Return the frame indexes in runs of changed cells."""
+    return chain.from_iterable(range(start, end) for start, end in runs)
+
+
+def play(recording: Recording, start: int, speed: float) -> None:
+    """
+    Draw a recording in the terminal at the given speed. Frames that fall behind the playback time are dropped,
+    the last frame is always drawn.
+
+    Parameters
+    ----------
+    recording : recording to play
+    start : number of the first frame
+    speed : playback speed, 0 to draw every frame as fast as possible
+    """
+    renderer = DiffRenderer(recording.palette)
+    first_time: float | None = None
+    clock = 0.0
+    candidates: set[int] | None = set()
+    status: str | None = None
+    dropped: RecordedFrame | None = None
+    for recorded in recording.frames(start):
+        if first_time is None:
+            first_time = recorded.time
+            clock = time.perf_counter()
+            sys.stdout.write(prepare_output(recorded.frame.height))
+        if recorded.changed is None:
+            candidates = None
+        elif candidates is not None:
+            candidates.update(changed_cells(recorded.changed))
+        if recorded.status is not None:
+            status = recorded.status
+        if speed > 0:
+            delay = clock + (recorded.time - first_time) / speed - time.perf_counter()
+            if delay < -FRAME_LAG:
+                dropped = recorded
+                continue
+            if delay > 0:
+                time.sleep(delay)
+        dropped = None
+        sys.stdout.write(renderer.render(recorded.frame, status, candidates=candidates))
+        sys.stdout.flush()
+        candidates = set()
+    if dropped is not None:
+        sys.stdout.write(renderer.render(dropped.frame, status, candidates=candidates))
+    sys.stdout.write("\n" + ansitools.SHOW_CURSOR())
+    sys.stdout.flush()
+
+
+def export_cast(recording: Recording, start: int, speed: float, path: str) -> int:
+    """
+    Write a recording as an asciicast v2 file. The terminal is sized to the frame and the first status line. Line
+    feeds are written as CR LF, as a terminal driver would have output them.
+
+    Parameters
+    ----------
+    recording : recording to export
+    start : number of the first frame
+    speed : playback speed, 0 writes every frame at time 0
+    path : asciicast file to write
+
+    Returns
+    -------
+    int : number of frames written
+    """
+    first = next(recording.frames(start))
+    width = max(first.frame.width, len(first.status or ""))
+    header = {"version": 2, "width": width, "height": first.frame.height + 3}
+    frames = 0
+    last_time = 0.0
+    with open(path, "w") as cast:
+        cast.write(json.dumps(header) + "\n")
+        renderer = DiffRenderer(recording.palette)
+        status: str | None = None
+        for recorded in recording.frames(start):
+            if frames == 0:
+                cast.write(json.dumps([0.0, "o", prepare_output(recorded.frame.height).replace("\n", "\r\n")]) + "\n")
+            if recorded.status is not None:
+                status = recorded.status
+            last_time = (recorded.time - first.time) / speed if speed > 0 else 0.0
+            candidates = None if recorded.changed is None else changed_cells(recorded.changed)
+            output = renderer.render(recorded.frame, status, candidates=candidates).replace("\n", "\r\n")
+            cast.write(json.dumps([round(last_time, 6), "o", output]) + "\n")
+            frames += 1
+        cast.write(json.dumps([round(last_time, 6), "o", "\r\n" + ansitools.SHOW_CURSOR()]) + "\n")
+    return frames
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        recording = Recording(args.file)
+    except (OSError, ValueError) as error:
+        print(f"Unable to read recording: {error}")
+        return
+    try:
+        if not recording.frame_count:
+            print(f"Recording {args.file} has no frames.")
+            return
+        if not 0 <= args.start < recording.frame_count:
+            print(f"Invalid start frame {args.start}: the recording has frames 0 to {recording.frame_count - 1}.")
+            return
+        if args.cast is not None:
+            frames = export_cast(recording, args.start, args.speed, args.cast)
+            print(f"Wrote {frames} frames to {args.cast}")
+            return
+        play(recording, args.start, args.speed)
+    except KeyboardInterrupt:
+        print("Replay stopped.")
+        sys.stdout.write(ansitools.SHOW_CURSOR())
+    finally:
+        recording.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,51 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from terminalmaze.resources.grid import Grid
+
+# Bit flags stored per cell in Grid.state. The four direction bits record a passage (link) to the
+# neighbor in that direction, MASKED marks a cell removed from the maze by a mask.
+NORTH = 1
+SOUTH = 2
+WEST = 4
+EAST = 8
+MASKED = 16
+LINKED = NORTH | SOUTH | WEST | EAST
+
+DIRECTION_BITS: dict[str, int] = {"north": NORTH, "south": SOUTH, "west": WEST, "east": EAST}
+DIRECTION_OFFSETS: dict[str, tuple[int, int]] = {"north": (-1, 0), "south": (1, 0), "west": (0, -1), "east": (0, 1)}
+OFFSET_BITS: dict[tuple[int, int], int] = {(-1, 0): NORTH, (1, 0): SOUTH, (0, -1): WEST, (0, 1): EAST}
 
 
 class Cell:
-    def __init__(self, row: int, col: int) -> None:
+    __slots__ = ("row", "column", "grid", "id")
+
+    def __init__(self, row: int, col: int, grid: Optional["Grid"] = None, cell_id: int = 0) -> None:
         """
-        Create a new node and set its row and column attributes.
+        Create a view of the cell at row, column. Links are stored in the owning grid's state buffer,
+        the cell only records its position.
 
         :param row: the row number of the cell
         :param col: the column number of the cell
+        :param grid: grid the cell belongs to, a cell without a grid has no neighbors and cannot be linked
+        :param cell_id: id assigned by the grid, unique within the grid and the cell's index in the grid state
         """
         self.row: int = row
         self.column: int = col
-        self.links: set["Cell"] = set()
-        self.neighbors: dict[str, Optional["Cell"]] = {}
+        self.grid: Optional["Grid"] = grid
+        self.id: int = cell_id
+
+    def _direction_bit(self, cell: "Cell") -> int:
+        """
+        Return the direction bit pointing from this cell to the given adjacent cell.
+
+        :param cell: adjacent cell
+        :return: direction bit
+        """
+        bit = OFFSET_BITS.get((cell.row - self.row, cell.column - self.column))
+        if bit is None or self.grid is None:
+            raise ValueError(f"{cell!r} is not adjacent to {self!r}")
+        return bit
 
     def link(self, cell: "Cell", bidi: bool = True) -> None:
         """
@@ -21,7 +54,7 @@ class Cell:
         :param cell: the cell to link to
         :param bidi: If True, the link is bidirectional, defaults to True (optional)
         """
-        self.links.add(cell)
+        self.grid.state[self.id] |= self._direction_bit(cell)  # type: ignore[union-attr]
         if bidi:
             cell.link(self, False)
 
@@ -32,10 +65,69 @@ class Cell:
         :param cell: the cell to unlink from
         :param bidi: If True, the cell will unlink itself from the other cell, defaults to True (optional)
         """
-        self.links.remove(cell)
+        bit = self._direction_bit(cell)
+        if not self.grid.state[self.id] & bit:  # type: ignore[union-attr]
+            raise KeyError(cell)
+        self.grid.state[self.id] &= ~bit  # type: ignore[union-attr]
         if bidi:
             cell.unlink(self, False)
 
+    @property
+    def links(self) -> set["Cell"]:
+        """
+        Cells linked to this cell, built from the direction bits in the grid state.
+        :return: Set of cells linked to this cell
+        """
+        links: set["Cell"] = set()
+        if self.grid is None:
+            return links
+        state = self.grid.state[self.id]
+        if not state & LINKED:
+            return links
+        cells = self.grid.cells
+        if state & NORTH:
+            links.add(cells[self.id - self.grid.width])
+        if state & SOUTH:
+            links.add(cells[self.id + self.grid.width])
+        if state & WEST:
+            links.add(cells[self.id - 1])
+        if state & EAST:
+            links.add(cells[self.id + 1])
+        return links
+
+    def neighbor(self, direction: str) -> Optional["Cell"]:
+        """
+        Return the adjacent cell in a direction, found from the cell's position without allocating.
+
+        :param direction: "north", "south", "west" or "east"
+        :return: the adjacent cell, None where the cell is on the edge of the grid
+        """
+        grid = self.grid
+        if grid is None:
+            return None
+        row_offset, column_offset = DIRECTION_OFFSETS[direction]
+        row, column = self.row + row_offset, self.column + column_offset
+        if 0 <= row < grid.height and 0 <= column < grid.width:
+            return grid.cells[row * grid.width + column]
+        return None
+
+    @property
+    def neighbors(self) -> dict[str, Optional["Cell"]]:
+        """
+        Adjacent cells keyed by direction, None where the cell is on the edge of the grid. Builds a new dict on
+        every access, use neighbor for single directions.
+        :return: dict of direction: Cell
+        """
+        if self.grid is None:
+            return {direction: None for direction in DIRECTION_BITS}
+        get_cell = self.grid.get_cell
+        return {
+            "north": get_cell((self.row - 1, self.column)),
+            "south": get_cell((self.row + 1, self.column)),
+            "west": get_cell((self.row, self.column - 1)),
+            "east": get_cell((self.row, self.column + 1)),
+        }
+
     def get_links(self) -> set["Cell"]:
         """
         The function returns a set of cells linked to this cell.
@@ -50,13 +142,14 @@ class Cell:
         :param cell: the cell that is being checked
         :return: True if cell is linked else False
         """
-        return cell in self.links
+        bit = OFFSET_BITS.get((cell.row - self.row, cell.column - self.column))
+        return bool(bit and self.grid and self.grid.state[self.id] & bit)
 
     def __hash__(self):
-        return hash((self.row, self.column))
+        return self.id
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and (other.row, other.column) == (self.row, self.column)
+        return self is other or (isinstance(other, Cell) and other.id == self.id)
 
     def __lt__(self, other):
         return False
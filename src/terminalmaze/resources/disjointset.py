@@ -0,0 +1,44 @@
+class DisjointSet:
+    """Disjoint set forest over the integers 0 <= n < size, using union by rank and path compression."""
+
+    def __init__(self, size: int) -> None:
+        """
+        Create a forest of size single member sets.
+
+        :param size: number of members, members are identified by the integers 0 <= n < size
+        """
+        self.parent: list[int] = list(range(size))
+        self.rank: bytearray = bytearray(size)
+
+    def find(self, member: int) -> int:
+        """
+        Return the root of the set containing member, halving the path to the root on the way.
+
+        :param member: member to look up
+        :return: root member of the set
+        """
+        parent = self.parent
+        while parent[member] != member:
+            parent[member] = parent[parent[member]]
+            member = parent[member]
+        return member
+
+    def union(self, member_a: int, member_b: int) -> int:
+        """
+        Merge the sets containing member_a and member_b. The root with the higher rank becomes the root of
+        the merged set.
+
+        :param member_a: member of the first set
+        :param member_b: member of the second set
+        :return: root of the merged set
+        """
+        root_a = self.find(member_a)
+        root_b = self.find(member_b)
+        if root_a == root_b:
+            return root_a
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        return root_a
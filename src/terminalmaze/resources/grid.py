@@ -1,11 +1,16 @@
 import random
+from array import array
 from collections.abc import Generator
 from typing import Optional
 
 from terminalmaze.config import MAZE_THEME
-from terminalmaze.resources.cell import Cell
+from terminalmaze.resources.cell import EAST, MASKED, SOUTH, Cell
+from terminalmaze.resources.mazefile import MazeReader, MazeWriter
 from terminalmaze.visual.visualmaze import Visual
 
+# links counted for a cell by cell state, each link sets the east or south bit of exactly one of its cells
+LINK_COUNTS = bytes(bool(state & EAST) + bool(state & SOUTH) for state in range(256))
+
 
 class Grid:
     def __init__(
@@ -14,6 +19,7 @@ class Grid:
         height: int,
         theme: MAZE_THEME,
         mask_string: str | None = None,
+        headless: bool = False,
     ) -> None:
         """
         Create a new grid with the given width and height.
@@ -21,18 +27,92 @@ class Grid:
         :param width: the number of columns in the grid
         :param height: the number of rows in the grid
         :param mask_string: mask to apply
+        :param headless: if True, do not create a Visual. Links are tracked without any visual bookkeeping or
+            terminal output until attach_visual is called.
         """
         self.width: int = width
         self.height: int = height
-        self.cells: dict[tuple[int, int], Cell] = {}
-        self.masked_cells: dict[tuple[int, int], Cell] = {}
-        self.unmasked_cells: dict[tuple[int, int], Cell] = {}
+        # one byte per cell, indexed by row * width + column: direction link bits and the MASKED bit
+        self.state: array = array("B")
+        self.cells: list[Cell] = []
+        self.unmasked_cells: list[Cell] = []
+        self.neighbor_table: list[tuple[Cell, ...]] = []
+        self.unmasked_neighbor_table: list[tuple[Cell, ...]] = []
         self.prepare_grid()
         self.mask_lines: Optional[list[str]] = self.format_mask(mask_string)
         self.mask_cells()
         self.configure_cells()
-        self.visual = Visual(self, theme)
+        self.theme = theme
+        self.visual: Optional[Visual] = None if headless else Visual(self, theme)
         self.seed: Optional[int] = None
+        # name of the algorithm that generated the maze, stored in maze files
+        self.algorithm: Optional[str] = None
+        # links made minus links removed with link_cells and unlink_cells
+        self.link_count = 0
+
+    @property
+    def headless(self) -> bool:
+        """True if the grid has no Visual attached."""
+        return self.visual is None
+
+    def attach_visual(self) -> Visual:
+        """Create a Visual for a headless grid and draw the links made so far.
+
+        Returns:
+            Visual: the attached Visual
+        """
+        if self.visual is None:
+            self.visual = Visual(self, self.theme)
+            self.visual.draw_links()
+        return self.visual
+
+    @classmethod
+    def from_file(cls, path: str, theme: MAZE_THEME, headless: bool = False) -> "Grid":
+        """Load a maze saved with to_file. The grid is created headless and its rows are read into the state
+        buffer, a Visual is attached afterwards unless headless.
+
+        Args:
+            path (str): maze file
+            theme (MAZE_THEME): theme of the Visual
+            headless (bool): if True, do not attach a Visual
+
+        Raises:
+            ValueError: the file is not a maze file, is of an unsupported version or is truncated
+
+        Returns:
+            Grid: the loaded maze, with the seed and algorithm it was saved with
+        """
+        reader = MazeReader(path)
+        try:
+            mask_string = "\n".join("m:" + line for line in reader.mask_lines) if reader.mask_lines else None
+            grid = cls(reader.width, reader.height, theme, mask_string=mask_string, headless=True)
+            grid.seed, grid.algorithm = reader.seed, reader.algorithm
+            width = grid.width
+            for row, states in enumerate(reader.rows()):
+                start = row * width
+                # keep the MASKED bits set by the mask
+                masks = int.from_bytes(grid.state[start : start + width].tobytes(), "big")
+                cells = int.from_bytes(states, "big") | masks
+                grid.state[start : start + width] = array("B", cells.to_bytes(width, "big"))
+                grid.link_count += sum(states.translate(LINK_COUNTS))
+        finally:
+            reader.close()
+        if not headless:
+            grid.attach_visual()
+        return grid
+
+    def to_file(self, path: str, compress: bool = True) -> None:
+        """Save the maze, with its seed, algorithm and mask, to a file a row at a time.
+
+        Args:
+            path (str): file to write, replaced if it exists
+            compress (bool): compress the rows with zlib
+        """
+        width = self.width
+        writer = MazeWriter(path, width, self.height, self.seed, self.algorithm, self.mask_lines, compress)
+        for row in range(self.height):
+            writer.write_row(self.state[row * width : (row + 1) * width].tobytes())
+        writer.close()
 
     def format_mask(self, mask_string: Optional[str]) -> Optional[list[str]]:
         """Format the mask string for use in other methods."""
@@ -54,18 +134,17 @@ class Grid:
 
     def prepare_grid(self) -> None:
         """
-        Create a dictionary of Cell objects, where the dictionary key is a tuple of the row and column, and
-        the value is the Cell object.
+        Allocate the state buffer and create a Cell view for each position, stored in row major order so
+        the cell at (row, column) is self.cells[row * width + column].
         """
-        for row in range(self.height):
-            for col in range(self.width):
-                cell = Cell(row, col)
-                self.cells[(row, col)] = cell
-                self.unmasked_cells[(row, col)] = cell
+        self.state = array("B", bytes(self.width * self.height))
+        width = self.width
+        self.cells = [Cell(row, col, self, row * width + col) for row in range(self.height) for col in range(width)]
+        self.unmasked_cells = self.cells
 
     def mask_cells(self) -> None:
-        """Translate mask string to cell coordinates centered in the grid. Track masked cells in self.masked_cells
-        and unmasked cells in self.unmasked_cells."""
+        """Translate mask string to cell coordinates centered in the grid. Set the MASKED bit for masked cells
+        and track unmasked cells in self.unmasked_cells."""
 
         if not self.mask_lines:
             return
@@ -78,31 +157,44 @@ class Grid:
         for y, line in enumerate(self.mask_lines):
             for x, symbol in enumerate(line):
                 if symbol == "#":
-                    cell_coordinates = (y + y_delta, x + x_delta)
-                    cell = self.get_cell(cell_coordinates)
+                    cell = self.get_cell((y + y_delta, x + x_delta))
                     if cell:
-                        self.masked_cells[cell_coordinates] = cell
-                    self.unmasked_cells.pop(cell_coordinates, None)
+                        self.state[cell.id] |= MASKED
+        self.unmasked_cells = [cell for cell in self.cells if not self.state[cell.id] & MASKED]
 
     def configure_cells(self) -> None:
         """
-        For each cell in the grid, set the neighbors of that cell to the cells that are adjacent to it.
-        """
-        for cell in self.cells.values():
-            row = cell.row
-            col = cell.column
-            adjacent_cell_coordinates = {
-                "north": (row - 1, col),
-                "south": (row + 1, col),
-                "west": (row, col - 1),
-                "east": (row, col + 1),
-            }
-            for direction, coordinates in adjacent_cell_coordinates.items():
-                neighbor = self.get_cell(coordinates)
-                if neighbor:
-                    cell.neighbors[direction] = neighbor
-                else:
-                    cell.neighbors[direction] = None
+        Build the neighbor tables read by get_neighbors. Must run after mask_cells. For each cell, store
+        a tuple of the adjacent cells in north, south, west, east order, once with and once without masked
+        neighbors. Cells without masked neighbors share the same tuple in both tables.
+        """
+        width = self.width
+        height = self.height
+        cells = self.cells
+        state = self.state
+        self.neighbor_table = []
+        self.unmasked_neighbor_table = []
+        for cell in cells:
+            index = cell.id
+            neighbors = []
+            if cell.row > 0:
+                neighbors.append(cells[index - width])
+            if cell.row < height - 1:
+                neighbors.append(cells[index + width])
+            if cell.column > 0:
+                neighbors.append(cells[index - 1])
+            if cell.column < width - 1:
+                neighbors.append(cells[index + 1])
+            self.neighbor_table.append(tuple(neighbors))
+        if not self.mask_lines:
+            self.unmasked_neighbor_table = self.neighbor_table
+            return
+        for neighbors in self.neighbor_table:
+            unmasked_neighbors = tuple(neighbor for neighbor in neighbors if not state[neighbor.id] & MASKED)
+            if len(unmasked_neighbors) == len(neighbors):
+                self.unmasked_neighbor_table.append(neighbors)
+            else:
+                self.unmasked_neighbor_table.append(unmasked_neighbors)
 
     def get_cell(self, cell: tuple[int, int]) -> Optional[Cell]:
         """
@@ -111,34 +203,33 @@ class Grid:
         :param cell: a tuple of the form (row, column)
         :return: The cell object
         """
-
-        if cell in self.cells:
-            return self.cells[cell]
+        row, col = cell
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return self.cells[row * self.width + col]
         else:
             return None
 
-    def get_neighbors(self, cell: Cell, ignore_mask=False, existing_only: bool = True) -> dict[str, Optional[Cell]]:
+    def is_masked(self, cell: Cell) -> bool:
+        """
+        Return True if the cell has been masked out of the maze.
+
+        :param cell: cell to check
+        :return: True if masked else False
         """
-        Given a cell, return a list of its neighboring cells.
+        return bool(self.state[cell.id] & MASKED)
+
+    def get_neighbors(self, cell: Cell, ignore_mask: bool = False) -> tuple[Cell, ...]:
+        """
+        Given a cell, return its neighboring cells in north, south, west, east order. The tuple is shared
+        between calls and must not be modified.
 
         :param cell: the cell to get the neighbors of
         :param ignore_mask: return masked and unmasked neighbors. Defaults to False.
-        :param existing_only: if True, only return direction:Cell pair if neighbor exists. Defaults to True.
-        :return: A dict of {str,Cell} neighbors.
-        """
-        neighbors = {}
-        for direction, neighbor in cell.neighbors.items():
-            if existing_only and not neighbor:
-                continue
-            neighbors[direction] = neighbor
-        if not ignore_mask:
-            unmasked_neighbors = {}
-            for direction, neighbor in neighbors.items():
-                if neighbor not in self.masked_cells.values():
-                    unmasked_neighbors[direction] = neighbor
-            neighbors = unmasked_neighbors
-
-        return neighbors
+        :return: A tuple of neighboring cells.
+        """
+        if ignore_mask:
+            return self.neighbor_table[cell.id]
+        return self.unmasked_neighbor_table[cell.id]
 
     def link_cells(self, cell_a: Cell, cell_b: Cell, bidi: bool = True) -> None:
         """
@@ -149,11 +240,15 @@ class Grid:
         :param bidi: If True, the link is bidirectional, defaults to True (optional)
         """
         cell_a.link(cell_b, bidi=bidi)
-        self.visual.modify_link_state(cell_a, cell_b)
+        self.link_count += 1
+        if self.visual:
+            self.visual.modify_link_state(cell_a, cell_b)
 
     def unlink_cells(self, cell_a: Cell, cell_b: Cell, bidi: bool = True) -> None:
         cell_a.unlink(cell_b, bidi=bidi)
-        self.visual.modify_link_state(cell_a, cell_b, unlink=True)
+        self.link_count -= 1
+        if self.visual:
+            self.visual.modify_link_state(cell_a, cell_b, unlink=True)
 
     def random_cell(self, ignore_mask: bool = False) -> Cell:
         """Return a random cell from the grid.
@@ -165,9 +260,9 @@ class Grid:
             Cell: Cell
         """
         if ignore_mask:
-            cell = random.choice(list(self.cells.values()))
+            cell = random.choice(self.cells)
         else:
-            cell = random.choice(list(self.unmasked_cells.values()))
+            cell = random.choice(self.unmasked_cells)
         return cell
 
     def size(self) -> int:
@@ -189,14 +284,11 @@ class Grid:
         else:
             range_gen = range(self.height)
         for row in range_gen:
+            row_cells = self.cells[row * self.width : (row + 1) * self.width]
             if ignore_mask:
-                yield [self.cells[(row, col)] for col in range(self.width)]
+                yield row_cells
             else:
-                yield [
-                    unmasked_cell
-                    for col in range(self.width)
-                    if (unmasked_cell := self.unmasked_cells.get((row, col), None))
-                ]
+                yield [cell for cell in row_cells if not self.state[cell.id] & MASKED]
 
     def each_column(self, ignore_mask: bool = False) -> Generator[list[Cell], None, None]:
         """
@@ -206,18 +298,14 @@ class Grid:
         """
         for column in range(self.width):
             if ignore_mask:
-                yield [self.cells[(row, column)] for row in range(self.height)]
+                yield self.cells[column :: self.width]
 
     def each_cell(self, ignore_mask: bool = False) -> Generator[Cell, None, None]:
         """
         Return a generator that yields a cell at a time.
         :param ignore_mask: If True, include masked cells, defaults to False (optional)
         """
-        for row in range(self.height):
-            for col in range(self.width):
-                if ignore_mask:
-                    yield self.cells[(row, col)]
-                else:
-                    cell = self.unmasked_cells.get((row, col), None)
-                    if cell:
-                        yield cell
+        if ignore_mask:
+            yield from self.cells
+        else:
+            yield from self.unmasked_cells
@@ -0,0 +1,69 @@
+import random
+from collections.abc import Iterable, Iterator
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IndexedSet(Generic[T]):
+    """Set with O(1) add, remove, membership and random choice. Members are kept in a list, with a map of
+    member to list position. Removal moves the last member into the removed member's position."""
+
+    def __init__(self, members: Iterable[T] = ()) -> None:
+        """
+        Create a set from the given members, list order follows the iteration order of members.
+
+        :param members: initial members
+        """
+        self.members: list[T] = []
+        self.positions: dict[T, int] = {}
+        for member in members:
+            self.add(member)
+
+    def add(self, member: T) -> None:
+        """
+        Add a member if not already present.
+
+        :param member: member to add
+        """
+        if member not in self.positions:
+            self.positions[member] = len(self.members)
+            self.members.append(member)
+
+    def remove(self, member: T) -> None:
+        """
+        Remove a member, raising KeyError if not present.
+
+        :param member: member to remove
+        """
+        position = self.positions.pop(member)
+        last_member = self.members.pop()
+        if position < len(self.members):
+            self.members[position] = last_member
+            self.positions[last_member] = position
+
+    def discard(self, member: T) -> None:
+        """
+        Remove a member if present.
+
+        :param member: member to remove
+        """
+        if member in self.positions:
+            self.remove(member)
+
+    def random_choice(self) -> T:
+        """
+        Return a random member using random.choice.
+
+        :return: random member
+        """
+        return random.choice(self.members)
+
+    def __contains__(self, member: object) -> bool:
+        return member in self.positions
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.members)
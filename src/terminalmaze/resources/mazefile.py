@@ -0,0 +1,210 @@
+"""Reads and writes mazes in the terminalmaze maze file format.
+
+A maze file is a header followed by the cell rows:
+
+- the magic bytes and a format version byte
+- the width, height and flags, little endian
+- the length of a JSON block and the block: the seed, the generating algorithm and the mask lines
+- one record per grid row, top to bottom: 2 bits per cell, 4 cells per byte with the first cell in the high bits.
+  The high bit of a cell is set for a passage to the east, the low bit for a passage to the south.
+
+North and west passages are the south and east passages of the neighboring cells, and masked cells are recreated
+from the mask, so neither is stored. With the COMPRESSED flag the rows are one zlib stream. Rows are packed and
+unpacked a whole row at a time with bytes.translate and big integer bit operations.
+"""
+
+import json
+import struct
+import zlib
+from collections.abc import Iterator
+from typing import Any
+
+from terminalmaze.resources.cell import EAST, SOUTH
+
+MAGIC = b"TMAZE"
+VERSION = 1
+HEADER = struct.Struct("<IIB")
+METADATA_LENGTH = struct.Struct("<I")
+# header flags
+COMPRESSED = 1
+
+EAST_CODE = 2
+SOUTH_CODE = 1
+# 2 bit code of a cell by cell state
+CELL_CODES = bytes((EAST_CODE if state & EAST else 0) | (SOUTH_CODE if state & SOUTH else 0) for state in range(256))
+# east and south state bits of the cell at each position of a packed byte, by packed byte
+CODE_STATES = tuple(
+    bytes(
+        (EAST if packed >> shift & EAST_CODE else 0) | (SOUTH if packed >> shift & SOUTH_CODE else 0)
+        for packed in range(256)
+    )
+    for shift in (6, 4, 2, 0)
+)
+# shifts of a row's cell states, as one big endian integer, that move the east bit of each cell to the west bit of
+# the next cell, one byte lower, and the south bit of each cell to the north bit of the same cell
+EAST_TO_WEST = 9
+SOUTH_TO_NORTH = 1
+# uncompressed bytes read at a time from a compressed file
+READ_SIZE = 1 << 16
+
+
+def pack_codes(codes: bytes) -> bytes:
+    """Pack 2 bit codes, one per byte, into 4 codes per byte with the first in the high bits. The codes of each
+    position in a byte are shifted into place as one big integer, no code exceeds 3 so the shifts never carry into
+    the neighboring byte."""
+    padded = codes + bytes(-len(codes) % 4)
+    packed = 0
+    for position in range(4):
+        packed |= int.from_bytes(padded[position::4], "big") << (6 - position * 2)
+    return packed.to_bytes(len(padded) // 4, "big")
+
+
+def packed_row_size(width: int) -> int:
+    """Return the bytes a packed row of width cells takes."""
+    return -(-width // 4)
+
+
+class MazeWriter:
+    """Writes a maze file a row at a time."""
+
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        seed: int | None = None,
+        algorithm: str | None = None,
+        mask_lines: list[str] | None = None,
+        compress: bool = True,
+    ) -> None:
+        """
+        Args:
+            path (str): file to write, replaced if it exists
+            width (int): cells per row
+            height (int): number of rows
+            seed (int | None): seed the maze was generated with
+            algorithm (str | None): name of the algorithm that generated the maze
+            mask_lines (list[str] | None): mask applied to the grid, as in Grid.mask_lines
+            compress (bool): compress the rows with zlib
+        """
+        self.file = open(path, "wb")
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self.compressor = zlib.compressobj() if compress else None
+        metadata = json.dumps({"seed": seed, "algorithm": algorithm, "mask": mask_lines}).encode()
+        self.file.write(MAGIC + bytes([VERSION]))
+        self.file.write(HEADER.pack(width, height, COMPRESSED if compress else 0))
+        self.file.write(METADATA_LENGTH.pack(len(metadata)) + metadata)
+
+    def write_row(self, states: bytes) -> None:
+        """Write the next row.
+
+        Args:
+            states (bytes): state of each cell of the row, as stored in Grid.state
+
+        Raises:
+            ValueError: the row is not width cells long, or every row was written
+        """
+        if len(states) != self.width:
+            raise ValueError(f"Got a row of {len(states)} cells, the maze is {self.width} cells wide")
+        if self.rows_written == self.height:
+            raise ValueError(f"All {self.height} rows of the maze were written")
+        packed = pack_codes(bytes(states).translate(CELL_CODES))
+        self.file.write(self.compressor.compress(packed) if self.compressor else packed)
+        self.rows_written += 1
+
+    def close(self) -> None:
+        """Finish the compressed stream and close the file.
+
+        Raises:
+            ValueError: fewer rows than the height were written
+        """
+        if self.file.closed:
+            return
+        if self.compressor:
+            self.file.write(self.compressor.flush())
+        self.file.close()
+        if self.rows_written != self.height:
+            raise ValueError(f"Only {self.rows_written} of the {self.height} rows of the maze were written")
+
+
+class MazeReader:
+    """Reads a maze file written by MazeWriter a row at a time."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): maze file
+
+        Raises:
+            ValueError: the file is not a maze file, or is of an unsupported version
+        """
+        self.file = open(path, "rb")
+        try:
+            header = self.file.read(len(MAGIC) + 1 + HEADER.size + METADATA_LENGTH.size)
+            if header[: len(MAGIC)] != MAGIC:
+                raise ValueError(f"{path} is not a terminalmaze maze file")
+            if len(header) < len(MAGIC) + 1 + HEADER.size + METADATA_LENGTH.size:
+                raise ValueError(f"{path} is truncated")
+            if header[len(MAGIC)] != VERSION:
+                raise ValueError(f"{path} is a version {header[len(MAGIC)]} maze file, version {VERSION} is supported")
+            self.width, self.height, flags = HEADER.unpack_from(header, len(MAGIC) + 1)
+            (length,) = METADATA_LENGTH.unpack_from(header, len(MAGIC) + 1 + HEADER.size)
+            metadata: dict[str, Any] = json.loads(self.file.read(length))
+        except ValueError:
+            self.file.close()
+            raise
+        self.compressed = bool(flags & COMPRESSED)
+        self.seed: int | None = metadata["seed"]
+        self.algorithm: str | None = metadata["algorithm"]
+        self.mask_lines: list[str] | None = metadata["mask"]
+
+    def packed_rows(self) -> Iterator[bytes]:
+        """Yield the packed rows, decompressing as they are read.
+
+        Raises:
+            ValueError: the file ends before the last row
+        """
+        row_size = packed_row_size(self.width)
+        if not self.compressed:
+            for _ in range(self.height):
+                packed = self.file.read(row_size)
+                if len(packed) < row_size:
+                    raise ValueError(f"{self.file.name} is truncated")
+                yield packed
+            return
+        decompressor = zlib.decompressobj()
+        pending = b""
+        for _ in range(self.height):
+            while len(pending) < row_size:
+                data = decompressor.unconsumed_tail or self.file.read(READ_SIZE)
+                if not data:
+                    raise ValueError(f"{self.file.name} is truncated")
+                pending += decompressor.decompress(data, READ_SIZE)
+            yield pending[:row_size]
+            pending = pending[row_size:]
+
+    def rows(self) -> Iterator[bytes]:
+        """Yield the state of the cells of each row, top to bottom, with the passages to every side set.
+
+        Raises:
+            ValueError: the file ends before the last row
+        """
+        width = self.width
+        padded_width = packed_row_size(width) * 4
+        east_bits = int.from_bytes(bytes([EAST]) * width, "big")
+        south_bits = int.from_bytes(bytes([SOUTH]) * width, "big")
+        row = bytearray(padded_width)
+        previous = 0
+        for packed in self.packed_rows():
+            for position, states in enumerate(CODE_STATES):
+                row[position::4] = packed.translate(states)
+            cells = int.from_bytes(row[:width], "big")
+            cells |= (cells & east_bits) >> EAST_TO_WEST
+            cells |= (previous & south_bits) >> SOUTH_TO_NORTH
+            previous = cells
+            yield cells.to_bytes(width, "big")
+
+    def close(self) -> None:
+        self.file.close()
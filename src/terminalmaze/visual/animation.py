@@ -0,0 +1,243 @@
+"""Animation effects compiled into flat frame timelines, and the cells an animation is playing on."""
+
+import random
+import sys
+from array import array
+
+from terminalmaze.visual.framebuffer import Palette
+
+# (glyph id, foreground color id) written into an effect layer, None keeps the value below
+Paint = tuple[int | None, int | None]
+
+# Placed before the frames of every timeline. It is never identical to a compiled frame, so the first frame a cell
+# plays always counts as a change.
+TIMELINE_START: Paint = (None, None)
+
+
+class AnimationTimeline:
+    """Every frame an animation paints on a cell, from the frame the cell is added to the frame it completes.
+
+    The animation states are stepped through once when the timeline is compiled, the frames are stored back to
+    back in one list as prebuilt layer values with the glyph and color already resolved to palette ids. A frame
+    that paints nothing is None. Equal paints share one tuple, so consecutive frames are compared by identity.
+
+    Animations with random choices (a list of colors, characters or durations, several characters in one string or
+    a list of cycle counts) are compiled into VARIANTS timelines and each cell plays one picked at random.
+    """
+
+    VARIANTS = 32
+
+    def __init__(
+        self, animation_details: list, cycles: list[int] | int, palette: Palette, rng: random.Random
+    ) -> None:
+        """
+        Args:
+            animation_details (list): animation states from the theme, [color, character, frame duration] each
+            cycles (list[int] | int): number of times the animation plays
+            palette (Palette): palette to resolve glyphs and colors with
+            rng (random.Random): random choices are drawn from it, not from the random module the maze is seeded
+            through
+        """
+        self.palette = palette
+        self.random = rng
+        self.frames: list[Paint | None] = list()
+        self.starts = array("l")
+        self.lengths = array("l")
+        self.paints: dict[Paint, Paint] = dict()
+        self.randomized = isinstance(cycles, list) or any(
+            any(isinstance(value, list) for value in state) or len(state[1]) > 1
+            for state in animation_details
+            if state
+        )
+        for _ in range(self.VARIANTS if self.randomized else 1):
+            if isinstance(cycles, list):
+                cycles_remaining = self.random.choice(cycles)
+            else:
+                cycles_remaining = cycles - 1
+            variant = self.compile(animation_details, cycles_remaining)
+            self.frames.append(TIMELINE_START)
+            self.starts.append(len(self.frames))
+            self.lengths.append(len(variant))
+            self.frames.extend(variant)
+
+    def state_values(self, state_index: int, animation_details: list) -> tuple[int | str | None, str | None, int]:
+        """Get the color, character and frame duration of an animation state, choosing from lists at random.
+
+        Args:
+            state_index (int): index of the state in animation_details
+            animation_details (list): animation states from the theme
+
+        Returns:
+            tuple[int | str | None, str | None, int]: color, character and frame duration
+        """
+        if state_index >= len(animation_details):
+            return None, None, 0
+        color, character, frame_duration = animation_details[state_index]
+        if isinstance(color, list):
+            color = self.random.choice(color)
+        if isinstance(character, list):
+            character = self.random.choice(character)
+        if isinstance(frame_duration, list):
+            frame_duration = self.random.choice(frame_duration)
+        return color, character, int(frame_duration)
+
+    def compile(self, animation_details: list, cycles_remaining: int) -> list[Paint | None]:
+        """Step a cell through the animation states and record what it paints each frame.
+
+        A state lasts its frame duration. After the final state the animation restarts from the second state while
+        cycles remain. A string of several characters paints one of them, chosen when the state is entered.
+
+        Args:
+            animation_details (list): animation states from the theme
+            cycles_remaining (int): number of times the animation restarts
+
+        Returns:
+            list[Paint | None]: paint for each frame, the last is the frame the animation completes on
+        """
+        frames: list[Paint | None] = list()
+        state_index = 0
+        final_state_index = len(animation_details) - 1
+        frame_counter = self.state_values(0, animation_details)[2]
+        persistent_character = ""
+        while True:
+            color = character = None
+            if frame_counter:
+                frame_counter -= 1
+                color, character, _ = self.state_values(state_index, animation_details)
+                if len(character) > 1:  # type: ignore[arg-type]
+                    if not persistent_character:
+                        persistent_character = self.random.choice(character)  # type: ignore[arg-type]
+                    character = persistent_character
+            complete = False
+            if frame_counter == 0:
+                if state_index == final_state_index and cycles_remaining > 0:
+                    state_index = 0
+                    cycles_remaining -= 1
+                if state_index < final_state_index:
+                    state_index += 1
+                    frame_counter = self.state_values(state_index, animation_details)[2]
+                else:
+                    complete = True
+                persistent_character = ""
+            frames.append(self.paint(color, character) if character or color is not None else None)
+            if complete:
+                return frames
+
+    def paint(self, color: int | str | None, character: str | None) -> Paint:
+        """Return the shared layer value painting the character and color.
+
+        Args:
+            color (int | str | None): xterm color code or hex color string, None keeps the color below
+            character (str | None): character, None or empty keeps the character below
+
+        Returns:
+            Paint: glyph and color ids
+        """
+        glyph = self.palette.glyph_id(character) if character else None
+        fg = self.palette.color_id(color) if color is not None else None
+        return self.paints.setdefault((glyph, fg), (glyph, fg))
+
+    def pick(self) -> tuple[int, int]:
+        """Return the start position in frames and the length of the timeline a new cell plays."""
+        variant = self.random.randrange(self.VARIANTS) if self.randomized else 0
+        return self.starts[variant], self.lengths[variant]
+
+
+class AnimatingCells:
+    """Cells an animation effect is playing on, kept as parallel arrays.
+
+    A cell plays its timeline from the frame it was added, so its position in AnimationTimeline.frames is its
+    origin plus the effect's frame tick. Cells are retired together once their last frame was played.
+    """
+
+    def __init__(self) -> None:
+        self.indexes = array("l")
+        self.origins = array("l")
+        self.expiries = array("l")
+        self.members: set[int] = set()
+        self.completed_passages: set[int] = set()
+        self.retired: list[int] = list()
+        self.tick = 0
+        self.next_expiry = sys.maxsize
+
+    def __len__(self) -> int:
+        return len(self.indexes)
+
+    def __contains__(self, index: int) -> bool:
+        return index in self.members
+
+    def add(self, index: int, timeline: AnimationTimeline) -> None:
+        """Start playing the timeline on a cell from the current frame.
+
+        Args:
+            index (int): visual grid index of the cell
+            timeline (AnimationTimeline): compiled animation
+        """
+        start, length = timeline.pick()
+        expiry = self.tick + length
+        self.indexes.append(index)
+        self.origins.append(start - self.tick)
+        self.expiries.append(expiry)
+        self.members.add(index)
+        if expiry < self.next_expiry:
+            self.next_expiry = expiry
+
+    def clear_retired(self, layer: dict[int, Paint]) -> set[int]:
+        """Remove the cells retired after the previous frame from the layer.
+
+        Args:
+            layer (dict[int, Paint]): layer the effect paints into
+
+        Returns:
+            set[int]: visual grid indexes removed
+        """
+        cleared = set(self.retired)
+        for index in cleared:
+            layer.pop(index, None)
+        self.retired.clear()
+        return cleared
+
+    def play(self, layer: dict[int, Paint], timeline: AnimationTimeline, repaint: bool = False) -> set[int]:
+        """Paint the current frame of every cell whose paint differs from its previous frame.
+
+        Args:
+            layer (dict[int, Paint]): layer the effect painted in the previous frame
+            timeline (AnimationTimeline): compiled animation
+            repaint (bool): paint every cell, the layer is empty
+
+        Returns:
+            set[int]: visual grid indexes painted or cleared
+        """
+        frames = timeline.frames
+        tick = self.tick
+        painted: set[int] = set()
+        for index, origin in zip(self.indexes, self.origins):
+            position = origin + tick
+            paint = frames[position]
+            if repaint or paint is not frames[position - 1]:
+                if paint is None:
+                    layer.pop(index, None)
+                else:
+                    layer[index] = paint
+                painted.add(index)
+        return painted
+
+    def advance(self) -> list[int]:
+        """Retire the cells that played their last frame and move on to the next frame.
+
+        Returns:
+            list[int]: visual grid indexes of the retired cells
+        """
+        self.tick += 1
+        tick = self.tick
+        if self.next_expiry > tick:
+            return []
+        retired = [index for index, expiry in zip(self.indexes, self.expiries) if expiry <= tick]
+        keep = [i for i, expiry in enumerate(self.expiries) if expiry > tick]
+        self.indexes = array("l", [self.indexes[i] for i in keep])
+        self.origins = array("l", [self.origins[i] for i in keep])
+        self.expiries = array("l", [self.expiries[i] for i in keep])
+        self.members.difference_update(retired)
+        self.next_expiry = min(self.expiries, default=sys.maxsize)
+        self.retired.extend(retired)
+        return retired
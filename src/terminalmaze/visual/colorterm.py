@@ -1,7 +1,53 @@
-"""Converts xterm color codes and hex colors into ANSI escape sequences."""
+"""Converts xterm color codes and hex colors into ANSI escape sequences.
 
+Sequences for the 256 xterm colors are precomputed in FG_TABLE and BG_TABLE. Sequences for hex colors are built once
+per color and cached.
+"""
+
+import functools
+from typing import NamedTuple
 
 RESET = "\x1b[0m"
+DEFAULT_FG = "\x1b[39m"
+DEFAULT_BG = "\x1b[49m"
+
+FOREGROUND = 38
+BACKGROUND = 48
+
+FG_TABLE: tuple[str, ...] = tuple(f"\x1b[{FOREGROUND};5;{code}m" for code in range(256))
+BG_TABLE: tuple[str, ...] = tuple(f"\x1b[{BACKGROUND};5;{code}m" for code in range(256))
+
+
+class ColorHandle(NamedTuple):
+    """A validated color and its foreground and background escape sequences."""
+
+    code: int | str
+    fg: str
+    bg: str
+
+
+@functools.lru_cache(maxsize=4096)
+def _truecolor(hex_color: str, location: int) -> str:
+    """
+    Returns the ANSI escape sequence for a hex color. Cached, a theme only uses a handful of hex colors.
+
+    Parameters
+    ----------
+    hex_color : str : Hex color string. '#' is optional.
+    location : int : 38 for the foreground, 48 for the background
+
+    Returns
+    -------
+    str
+    """
+    digits = hex_color.strip("#")
+    try:
+        if len(digits) != 6:
+            raise ValueError
+        red, green, blue = (int(digits[i : i + 2], 16) for i in range(0, 6, 2))
+    except ValueError:
+        raise ValueError(f"Got color code ({hex_color}): hex colors must be a hex string #000000 -> #FFFFFF") from None
+    return f"\x1b[{location};2;{red};{green};{blue}m"
 
 
 def _color(color_code: str | int, location: int) -> str:
@@ -16,37 +62,88 @@ def _color(color_code: str | int, location: int) -> str:
     -------
     str
     """
+    if isinstance(color_code, str):
+        return _truecolor(color_code, location)
+    if isinstance(color_code, int):
+        if not 0 <= color_code <= 255:
+            raise ValueError(f"Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255")
+        return FG_TABLE[color_code] if location == FOREGROUND else BG_TABLE[color_code]
+    raise ValueError(
+        f"Got color code ({color_code}): Color must be either hex string #000000 -> #FFFFFF or"
+        f" int xterm color code 0 <= n <= 255"
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def resolve(color_code: str | int) -> ColorHandle:
+    """Validate a color and build its escape sequences. Hex strings are normalized to lower case with a '#', so
+    spellings of the same color share one handle.
 
-    def hex_to_int(hex_color: str) -> list[int]:
-        """
-        Convert a hex color string into a list of ints.
-
-        Parameters
-        ----------
-        hex_color : str : Hex color string. '#' is optional.
+    Parameters
+    ----------
+    color_code : Union[str, int] : Hex color string or xterm color int 0 <= n <= 255
 
-        Returns
-        -------
-        List[int] : [RED, GREEN, BLUE] list of color integers
-        """
-        hex_color = hex_color.strip("#")
-        ints = [int(hex_color[i : i + 2], 16) for i in range(0, 6, 2)]
-        return ints
+    Returns
+    -------
+    ColorHandle : the normalized color and its escape sequences
 
+    Raises
+    ------
+    ValueError : the color is not a hex color string or an xterm color code
+    """
     if isinstance(color_code, str):
-        color_ints = hex_to_int(color_code)
-        sequence = f"\x1b[{location};2;{color_ints[0]};{color_ints[1]};{color_ints[2]}m"
-    elif isinstance(color_code, int):
-        if color_code not in range(0, 256):
-            raise ValueError("Got color code ({color_code}): xterm color codes must be an integer: 0 <= n <= 255")
-        else:
-            sequence = f"\x1b[{location};5;{color_code}m"
-    else:
-        raise ValueError(
-            f"Got color code ({color_code}): Color must be either hex string #000000 -> #FFFFFF or"
-            f" int xterm color code 0 <= n <= 255"
-        )
-    return sequence
+        color_code = "#" + color_code.strip("#").lower()
+    return ColorHandle(color_code, _color(color_code, FOREGROUND), _color(color_code, BACKGROUND))
+
+
+# levels of the six steps of each channel in the xterm 6x6x6 color cube
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+# the 16 system colors, as xterm draws them by default
+SYSTEM_COLORS = (
+    (0, 0, 0),
+    (128, 0, 0),
+    (0, 128, 0),
+    (128, 128, 0),
+    (0, 0, 128),
+    (128, 0, 128),
+    (0, 128, 128),
+    (192, 192, 192),
+    (128, 128, 128),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 0, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+
+
+def rgb(color_code: str | int) -> tuple[int, int, int]:
+    """Returns the red, green and blue values of a color, for output that is not a terminal.
+
+    Parameters
+    ----------
+    color_code : Union[str, int] : Hex color string or xterm color int 0 <= n <= 255
+
+    Returns
+    -------
+    tuple[int, int, int] : red, green and blue, 0-255
+
+    Raises
+    ------
+    ValueError : the color is not a hex color string or an xterm color code
+    """
+    code = resolve(color_code).code
+    if isinstance(code, str):
+        return int(code[1:3], 16), int(code[3:5], 16), int(code[5:7], 16)
+    if code < 16:
+        return SYSTEM_COLORS[code]
+    if code < 232:
+        red, green, blue = (code - 16) // 36, (code - 16) // 6 % 6, (code - 16) % 6
+        return CUBE_LEVELS[red], CUBE_LEVELS[green], CUBE_LEVELS[blue]
+    gray = 8 + (code - 232) * 10
+    return gray, gray, gray
 
 
 def fg(color_code: str | int) -> str:
@@ -60,8 +157,7 @@ def fg(color_code: str | int) -> str:
     -------
     str : ANSI escape sequence
     """
-    sequence = _color(color_code, 38)
-    return sequence
+    return _color(color_code, FOREGROUND)
 
 
 def bg(color_code: str | int) -> str:
@@ -75,5 +171,4 @@ def bg(color_code: str | int) -> str:
     -------
     str : ANSI escape sequence
     """
-    sequence = _color(color_code, 48)
-    return sequence
+    return _color(color_code, BACKGROUND)
@@ -0,0 +1,235 @@
+"""Exports a finished maze, and optionally a solution path, as a PNG, PPM or SVG image.
+
+The image is drawn from a wall bitmap with the same layout as the visual grid: one pixel per cell, one per passage
+between two cells and one per wall corner, so a width by height maze is 2 * width + 1 pixels wide and
+2 * height + 1 pixels high before scaling. Bitmap rows are built a grid row at a time by translating the cell state
+bytes, and written as they are built, so memory stays proportional to the width of the image.
+"""
+
+import re
+import struct
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from typing import BinaryIO
+
+from terminalmaze.resources.cell import EAST, LINKED, SOUTH, Cell
+from terminalmaze.resources.grid import Grid
+from terminalmaze.resources.mazefile import pack_codes
+from terminalmaze.visual import colorterm
+
+# bitmap pixel values, indexes into the image palette
+WALL = 0
+PATH = 1
+SOLUTION = 2
+
+# pixel of a cell, and of the passages east and south of it, by cell state
+CELL_PIXELS = bytes(PATH if state & LINKED else WALL for state in range(256))
+EAST_PIXELS = bytes(PATH if state & EAST else WALL for state in range(256))
+SOUTH_PIXELS = bytes(PATH if state & SOUTH else WALL for state in range(256))
+
+# largest image side, in pixels, the default scale is chosen to fit
+DEFAULT_IMAGE_SIZE = 2048
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# compressed image data is written in IDAT chunks of at least this many bytes
+PNG_CHUNK_SIZE = 1 << 16
+# the 2 bit pixels compress well, the fastest level is within a few percent of the default level's size
+PNG_COMPRESSION_LEVEL = 1
+
+Color = tuple[int, int, int]
+
+
+def bitmap_size(grid: Grid) -> tuple[int, int]:
+    """Return the width and height of the wall bitmap of a grid."""
+    return grid.width * 2 + 1, grid.height * 2 + 1
+
+
+def default_scale(grid: Grid) -> int:
+    """Return the largest number of pixels per bitmap pixel that keeps the image within DEFAULT_IMAGE_SIZE, at least
+    1."""
+    return max(1, DEFAULT_IMAGE_SIZE // max(bitmap_size(grid)))
+
+
+def solution_pixels(solution: Iterable[Cell]) -> dict[int, list[int]]:
+    """Return the bitmap columns of the solution path by bitmap row: the pixels of its cells and of the passages
+    between consecutive cells."""
+    pixels: dict[int, list[int]] = dict()
+    previous = None
+    for cell in solution:
+        pixels.setdefault(cell.row * 2 + 1, []).append(cell.column * 2 + 1)
+        if previous is not None:
+            pixels.setdefault(cell.row + previous.row + 1, []).append(cell.column + previous.column + 1)
+        previous = cell
+    return pixels
+
+
+def bitmap_rows(grid: Grid, solution: Iterable[Cell] = ()) -> Iterator[bytearray]:
+    """Yield the rows of the wall bitmap, top to bottom, as one palette index per pixel.
+
+    Args:
+        grid (Grid): finished maze
+        solution (Iterable[Cell]): cells of the solution path in order, from start to target
+
+    Yields:
+        bytearray: pixels of a bitmap row. The row is only valid until the next one is requested.
+    """
+    width, state = grid.width, grid.state
+    bitmap_width = width * 2 + 1
+    path = solution_pixels(solution)
+    wall_row = bytearray(bitmap_width)
+    row = bytearray(bitmap_width)
+    yield _overlay(wall_row[:], path.get(0))
+    for grid_row in range(grid.height):
+        states = state[grid_row * width : (grid_row + 1) * width].tobytes()
+        # walls at even columns, cells at odd columns and the passage east of each cell after it
+        row[:] = wall_row
+        row[1::2] = states.translate(CELL_PIXELS)
+        row[2::2] = states.translate(EAST_PIXELS)
+        yield _overlay(row, path.get(grid_row * 2 + 1))
+        # walls at even columns, the passage south of each cell at odd columns
+        row[:] = wall_row
+        row[1::2] = states.translate(SOUTH_PIXELS)
+        yield _overlay(row, path.get(grid_row * 2 + 2))
+
+
+def _overlay(row: bytearray, columns: list[int] | None) -> bytearray:
+    if columns:
+        for column in columns:
+            row[column] = SOLUTION
+    return row
+
+
+def scale_row(row: bytearray, scale: int) -> bytearray:
+    """Return a row with every pixel repeated scale times."""
+    if scale == 1:
+        return row
+    scaled = bytearray(len(row) * scale)
+    for offset in range(scale):
+        scaled[offset::scale] = row
+    return scaled
+
+
+def write_ppm(file: BinaryIO, grid: Grid, solution: Iterable[Cell], palette: list[Color], scale: int) -> None:
+    """Write a binary (P6) PPM image. Each channel is translated from the palette indexes separately and the three
+    are interleaved into RGB pixels."""
+    bitmap_width, bitmap_height = bitmap_size(grid)
+    width = bitmap_width * scale
+    file.write(f"P6\n{width} {bitmap_height * scale}\n255\n".encode())
+    channels = [bytes(color[channel] for color in palette).ljust(256, b"\0") for channel in range(3)]
+    pixels = bytearray(width * 3)
+    for row in bitmap_rows(grid, solution):
+        scaled = scale_row(row, scale)
+        for channel, table in enumerate(channels):
+            pixels[channel::3] = scaled.translate(table)
+        for _ in range(scale):
+            file.write(pixels)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def write_png(file: BinaryIO, grid: Grid, solution: Iterable[Cell], palette: list[Color], scale: int) -> None:
+    """Write an indexed color PNG image with 2 bits per pixel, packed like the cells of a maze file. Rows are
+    compressed as they are built and the compressed data is written in IDAT chunks once PNG_CHUNK_SIZE bytes are
+    pending."""
+    bitmap_width, bitmap_height = bitmap_size(grid)
+    file.write(PNG_SIGNATURE)
+    # 2 bit depth, color type 3 (palette), default compression, filter and no interlace
+    header = struct.pack(">IIBBBBB", bitmap_width * scale, bitmap_height * scale, 2, 3, 0, 0, 0)
+    file.write(_png_chunk(b"IHDR", header))
+    file.write(_png_chunk(b"PLTE", b"".join(bytes(color) for color in palette)))
+    compressor = zlib.compressobj(PNG_COMPRESSION_LEVEL)
+    pending: list[bytes] = []
+    pending_size = 0
+    for row in bitmap_rows(grid, solution):
+        # filter type 0, the pixels are stored unfiltered
+        scanline = b"\0" + pack_codes(scale_row(row, scale))
+        for _ in range(scale):
+            data = compressor.compress(scanline)
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+        if pending_size >= PNG_CHUNK_SIZE:
+            file.write(_png_chunk(b"IDAT", b"".join(pending)))
+            pending, pending_size = [], 0
+    pending.append(compressor.flush())
+    file.write(_png_chunk(b"IDAT", b"".join(pending)))
+    file.write(_png_chunk(b"IEND", b""))
+
+
+def write_svg(file: BinaryIO, grid: Grid, solution: Iterable[Cell], palette: list[Color], scale: int) -> None:
+    """Write an SVG image. The wall color fills the background, each horizontal run of path pixels in a bitmap row is
+    a one pixel wide line of one path, then the runs of solution pixels are drawn over it."""
+    solution = list(solution)
+    bitmap_width, bitmap_height = bitmap_size(grid)
+    file.write(
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{bitmap_width * scale}" height="{bitmap_height * scale}"'
+        f' viewBox="0 0 {bitmap_width} {bitmap_height}" shape-rendering="crispEdges">\n'
+        f'<rect width="100%" height="100%" fill="{_hex(palette[WALL])}"/>\n'.encode()
+    )
+    layers = [(PATH, re.compile(b"[\x01\x02]+"))]
+    if solution:
+        layers.append((SOLUTION, re.compile(b"\x02+")))
+    for color, runs in layers:
+        # lines are centered on the pixel rows
+        file.write(f'<path stroke="{_hex(palette[color])}" transform="translate(0 0.5)" d="'.encode())
+        for y, row in enumerate(bitmap_rows(grid, solution)):
+            lines = [f"M{start} {y}h{end - start}" for start, end in map(re.Match.span, runs.finditer(row))]
+            if lines:
+                file.write(("".join(lines) + "\n").encode())
+        file.write(b'"/>\n')
+    file.write(b"</svg>\n")
+
+
+def _hex(color: Color) -> str:
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+EXPORT_FORMATS: dict[str, Callable[[BinaryIO, Grid, Iterable[Cell], list[Color], int], None]] = {
+    ".png": write_png,
+    ".ppm": write_ppm,
+    ".svg": write_svg,
+}
+
+
+def export_format(path: str) -> str:
+    """Return the export format of a file, from its extension.
+
+    Raises:
+        ValueError: the extension is not one of EXPORT_FORMATS
+    """
+    extension = path[path.rfind(".") :].lower() if "." in path else ""
+    if extension not in EXPORT_FORMATS:
+        raise ValueError(f"Unable to export to {path}: the file extension must be one of {', '.join(EXPORT_FORMATS)}")
+    return extension
+
+
+def export_maze(
+    grid: Grid,
+    path: str,
+    wall_color: int | str,
+    path_color: int | str,
+    solution: Iterable[Cell] = (),
+    solution_color: int | str | None = None,
+    scale: int | None = None,
+) -> None:
+    """Write a finished maze to an image file, the format is chosen by the file extension.
+
+    Args:
+        grid (Grid): finished maze
+        path (str): image file to write, replaced if it exists
+        wall_color (int | str): theme color of the walls and unlinked cells
+        path_color (int | str): theme color of the passages
+        solution (Iterable[Cell]): cells of the solution path in order, from start to target
+        solution_color (int | str | None): theme color of the solution path, the path color if None
+        scale (int | None): pixels per bitmap pixel, default_scale if None
+
+    Raises:
+        ValueError: the file extension is not a supported format, or a color is invalid
+    """
+    writer = EXPORT_FORMATS[export_format(path)]
+    if solution_color is None:
+        solution_color = path_color
+    palette = [colorterm.rgb(wall_color), colorterm.rgb(path_color), colorterm.rgb(solution_color)]
+    with open(path, "wb") as file:
+        writer(file, grid, solution, palette, scale or default_scale(grid))
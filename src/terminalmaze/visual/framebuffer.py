@@ -0,0 +1,123 @@
+"""Compact screen state for the maze visual: glyph, foreground and background indexes per terminal cell."""
+
+from array import array
+
+import terminalmaze.visual.colorterm as colorterm
+
+
+class Palette:
+    """Interns glyphs and colors as small ints, with the escape sequences selecting each color. Id 0 selects the
+    terminal's default color."""
+
+    NO_COLOR = 0
+
+    def __init__(self) -> None:
+        self.glyphs: list[str] = []
+        self.glyph_ids: dict[str, int] = dict()
+        self.colors: list[colorterm.ColorHandle | None] = [None]
+        self.color_ids: dict[int | str, int] = dict()
+        self.fg_sequences: list[str] = [colorterm.DEFAULT_FG]
+        self.bg_sequences: list[str] = [colorterm.DEFAULT_BG]
+
+    def glyph_id(self, glyph: str) -> int:
+        """Return the id of the glyph, adding it to the palette if needed.
+
+        Args:
+            glyph (str): single character
+
+        Returns:
+            int: glyph id
+        """
+        glyph_id = self.glyph_ids.get(glyph)
+        if glyph_id is None:
+            glyph_id = self.glyph_ids[glyph] = len(self.glyphs)
+            self.glyphs.append(glyph)
+        return glyph_id
+
+    def color_id(self, color: int | str) -> int:
+        """Return the id of the color, adding it to the palette if needed. Spellings of the same hex color share one
+        id.
+
+        Args:
+            color (int | str): xterm color code or hex color string
+
+        Returns:
+            int: color id
+        """
+        color_id = self.color_ids.get(color)
+        if color_id is None:
+            handle = colorterm.resolve(color)
+            color_id = self.color_ids.get(handle.code)
+            if color_id is None:
+                color_id = self.color_ids[handle.code] = len(self.colors)
+                self.colors.append(handle)
+                self.fg_sequences.append(handle.fg)
+                self.bg_sequences.append(handle.bg)
+            self.color_ids[color] = color_id
+        return color_id
+
+
+class FrameBuffer:
+    """Parallel arrays of glyph, foreground and background ids, one entry per terminal cell in row major order."""
+
+    def __init__(self, width: int, height: int, glyph: int = 0, fg: int = 0, bg: int = 0) -> None:
+        """
+        Args:
+            width (int): number of terminal columns
+            height (int): number of terminal rows
+            glyph (int): glyph id every cell starts with
+            fg (int): foreground color id every cell starts with
+            bg (int): background color id every cell starts with
+        """
+        self.width = width
+        self.height = height
+        size = width * height
+        self.glyphs = array("H", [glyph]) * size
+        self.fg = array("H", [fg]) * size
+        self.bg = array("H", [bg]) * size
+
+    def copy(self) -> "FrameBuffer":
+        """Return a copy of the frame buffer."""
+        frame = FrameBuffer(0, 0)
+        frame.width = self.width
+        frame.height = self.height
+        frame.glyphs = self.glyphs[:]
+        frame.fg = self.fg[:]
+        frame.bg = self.bg[:]
+        return frame
+
+    def serialize_row(self, row: int, palette: Palette, start: int = 0, end: int | None = None) -> str:
+        """Build the terminal output for the cells of a row.
+
+        The colors in effect are tracked along the row and a color sequence is only written where a cell's color
+        differs from the cell before it. The output starts from, and is reset back to, the terminal's default
+        colors.
+
+        Args:
+            row (int): row index
+            palette (Palette): palette the ids refer to
+            start (int): first column
+            end (int | None): column after the last, defaults to the row width
+
+        Returns:
+            str: escape sequences and characters for the cells
+        """
+        offset = row * self.width
+        end = self.width if end is None else end
+        glyphs, fg, bg = self.glyphs, self.fg, self.bg
+        glyph_text, fg_sequences, bg_sequences = palette.glyphs, palette.fg_sequences, palette.bg_sequences
+        output = []
+        current_fg = current_bg = Palette.NO_COLOR
+        for i in range(offset + start, offset + end):
+            cell_bg = bg[i]
+            if cell_bg != current_bg:
+                output.append(bg_sequences[cell_bg])
+                current_bg = cell_bg
+            cell_fg = fg[i]
+            if cell_fg != current_fg:
+                output.append(fg_sequences[cell_fg])
+                current_fg = cell_fg
+            output.append(glyph_text[glyphs[i]])
+        if current_fg or current_bg:
+            output.append(colorterm.RESET)
+        return "".join(output)
@@ -0,0 +1,82 @@
+"""Reads key presses without blocking, used to pan the viewport while the maze is drawn.
+
+Needs termios. On other platforms, or when stdin is not a terminal, no keys are read.
+"""
+
+import atexit
+import os
+import select
+import sys
+from typing import TextIO
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None  # type: ignore[assignment]
+
+ARROW_KEYS = {"\x1b[A": "up", "\x1b[B": "down", "\x1b[C": "right", "\x1b[D": "left"}
+
+
+class KeyReader:
+    """Puts the terminal in cbreak mode so key presses are available immediately and are not echoed. The previous
+    terminal mode is restored by stop, or at exit."""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """
+        Args:
+            stream (TextIO | None): terminal to read from, defaults to sys.stdin
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.saved_attributes: list | None = None
+
+    def start(self) -> bool:
+        """Start reading keys.
+
+        Returns:
+            bool: True if keys can be read, False if termios is unavailable or the stream is not a terminal
+        """
+        if self.saved_attributes is not None:
+            return True
+        if termios is None or not self.stream.isatty():
+            return False
+        fd = self.stream.fileno()
+        self.saved_attributes = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+        atexit.register(self.stop)
+        return True
+
+    def stop(self) -> None:
+        """Restore the terminal mode saved by start."""
+        if self.saved_attributes is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self.saved_attributes)
+            self.saved_attributes = None
+            atexit.unregister(self.stop)
+
+    def read_keys(self) -> list[str]:
+        """Return the keys pressed since the previous call without waiting for more.
+
+        Returns:
+            list[str]: "up", "down", "left" and "right" for the arrow keys, the character for other keys
+        """
+        if self.saved_attributes is None:
+            return []
+        fd = self.stream.fileno()
+        data = b""
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 64)
+            if not chunk:
+                break
+            data += chunk
+        text = data.decode(errors="ignore")
+        keys = []
+        i = 0
+        while i < len(text):
+            arrow = ARROW_KEYS.get(text[i : i + 3])
+            if arrow is not None:
+                keys.append(arrow)
+                i += 3
+            else:
+                keys.append(text[i])
+                i += 1
+        return keys
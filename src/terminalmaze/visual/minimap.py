@@ -0,0 +1,154 @@
+"""Minimap backends: pack several visual grid cells into each terminal character to fit more of the maze on screen.
+
+The maze is composited at visual grid resolution as usual, the minimap then packs the composited frame into a smaller
+frame buffer. Only the characters covering changed cells are repacked. Each visual grid cell is first reduced to a
+single color: its foreground color when it shows a glyph, its background color when it shows a blank.
+"""
+
+from abc import ABC, abstractmethod
+
+from terminalmaze.visual.framebuffer import FrameBuffer, Palette
+
+HALF_BLOCK = "▀"
+BRAILLE_BLANK = 0x2800
+# bit of each dot in a braille character, by dot row and dot column
+BRAILLE_DOTS = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+
+
+class Minimap(ABC):
+    """Packs cell_width by cell_height visual grid cells into each terminal character."""
+
+    cell_width = 1
+    cell_height = 1
+
+    def __init__(self, palette: Palette, wall_color: int, path_color: int) -> None:
+        """
+        Args:
+            palette (Palette): palette the frame buffer ids refer to, the minimap adds its glyphs to it
+            wall_color (int): color id of the walls
+            path_color (int): color id of the paths
+        """
+        self.palette = palette
+        self.wall_color = wall_color
+        self.path_color = path_color
+        self.blank_glyphs: dict[int, bool] = dict()
+        self.packed: FrameBuffer | None = None
+
+    def packed_size(self, width: int, height: int) -> tuple[int, int]:
+        """Return the terminal columns and rows needed for width by height visual grid cells."""
+        return -(-width // self.cell_width), -(-height // self.cell_height)
+
+    def cell_color(self, frame: FrameBuffer, index: int) -> int:
+        """Reduce a visual grid cell to the color it shows.
+
+        Args:
+            frame (FrameBuffer): composited frame
+            index (int): index of the cell in frame
+
+        Returns:
+            int: color id
+        """
+        glyph = frame.glyphs[index]
+        blank = self.blank_glyphs.get(glyph)
+        if blank is None:
+            blank = self.blank_glyphs[glyph] = not self.palette.glyphs[glyph].strip()
+        return frame.bg[index] if blank else frame.fg[index]
+
+    def pack(self, frame: FrameBuffer, changed_cells: set[int]) -> tuple[FrameBuffer, set[int]]:
+        """Repack the characters covering the changed cells of the composited frame.
+
+        Args:
+            frame (FrameBuffer): composited frame
+            changed_cells (set[int]): indexes of the cells of frame changed since the previous call
+
+        Returns:
+            tuple[FrameBuffer, set[int]]: packed frame and the indexes of its repacked characters
+        """
+        width, height = self.packed_size(frame.width, frame.height)
+        packed = self.packed
+        if packed is None or (packed.width, packed.height) != (width, height):
+            packed = self.packed = FrameBuffer(width, height)
+            repacked = set(range(width * height))
+        else:
+            frame_width, cell_width, cell_height = frame.width, self.cell_width, self.cell_height
+            repacked = {
+                index // frame_width // cell_height * width + index % frame_width // cell_width
+                for index in changed_cells
+            }
+        for index in repacked:
+            self.pack_character(frame, packed, index)
+        return packed, repacked
+
+    @abstractmethod
+    def pack_character(self, frame: FrameBuffer, packed: FrameBuffer, index: int) -> None:
+        """Set one character of the packed frame from the visual grid cells it covers.
+
+        Args:
+            frame (FrameBuffer): composited frame
+            packed (FrameBuffer): packed frame
+            index (int): index of the character in packed
+        """
+
+
+class HalfBlockMinimap(Minimap):
+    """Two visual grid rows per line. The upper half block shows the upper cell's color in the foreground and the
+    lower cell's color in the background, so the colors are exact."""
+
+    cell_height = 2
+
+    def __init__(self, palette: Palette, wall_color: int, path_color: int) -> None:
+        super().__init__(palette, wall_color, path_color)
+        self.half_block = palette.glyph_id(HALF_BLOCK)
+
+    def pack_character(self, frame: FrameBuffer, packed: FrameBuffer, index: int) -> None:
+        row, column = divmod(index, packed.width)
+        upper = row * 2 * frame.width + column
+        packed.glyphs[index] = self.half_block
+        packed.fg[index] = self.cell_color(frame, upper)
+        if row * 2 + 1 < frame.height:
+            packed.bg[index] = self.cell_color(frame, upper + frame.width)
+        else:
+            packed.bg[index] = Palette.NO_COLOR
+
+
+class BrailleMinimap(Minimap):
+    """Two visual grid columns by four rows per character. Cells that are not wall colored are raised dots over the
+    wall color. A character has a single foreground color: the most common effect color among its dots, the path
+    color when none of its dots are painted by an effect."""
+
+    cell_width = 2
+    cell_height = 4
+
+    def __init__(self, palette: Palette, wall_color: int, path_color: int) -> None:
+        super().__init__(palette, wall_color, path_color)
+        self.braille_glyphs = [palette.glyph_id(chr(BRAILLE_BLANK + dots)) for dots in range(256)]
+
+    def pack_character(self, frame: FrameBuffer, packed: FrameBuffer, index: int) -> None:
+        row, column = divmod(index, packed.width)
+        wall_color, path_color = self.wall_color, self.path_color
+        frame_width, frame_height = frame.width, frame.height
+        dots = 0
+        effect_colors: dict[int, int] = dict()
+        for dot_row, row_bits in enumerate(BRAILLE_DOTS):
+            y = row * 4 + dot_row
+            if y >= frame_height:
+                break
+            for dot_column, bit in enumerate(row_bits):
+                x = column * 2 + dot_column
+                if x >= frame_width:
+                    break
+                color = self.cell_color(frame, y * frame_width + x)
+                if color == wall_color:
+                    continue
+                dots |= bit
+                if color != path_color:
+                    effect_colors[color] = effect_colors.get(color, 0) + 1
+        packed.glyphs[index] = self.braille_glyphs[dots]
+        packed.fg[index] = max(effect_colors, key=effect_colors.__getitem__) if effect_colors else path_color
+        packed.bg[index] = wall_color
+
+
+MINIMAPS: dict[str, type[Minimap]] = {
+    "halfblock": HalfBlockMinimap,
+    "braille": BrailleMinimap,
+}
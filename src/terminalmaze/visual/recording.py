@@ -0,0 +1,322 @@
+"""Records the frames drawn by a DiffRenderer to a file and reads them back.
+
+A recording is a header followed by records, each a type byte, a payload length and the payload:
+
+- P: glyphs and color sequences added to the palette since the previous P record, as JSON
+- K: keyframe, the time, size, status text and every cell of the frame
+- D: delta, the time, status text and the runs of cells that changed since the previous frame
+
+Frames are compressed with one zlib stream per keyframe and the deltas that follow it, flushed at the end of every
+record, so decoding can start at any keyframe. Closing the recorder appends an index of the keyframes and the final
+palette, found through the trailer at the end of the file. A recording that was not closed is read by scanning it.
+"""
+
+import json
+import struct
+import sys
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from typing import NamedTuple
+
+from terminalmaze.visual.framebuffer import FrameBuffer, Palette
+
+MAGIC = b"TMREC"
+VERSION = 1
+TRAILER_MAGIC = b"TMIX"
+
+KEYFRAME = b"K"
+DELTA = b"D"
+PALETTE = b"P"
+INDEX = b"I"
+
+RECORD_HEADER = struct.Struct("<cI")
+KEYFRAME_HEADER = struct.Struct("<dHH")
+DELTA_HEADER = struct.Struct("<dI")
+STATUS_LENGTH = struct.Struct("<i")
+RUN = struct.Struct("<II")
+TRAILER = struct.Struct("<Q4s")
+
+
+def _array_bytes(values: array) -> bytes:
+    """Return the little endian bytes of an array."""
+    if sys.byteorder == "big":
+        values = values[:]
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bytes_array(data: bytes | memoryview) -> array:
+    """Return the array of unsigned shorts stored little endian in data."""
+    values = array("H")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _encode_status(status: str | None) -> bytes:
+    if status is None:
+        return STATUS_LENGTH.pack(-1)
+    encoded = status.encode()
+    return STATUS_LENGTH.pack(len(encoded)) + encoded
+
+
+def _decode_status(body: bytes, position: int) -> tuple[str | None, int]:
+    (length,) = STATUS_LENGTH.unpack_from(body, position)
+    position += STATUS_LENGTH.size
+    if length < 0:
+        return None, position
+    return body[position : position + length].decode(), position + length
+
+
+class FrameRecorder:
+    """Writes every frame a DiffRenderer emits to a recording file. Deltas reuse the changed spans the renderer
+    found, a keyframe is written when the renderer redrew the whole frame and every keyframe_interval frames."""
+
+    def __init__(self, path: str, palette: Palette, keyframe_interval: int = 100) -> None:
+        """
+        Args:
+            path (str): file to write, replaced if it exists
+            palette (Palette): palette the frame buffer ids refer to
+            keyframe_interval (int): maximum number of deltas between keyframes
+        """
+        self.file = open(path, "wb")
+        self.file.write(MAGIC + bytes([VERSION]))
+        self.palette = palette
+        self.keyframe_interval = keyframe_interval
+        self.glyphs_written = 0
+        # color id 0, the terminal's default color, is in every palette
+        self.colors_written = 1
+        self.frames = 0
+        self.deltas_since_keyframe = 0
+        self.keyframes: list[tuple[int, int]] = []
+        self.compressor: zlib._Compress | None = None
+        self.start_time = time.perf_counter()
+
+    def write_record(self, record_type: bytes, payload: bytes) -> int:
+        """Write a record and return its offset in the file."""
+        offset = self.file.tell()
+        self.file.write(RECORD_HEADER.pack(record_type, len(payload)))
+        self.file.write(payload)
+        return offset
+
+    def write_palette(self) -> None:
+        """Write the glyphs and colors added to the palette since the previous call, if any.
+
+        The recorder runs on the render thread while the algorithm side may be adding a color, which appends its
+        foreground sequence before its background sequence. Only colors with both sequences are written, the
+        frames recorded so far cannot refer to the color being added.
+        """
+        palette = self.palette
+        glyph_count = len(palette.glyphs)
+        color_count = min(len(palette.fg_sequences), len(palette.bg_sequences))
+        if glyph_count == self.glyphs_written and color_count == self.colors_written:
+            return
+        additions = {
+            "glyphs": palette.glyphs[self.glyphs_written : glyph_count],
+            "fg": palette.fg_sequences[self.colors_written : color_count],
+            "bg": palette.bg_sequences[self.colors_written : color_count],
+        }
+        self.write_record(PALETTE, json.dumps(additions).encode())
+        self.glyphs_written, self.colors_written = glyph_count, color_count
+
+    def compress(self, body: bytes) -> bytes:
+        return self.compressor.compress(body) + self.compressor.flush(zlib.Z_SYNC_FLUSH)  # type: ignore[union-attr]
+
+    def record(self, frame: FrameBuffer, status: str | None, spans: list[tuple[int, int, int]] | None) -> None:
+        """Record an emitted frame.
+
+        Args:
+            frame (FrameBuffer): frame that was emitted
+            status (str | None): status text, None if the status line was left untouched
+            spans (list[tuple[int, int, int]] | None): (row, start column, end column) of the runs of cells emitted,
+            None if the whole frame was
+        """
+        self.write_palette()
+        elapsed = time.perf_counter() - self.start_time
+        if spans is None or self.compressor is None or self.deltas_since_keyframe >= self.keyframe_interval:
+            self.compressor = zlib.compressobj()
+            body = b"".join(
+                (
+                    KEYFRAME_HEADER.pack(elapsed, frame.width, frame.height),
+                    _encode_status(status),
+                    _array_bytes(frame.glyphs),
+                    _array_bytes(frame.fg),
+                    _array_bytes(frame.bg),
+                )
+            )
+            self.keyframes.append((self.frames, self.write_record(KEYFRAME, self.compress(body))))
+            self.deltas_since_keyframe = 0
+        else:
+            parts = [DELTA_HEADER.pack(elapsed, len(spans)), _encode_status(status)]
+            for row, start, end in spans:
+                start, end = row * frame.width + start, row * frame.width + end
+                parts.append(RUN.pack(start, end - start))
+                parts.append(_array_bytes(frame.glyphs[start:end]))
+                parts.append(_array_bytes(frame.fg[start:end]))
+                parts.append(_array_bytes(frame.bg[start:end]))
+            self.write_record(DELTA, self.compress(b"".join(parts)))
+            self.deltas_since_keyframe += 1
+        self.frames += 1
+
+    def close(self) -> None:
+        """Write the keyframe index and the final palette, and close the file."""
+        if self.file.closed:
+            return
+        self.write_palette()
+        index = {
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "palette": {
+                "glyphs": self.palette.glyphs[: self.glyphs_written],
+                "fg": self.palette.fg_sequences[1 : self.colors_written],
+                "bg": self.palette.bg_sequences[1 : self.colors_written],
+            },
+        }
+        offset = self.write_record(INDEX, zlib.compress(json.dumps(index).encode()))
+        self.file.write(TRAILER.pack(offset, TRAILER_MAGIC))
+        self.file.close()
+
+
+class RecordedFrame(NamedTuple):
+    """A frame read from a recording. frame is reused for the following frames, copy it to keep it."""
+
+    number: int
+    time: float
+    frame: FrameBuffer
+    status: str | None
+    # (start, end) frame indexes of the runs of cells changed since the previous frame, None for a keyframe
+    changed: list[tuple[int, int]] | None
+
+
+class Recording:
+    """Reads a recording written by FrameRecorder."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): recording file
+
+        Raises:
+            ValueError: the file is not a recording, or is of an unsupported version
+        """
+        self.file = open(path, "rb")
+        header = self.file.read(len(MAGIC) + 1)
+        if header[: len(MAGIC)] != MAGIC:
+            self.file.close()
+            raise ValueError(f"{path} is not a terminalmaze recording")
+        if header[len(MAGIC)] != VERSION:
+            self.file.close()
+            raise ValueError(f"{path} is a version {header[len(MAGIC)]} recording, version {VERSION} is supported")
+        self.palette = Palette()
+        self.frame_count = 0
+        self.keyframes: list[tuple[int, int]] = []
+        if not self.read_index():
+            self.scan()
+
+    def extend_palette(self, additions: dict[str, list[str]]) -> None:
+        self.palette.glyphs.extend(additions["glyphs"])
+        self.palette.fg_sequences.extend(additions["fg"])
+        self.palette.bg_sequences.extend(additions["bg"])
+
+    def read_index(self) -> bool:
+        """Load the keyframe index and palette written when the recording was closed.
+
+        Returns:
+            bool: False if the recording has no index
+        """
+        size = self.file.seek(0, 2)
+        if size < len(MAGIC) + 1 + TRAILER.size:
+            return False
+        self.file.seek(size - TRAILER.size)
+        offset, magic = TRAILER.unpack(self.file.read(TRAILER.size))
+        if magic != TRAILER_MAGIC:
+            return False
+        self.file.seek(offset)
+        record_type, length = RECORD_HEADER.unpack(self.file.read(RECORD_HEADER.size))
+        if record_type != INDEX:
+            return False
+        index = json.loads(zlib.decompress(self.file.read(length)))
+        self.frame_count = index["frames"]
+        self.keyframes = [(number, offset) for number, offset in index["keyframes"]]
+        self.extend_palette(index["palette"])
+        return True
+
+    def scan(self) -> None:
+        """Build the keyframe index and palette by reading every record, for recordings that were not closed."""
+        for record_type, offset, payload in self.records(len(MAGIC) + 1):
+            if record_type == PALETTE:
+                self.extend_palette(json.loads(payload))
+            elif record_type == KEYFRAME:
+                self.keyframes.append((self.frame_count, offset))
+                self.frame_count += 1
+            elif record_type == DELTA:
+                self.frame_count += 1
+
+    def records(self, offset: int) -> Iterator[tuple[bytes, int, bytes]]:
+        """Yield the type, offset and payload of the records from offset up to the index or a truncated record."""
+        self.file.seek(offset)
+        while True:
+            header = self.file.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            record_type, length = RECORD_HEADER.unpack(header)
+            payload = self.file.read(length)
+            if record_type == INDEX or len(payload) < length:
+                return
+            yield record_type, offset, payload
+            offset += RECORD_HEADER.size + length
+
+    def frames(self, start: int = 0) -> Iterator[RecordedFrame]:
+        """Yield the frames from frame number start, decoding from the keyframe before it.
+
+        Args:
+            start (int): number of the first frame, 0 to frame_count - 1
+
+        Raises:
+            IndexError: start is not the number of a recorded frame
+        """
+        if not 0 <= start < self.frame_count:
+            raise IndexError(f"frame {start} is not in the recording, it has {self.frame_count} frames")
+        keyframe = bisect_right(self.keyframes, (start, float("inf"))) - 1
+        number, offset = self.keyframes[keyframe]
+        decompressor = zlib.decompressobj()
+        frame = FrameBuffer(0, 0)
+        for record_type, _, payload in self.records(offset):
+            if record_type == KEYFRAME:
+                decompressor = zlib.decompressobj()
+                body = decompressor.decompress(payload)
+                elapsed, width, height = KEYFRAME_HEADER.unpack_from(body)
+                status, position = _decode_status(body, KEYFRAME_HEADER.size)
+                size = width * height * 2
+                frame = FrameBuffer(width, height)
+                frame.glyphs = _bytes_array(body[position : position + size])
+                frame.fg = _bytes_array(body[position + size : position + size * 2])
+                frame.bg = _bytes_array(body[position + size * 2 : position + size * 3])
+                changed = None
+            elif record_type == DELTA:
+                body = decompressor.decompress(payload)
+                elapsed, run_count = DELTA_HEADER.unpack_from(body)
+                status, position = _decode_status(body, DELTA_HEADER.size)
+                changed = []
+                for _ in range(run_count):
+                    run_start, length = RUN.unpack_from(body, position)
+                    position += RUN.size
+                    run_end = run_start + length
+                    size = length * 2
+                    frame.glyphs[run_start:run_end] = _bytes_array(body[position : position + size])
+                    frame.fg[run_start:run_end] = _bytes_array(body[position + size : position + size * 2])
+                    frame.bg[run_start:run_end] = _bytes_array(body[position + size * 2 : position + size * 3])
+                    position += size * 3
+                    changed.append((run_start, run_end))
+            else:
+                continue
+            if number >= start:
+                yield RecordedFrame(number, elapsed, frame, status, changed)
+            number += 1
+
+    def close(self) -> None:
+        self.file.close()
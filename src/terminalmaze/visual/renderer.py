@@ -0,0 +1,214 @@
+"""Serializes visual grid frames into terminal output, writing only what changed since the last frame."""
+
+from collections.abc import Iterable
+
+import terminalmaze.visual.colorterm as colorterm
+from terminalmaze.visual import ansitools
+from terminalmaze.visual.framebuffer import FrameBuffer, Palette
+from terminalmaze.visual.recording import FrameRecorder
+
+Span = tuple[int, int, int]
+
+
+class DiffRenderer:
+    """Keeps the previously emitted frame and writes only the cells that changed.
+
+    The maze is anchored by the DEC saved cursor position, which sits two lines below the last maze row (one line
+    for the status text, one blank). Changed spans are positioned relative to that anchor. When more than
+    full_redraw_threshold of the cells changed, the whole frame is written instead, as the cursor movement
+    needed for scattered spans costs more than rewriting the rows.
+    """
+
+    def __init__(self, palette: Palette, full_redraw_threshold: float = 0.3) -> None:
+        """
+        Args:
+            palette (Palette): palette the frame buffer ids refer to
+            full_redraw_threshold (float): fraction of changed cells above which the whole frame is redrawn
+        """
+        self.palette = palette
+        self.full_redraw_threshold = full_redraw_threshold
+        self.previous_frame: FrameBuffer | None = None
+        self.previous_status: str | None = None
+        self.frame_bytes = 0
+        self.total_bytes = 0
+        self.frames = 0
+        self.full_redraws = 0
+        # records every emitted frame when set
+        self.recorder: FrameRecorder | None = None
+
+    def changed_spans(self, frame: FrameBuffer, candidates: Iterable[int] | None = None) -> list[Span] | None:
+        """Find the runs of cells that differ from the previous frame.
+
+        Args:
+            frame (FrameBuffer): frame to compare
+            candidates (Iterable[int] | None): indexes of the only cells that may have changed, defaults to all
+
+        Returns:
+            list[Span] | None: (row, start column, end column) for each run of changed cells, None if there is no
+            previous frame or it has a different shape
+        """
+        previous_frame = self.previous_frame
+        if previous_frame is None or (frame.width, frame.height) != (previous_frame.width, previous_frame.height):
+            return None
+        if candidates is None:
+            return self._compare_rows(frame, previous_frame)
+        return self._compare_candidates(frame, previous_frame, candidates)
+
+    @staticmethod
+    def _compare_rows(frame: FrameBuffer, previous_frame: FrameBuffer) -> list[Span]:
+        """Compare every row of the frames, skipping equal rows with array comparisons."""
+        spans: list[Span] = []
+        glyphs, fg, bg = frame.glyphs, frame.fg, frame.bg
+        previous_glyphs, previous_fg, previous_bg = previous_frame.glyphs, previous_frame.fg, previous_frame.bg
+        if glyphs == previous_glyphs and fg == previous_fg and bg == previous_bg:
+            return spans
+        width = frame.width
+        for row in range(frame.height):
+            offset = row * width
+            row_end = offset + width
+            if (
+                glyphs[offset:row_end] == previous_glyphs[offset:row_end]
+                and fg[offset:row_end] == previous_fg[offset:row_end]
+                and bg[offset:row_end] == previous_bg[offset:row_end]
+            ):
+                continue
+            run_start = -1
+            for i in range(offset, row_end):
+                if glyphs[i] != previous_glyphs[i] or fg[i] != previous_fg[i] or bg[i] != previous_bg[i]:
+                    if run_start < 0:
+                        run_start = i - offset
+                elif run_start >= 0:
+                    spans.append((row, run_start, i - offset))
+                    run_start = -1
+            if run_start >= 0:
+                spans.append((row, run_start, width))
+        return spans
+
+    @staticmethod
+    def _compare_candidates(frame: FrameBuffer, previous_frame: FrameBuffer, candidates: Iterable[int]) -> list[Span]:
+        """Compare only the candidate cells of the frames."""
+        spans: list[Span] = []
+        glyphs, fg, bg = frame.glyphs, frame.fg, frame.bg
+        previous_glyphs, previous_fg, previous_bg = previous_frame.glyphs, previous_frame.fg, previous_frame.bg
+        changed = sorted(
+            i
+            for i in candidates
+            if glyphs[i] != previous_glyphs[i] or fg[i] != previous_fg[i] or bg[i] != previous_bg[i]
+        )
+        width = frame.width
+        run_row = run_start = run_end = -1
+        for i in changed:
+            row, column = divmod(i, width)
+            if row == run_row and column == run_end:
+                run_end += 1
+                continue
+            if run_row >= 0:
+                spans.append((run_row, run_start, run_end))
+            run_row, run_start, run_end = row, column, column + 1
+        if run_row >= 0:
+            spans.append((run_row, run_start, run_end))
+        return spans
+
+    def update_previous_frame(self, frame: FrameBuffer, spans: list[Span] | None) -> None:
+        """Record the emitted cells as the previous frame.
+
+        Args:
+            frame (FrameBuffer): frame that was emitted
+            spans (list[Span] | None): runs of cells that were emitted, None if the whole frame was
+        """
+        if spans is None:
+            self.previous_frame = frame.copy()
+            return
+        previous_frame = self.previous_frame
+        for row, start, end in spans:
+            offset = row * frame.width
+            start, end = offset + start, offset + end
+            previous_frame.glyphs[start:end] = frame.glyphs[start:end]  # type: ignore[union-attr]
+            previous_frame.fg[start:end] = frame.fg[start:end]  # type: ignore[union-attr]
+            previous_frame.bg[start:end] = frame.bg[start:end]  # type: ignore[union-attr]
+
+    def full_output(self, frame: FrameBuffer, status: str | None) -> str:
+        """Serialize the whole frame and status text.
+
+        Args:
+            frame (FrameBuffer): frame to serialize
+            status (str | None): status text, None to leave the status line untouched
+
+        Returns:
+            str: terminal output
+        """
+        output = (
+            ansitools.DEC_RESTORE_CURSOR_POSITION()
+            + ansitools.DEC_SAVE_CURSOR_POSITION()
+            + ansitools.MOVE_CURSOR_UP(frame.height + 2)
+            + "\n".join(frame.serialize_row(row, self.palette) for row in range(frame.height))
+        )
+        if status is not None:
+            output += f"\n{colorterm.RESET}{status}"
+        return output
+
+    def diff_output(self, frame: FrameBuffer, spans: list[Span], status: str | None) -> str:
+        """Serialize the changed spans, and the status text if it changed.
+
+        Args:
+            frame (FrameBuffer): frame to serialize
+            spans (list[Span]): changed runs of cells from changed_spans
+            status (str | None): status text, None to leave the status line untouched
+
+        Returns:
+            str: terminal output
+        """
+        lines_above_anchor = frame.height + 2
+        output = []
+        current_row = -1
+        for row, start, end in spans:
+            if row != current_row:
+                output.append(ansitools.DEC_RESTORE_CURSOR_POSITION())
+                output.append(ansitools.MOVE_CURSOR_UP(lines_above_anchor - row))
+                current_row = row
+            output.append(ansitools.MOVE_CURSOR_TO_COLUMN(start + 1))
+            output.append(frame.serialize_row(row, self.palette, start, end))
+        if status is not None and status != self.previous_status:
+            output.append(ansitools.DEC_RESTORE_CURSOR_POSITION())
+            output.append(ansitools.MOVE_CURSOR_UP(2))
+            output.append(ansitools.MOVE_CURSOR_TO_COLUMN(1))
+            output.append(f"{colorterm.RESET}{status}")
+        return "".join(output)
+
+    def render(
+        self,
+        frame: FrameBuffer,
+        status: str | None = None,
+        full: bool = False,
+        candidates: Iterable[int] | None = None,
+    ) -> str:
+        """Serialize a frame, writing only the differences from the previous frame where that is cheaper.
+
+        Args:
+            frame (FrameBuffer): frame to serialize
+            status (str | None): status text, None to leave the status line untouched
+            full (bool): force a full redraw
+            candidates (Iterable[int] | None): indexes of the only cells that may have changed since the previous
+            frame, defaults to all
+
+        Returns:
+            str: terminal output
+        """
+        spans = None if full else self.changed_spans(frame, candidates)
+        if spans is not None:
+            changed_cells = sum(end - start for _, start, end in spans)
+            if changed_cells > frame.width * frame.height * self.full_redraw_threshold:
+                spans = None
+        if spans is None:
+            output = self.full_output(frame, status)
+            self.full_redraws += 1
+        else:
+            output = self.diff_output(frame, spans, status)
+        if self.recorder is not None:
+            self.recorder.record(frame, status, spans)
+        self.update_previous_frame(frame, spans)
+        self.previous_status = status
+        self.frame_bytes = len(output.encode())
+        self.total_bytes += self.frame_bytes
+        self.frames += 1
+        return output
@@ -0,0 +1,102 @@
+"""Draws the maze on its own thread at a target frame rate, independent of how fast the algorithm steps."""
+
+import sys
+import threading
+import time
+from typing import TextIO
+
+from terminalmaze.visual.framebuffer import FrameBuffer
+from terminalmaze.visual.renderer import DiffRenderer
+
+
+class RenderThread(threading.Thread):
+    """Renders the most recently published frame at up to fps frames per second.
+
+    The algorithm side publishes the composited frame after every step while holding lock, which it also holds
+    while compositing. On each tick the thread copies the latest frame under the lock and serializes the copy
+    outside it. Frames published between two ticks are dropped, the cells they changed are accumulated so the
+    diff renderer still compares every cell that may differ from what is on screen.
+    """
+
+    def __init__(self, renderer: DiffRenderer, fps: float, output: TextIO | None = None) -> None:
+        """
+        Args:
+            renderer (DiffRenderer): renderer to serialize frames with, used only by this thread while it runs
+            fps (float): target frames per second
+            output (TextIO | None): stream to write to, defaults to sys.stdout at the time of each write
+        """
+        super().__init__(name="terminalmaze-render", daemon=True)
+        self.renderer = renderer
+        self.frame_interval = 1 / fps
+        self.output = output
+        self.lock = threading.Condition()
+        self.frame: FrameBuffer | None = None
+        self.status: str | None = None
+        self.changed_cells: set[int] = set()
+        self.pending = False
+        self.stopping = False
+        self.frames_published = 0
+        self.frames_rendered = 0
+
+    @property
+    def frames_dropped(self) -> int:
+        """Number of published frames replaced by a later frame before they were rendered."""
+        return self.frames_published - self.frames_rendered
+
+    def publish(self, frame: FrameBuffer, status: str | None, changed_cells: set[int]) -> None:
+        """Make a frame the latest frame. Must be called with lock held, frame is read by the thread under it.
+
+        Args:
+            frame (FrameBuffer): composited frame, copied by the thread when it renders
+            status (str | None): status text, None to leave the status line untouched
+            changed_cells (set[int]): indexes of the cells changed since the previously published frame
+        """
+        self.frame = frame
+        self.status = status
+        self.changed_cells |= changed_cells
+        self.pending = True
+        self.frames_published += 1
+        self.lock.notify()
+
+    def take_frame(self) -> tuple[FrameBuffer, str | None, set[int]] | None:
+        """Wait for a published frame and take a copy of it.
+
+        Returns:
+            tuple[FrameBuffer, str | None, set[int]] | None: frame, status text and changed cells, None once
+            stop was called
+        """
+        with self.lock:
+            while not self.pending and not self.stopping:
+                self.lock.wait()
+            if self.stopping:
+                return None
+            frame = self.frame.copy()  # type: ignore[union-attr]
+            changed_cells, self.changed_cells = self.changed_cells, set()
+            self.pending = False
+            return frame, self.status, changed_cells
+
+    def run(self) -> None:
+        next_frame_time = time.perf_counter()
+        while True:
+            snapshot = self.take_frame()
+            if snapshot is None:
+                return
+            frame, status, changed_cells = snapshot
+            output = self.output if self.output is not None else sys.stdout
+            output.write(self.renderer.render(frame, status, candidates=changed_cells))
+            output.flush()
+            self.frames_rendered += 1
+            next_frame_time = max(next_frame_time + self.frame_interval, time.perf_counter())
+            with self.lock:
+                while not self.stopping:
+                    remaining = next_frame_time - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self.lock.wait(remaining)
+
+    def stop(self) -> None:
+        """Stop the thread and wait for it to finish writing. A frame not yet rendered is dropped."""
+        with self.lock:
+            self.stopping = True
+            self.lock.notify()
+        self.join()
@@ -0,0 +1,143 @@
+"""A window onto the visual grid for mazes larger than the terminal. Only the cells inside the window are composited
+and drawn, so the cost of a frame depends on the terminal size rather than the maze size."""
+
+import time
+from collections.abc import Iterable
+
+# key : (rows, columns) to pan by, in quarters of the window size
+PAN_KEYS: dict[str, tuple[int, int]] = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+    "k": (-1, 0),
+    "j": (1, 0),
+    "h": (0, -1),
+    "l": (0, 1),
+}
+FOLLOW_KEY = "f"
+
+
+class Viewport:
+    """Window of width by height terminal cells onto a visual grid of grid_width by grid_height cells.
+
+    The window follows a focus point, normally the algorithm's working cell, and is recentered on it when it comes
+    within a quarter of the window size of an edge, at most once every follow_interval seconds. Recentering instead of
+    scrolling along keeps full redraws rare, the interval keeps algorithms that work all over the maze from moving
+    the window every frame. Panning stops the following until it is resumed. Every move sets moved, the owner
+    recomposites the whole window and clears it.
+    """
+
+    def __init__(
+        self,
+        grid_width: int,
+        grid_height: int,
+        width: int,
+        height: int,
+        top: int = 0,
+        left: int = 0,
+        follow_interval: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            grid_width (int): columns of the visual grid
+            grid_height (int): rows of the visual grid
+            width (int): columns of the window, at most grid_width are used
+            height (int): rows of the window, at most grid_height are used
+            top (int): first visual grid row in the window
+            left (int): first visual grid column in the window
+            follow_interval (float): minimum seconds between two moves made to follow the focus point
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.width = max(1, min(width, grid_width))
+        self.height = max(1, min(height, grid_height))
+        self.top = 0
+        self.left = 0
+        self.following = True
+        self.follow_interval = follow_interval
+        self.last_follow_time = float("-inf")
+        self.moved = True
+        self.move_to(top, left)
+
+    def move_to(self, top: int, left: int) -> None:
+        """Move the top left corner of the window, keeping the window inside the visual grid.
+
+        Args:
+            top (int): first visual grid row in the window
+            left (int): first visual grid column in the window
+        """
+        top = max(0, min(top, self.grid_height - self.height))
+        left = max(0, min(left, self.grid_width - self.width))
+        if (top, left) != (self.top, self.left):
+            self.top, self.left = top, left
+            self.moved = True
+
+    def follow(self, row: int, column: int) -> None:
+        """Recenter the window on the focus point if it is near an edge of the window, unless the window was panned.
+
+        Args:
+            row (int): visual grid row of the focus point
+            column (int): visual grid column of the focus point
+        """
+        if not self.following:
+            return
+        now = time.monotonic()
+        if now - self.last_follow_time < self.follow_interval:
+            return
+        margin_rows, margin_columns = self.height // 4, self.width // 4
+        if not (
+            self.top + margin_rows <= row < self.top + self.height - margin_rows
+            and self.left + margin_columns <= column < self.left + self.width - margin_columns
+        ):
+            self.move_to(row - self.height // 2, column - self.width // 2)
+            self.last_follow_time = now
+
+    def press(self, key: str) -> None:
+        """Pan the window a quarter of its size for an arrow or h, j, k, l key, resume following for FOLLOW_KEY.
+        Other keys are ignored.
+
+        Args:
+            key (str): key name from terminalmaze.visual.keyboard.KeyReader
+        """
+        if key == FOLLOW_KEY:
+            self.following = True
+            return
+        direction = PAN_KEYS.get(key)
+        if direction is None:
+            return
+        self.following = False
+        rows, columns = direction
+        self.move_to(self.top + rows * max(1, self.height // 4), self.left + columns * max(1, self.width // 4))
+
+    def indexes(self) -> list[int]:
+        """Return the visual grid index of every cell in the window, row by row."""
+        grid_width, left, width = self.grid_width, self.left, self.width
+        return [
+            row * grid_width + column
+            for row in range(self.top, self.top + self.height)
+            for column in range(left, left + width)
+        ]
+
+    def visible(self, indexes: Iterable[int]) -> list[tuple[int, int]]:
+        """Pair each visual grid index inside the window with its index in the window, dropping the others.
+
+        Args:
+            indexes (Iterable[int]): visual grid indexes
+
+        Returns:
+            list[tuple[int, int]]: (visual grid index, window index) pairs
+        """
+        grid_width, top, left, width, height = self.grid_width, self.top, self.left, self.width, self.height
+        pairs = []
+        for index in indexes:
+            row, column = divmod(index, grid_width)
+            row -= top
+            column -= left
+            if 0 <= row < height and 0 <= column < width:
+                pairs.append((index, row * width + column))
+        return pairs
+
+    def describe(self) -> str:
+        """Return the maze cell at the top left of the window and whether it follows the working cell."""
+        return f"({self.top // 2},{self.left // 2}) {'following' if self.following else 'panned'}"
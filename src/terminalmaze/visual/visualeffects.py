@@ -1,10 +1,9 @@
-from typing import DefaultDict
-from types import SimpleNamespace
+from collections import Counter
+from collections.abc import Iterable, Iterator
 
 from terminalmaze.config import AnimationModel, ModifyCellModel, RandomGroupModel
 from terminalmaze.resources.cell import Cell
-
-GroupType = dict[int, list[Cell]] | DefaultDict[int, list[Cell]] | dict[int, set[Cell]] | DefaultDict[int, set[Cell]]
+from terminalmaze.visual.animation import AnimatingCells
 
 
 class Effect:
@@ -46,30 +45,84 @@ class ModifyMultipleCells(Effect):
         self.verbosity: list[int] = theme_data.verbosity
 
 
+class ModifyTrackedCells(Effect):
+    """Color a changing collection of cells the same color. Cells are added and removed through the effect, which
+    records the changes so the visual only repaints the cells changed since the last frame. A cell added more than
+    once stays colored until it has been removed as many times."""
+
+    def __init__(self, theme_data: ModifyCellModel):
+        super().__init__(theme_data)
+        self.cells: Counter[Cell] = Counter()
+        self.changed_cells: set[Cell] = set()
+        self.color: int | str = theme_data.color
+        self.character: str = theme_data.character
+        self.verbosity: list[int] = theme_data.verbosity
+
+    def add(self, cell: Cell) -> None:
+        if not self.cells[cell]:
+            self.changed_cells.add(cell)
+        self.cells[cell] += 1
+
+    def extend(self, cells: Iterable[Cell]) -> None:
+        for cell in cells:
+            self.add(cell)
+
+    def remove(self, cell: Cell) -> None:
+        """Remove one occurrence of the cell, raises KeyError if the cell is not in the effect."""
+        if cell not in self.cells:
+            raise KeyError(cell)
+        count = self.cells[cell]
+        if count > 1:
+            self.cells[cell] = count - 1
+            return
+        del self.cells[cell]
+        self.changed_cells.add(cell)
+
+    def clear(self) -> None:
+        self.changed_cells.update(self.cells)
+        self.cells.clear()
+
+    def __contains__(self, cell: Cell) -> bool:
+        return cell in self.cells
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter(self.cells)
+
+
 class RandomColorGroup(Effect):
     """Color groups of cells with randomly chosen colors. Colors will be
-    assigned to groups and persist between show() calls."""
+    assigned to groups and persist between show() calls. The algorithm reports every cell that joins a group,
+    including the cells of a group merged into another, so the visual only repaints cells whose group changed."""
 
     def __init__(self, theme_data: RandomGroupModel):
         super().__init__(theme_data)
-        self.groups: GroupType
+        self.cell_groups: dict[Cell, int] = dict()
+        self.changed_cells: dict[Cell, int] = dict()
         self.character: str = theme_data.character
         self.verbosity: list[int] = theme_data.verbosity
 
+    def assign(self, group: int, cells: Iterable[Cell]) -> None:
+        """Record that the cells now belong to the group."""
+        for cell in cells:
+            self.cell_groups[cell] = group
+            self.changed_cells[cell] = group
+
 
 class Animation(Effect):
     def __init__(self, theme_data: AnimationModel):
         """Color cells with animating colors and characters."""
         super().__init__(theme_data)
         self.cells: list[Cell | None] = list()
-        self.animating: dict[tuple[int, int], SimpleNamespace] = dict()
+        self.animating = AnimatingCells()
         self.cycles: list[int] | int = theme_data.cycles
         self.animation_details: list[list[list[str | int] | str | int] | None] = theme_data.animation_details
-        self.animation_completed_passages: set[tuple[int, int]] = set()
         self.verbosity: list[int] = theme_data.verbosity
 
     def __lt__(self, other: "Effect"):
         return self.layer < other.layer
 
 
-VisualEffect = ModifySingleCell | ModifyMultipleCells | RandomColorGroup | Animation
+VisualEffect = ModifySingleCell | ModifyMultipleCells | ModifyTrackedCells | RandomColorGroup | Animation
@@ -3,13 +3,23 @@ import shutil
 import sys
 import time
 from collections import defaultdict
-from types import SimpleNamespace
+from collections.abc import Iterable
 
-import terminalmaze.visual.colorterm as colorterm
 import terminalmaze.visual.visualeffects as ve
 from terminalmaze.config import MAZE_THEME
-from terminalmaze.resources.cell import Cell
+from terminalmaze.resources.cell import LINKED, OFFSET_BITS, Cell
 from terminalmaze.visual import ansitools
+from terminalmaze.visual.animation import AnimationTimeline
+from terminalmaze.visual.framebuffer import FrameBuffer, Palette
+from terminalmaze.visual.keyboard import KeyReader
+from terminalmaze.visual.minimap import MINIMAPS, Minimap
+from terminalmaze.visual.recording import FrameRecorder
+from terminalmaze.visual.renderer import DiffRenderer
+from terminalmaze.visual.renderthread import RenderThread
+from terminalmaze.visual.viewport import Viewport
+
+# visual grid index : (glyph id, foreground color id) painted by one effect, None keeps the value below
+Layer = dict[int, tuple[int | None, int | None]]
 
 
 class Visual:
@@ -29,24 +39,105 @@ class Visual:
         """
         self.grid = grid
         self.theme = theme
-        self.wall = f"{colorterm.fg(theme.wall.color)}{theme.wall.character}{colorterm.RESET}"
-        self.path = f"{colorterm.fg(theme.path.color)}{theme.path.character}{colorterm.RESET}"
+        self.palette = Palette()
+        self.wall_glyph = self.palette.glyph_id(theme.wall.character)
+        self.wall_color = self.palette.color_id(theme.wall.color)
+        self.path_glyph = self.palette.glyph_id(theme.path.character)
+        self.path_color = self.palette.color_id(theme.path.color)
+        # group colors and animation variants are drawn from their own generator, the algorithms are seeded
+        # through the random module and drawing a maze must not change the maze a seed generates
+        self.random = random.Random()
         self.group_color_pool = list(range(0, 256))
         self.group_color_map: dict[int, int] = dict()
-        self.last_groups: ve.GroupType
-        self.visual_grid: list[list[str]] = list()
+        self.visual_grid = FrameBuffer(0, 0)
+        self.composited_grid: FrameBuffer | None = None
+        self.effect_layers: dict[ve.VisualEffect, Layer] = dict()
+        self.animation_timelines: dict[ve.Animation, AnimationTimeline] = dict()
+        self.base_changed_cells: set[int] = set()
+        self.changed_links: list[tuple[Cell, Cell]] = list()
+        self.dirty_cells: set[int] = set()
         self.passages: set[tuple[int, int]] = set()
         self.passage_map: defaultdict[tuple[int, int], set[tuple[int, int]]] = defaultdict(set)
+        self.renderer = DiffRenderer(self.palette)
+        self.target_fps = 0.0
+        # time spent in show, including the redraw delay, and the number of calls, read by the frame scheduler
+        self.render_time = 0.0
+        self.frames_rendered = 0
+        self.render_thread: RenderThread | None = None
+        self.viewport: Viewport | None = None
+        self.minimap: Minimap | None = None
+        self.key_reader = KeyReader()
+        self.terminal_prepared = False
         self.last_show_time = time.time()
         self.start_time = time.time()
         self.terminal_width, self.terminal_height = self._get_terminal_dimensions()
         self.prepare_visual()
-        self.prep_terminal()
 
     def prep_terminal(self) -> None:
+        """Make room for the frame below the cursor and save the cursor position the renderer draws relative to.
+        Done on the first show, so a viewport can be set up after the Visual is created."""
+        _, frame_height = self.frame_size()
         sys.stdout.write(ansitools.HIDE_CURSOR())
-        print("\n" * (len(self.visual_grid) + 2))
+        print("\n" * (frame_height + 2))
         sys.stdout.write(ansitools.DEC_SAVE_CURSOR_POSITION())
+        self.terminal_prepared = True
+
+    def frame_size(self) -> tuple[int, int]:
+        """Return the terminal columns and rows of the drawn frame: the visual grid, or the viewport window of it,
+        packed by the minimap if one is used."""
+        if self.viewport is not None:
+            width, height = self.viewport.width, self.viewport.height
+        else:
+            width, height = self.visual_grid.width, self.visual_grid.height
+        if self.minimap is not None:
+            return self.minimap.packed_size(width, height)
+        return width, height
+
+    def fits_terminal(self) -> bool:
+        """Return True if the whole maze and the status line fit in the terminal."""
+        width, height = self.visual_grid.width, self.visual_grid.height
+        if self.minimap is not None:
+            width, height = self.minimap.packed_size(width, height)
+        return width <= self.terminal_width and height + 2 <= self.terminal_height
+
+    def use_minimap(self, name: str) -> Minimap:
+        """Pack several visual grid cells into each terminal character. Set up before use_viewport, which sizes the
+        window in visual grid cells.
+
+        Args:
+            name (str): key of terminalmaze.visual.minimap.MINIMAPS, "halfblock" or "braille"
+
+        Returns:
+            Minimap: the minimap frames are packed with
+        """
+        self.minimap = MINIMAPS[name](self.palette, self.wall_color, self.path_color)
+        return self.minimap
+
+    def use_viewport(self, top_left: tuple[int, int] | None = None) -> Viewport:
+        """Draw only a window of the visual grid the size of the terminal. The window follows the algorithm's working
+        cell and can be panned with the arrow keys, or h, j, k and l, when stdin is a terminal. f resumes following.
+
+        Args:
+            top_left (tuple[int, int] | None): row, column of the maze cell at the top left of the window. The
+            window stays there until it is panned. Defaults to following the working cell from the start.
+
+        Returns:
+            Viewport: the viewport frames are drawn through
+        """
+        cell_width, cell_height = (self.minimap.cell_width, self.minimap.cell_height) if self.minimap else (1, 1)
+        viewport = Viewport(
+            self.visual_grid.width,
+            self.visual_grid.height,
+            self.terminal_width * cell_width,
+            max(1, self.terminal_height - 2) * cell_height,
+        )
+        if top_left is not None:
+            viewport.following = False
+            viewport.move_to(top_left[0] * 2, top_left[1] * 2)
+        self.viewport = viewport
+        self.composited_grid = None
+        self.key_reader.start()
+        return viewport
 
     def _get_terminal_dimensions(self) -> tuple[int, int]:
         """Gets the terminal dimensions.
@@ -85,30 +176,13 @@ class Visual:
         return row, column
 
     def prepare_visual(self) -> None:
-        """Prepare a visual representation of the maze graph."""
-        for row in self.grid.each_row(ignore_mask=True):
-            term_row = []
-            lower_row = []
-            for i, cell in enumerate(row):
-                term_row.append(self.wall)
-                cell_east = cell.neighbors.get("east")
-                cell_south = cell.neighbors.get("south")
-                if cell_east:
-                    term_row.append(self.wall)
-                if cell_south:
-                    lower_row.append(self.wall)
-                if i != len(row) - 1:
-                    lower_row.append(self.wall)
-            self.visual_grid.append(term_row)
-            self.visual_grid.append(lower_row)
-        self.visual_grid.pop(-1)  # remove extra lower row
-        for row in self.visual_grid:
-            row.insert(0, self.wall)
-            row.append(self.wall)
-        self.visual_grid.insert(0, [self.wall for _ in range(len(self.visual_grid[0]))])
-        self.visual_grid.append([self.wall for _ in range(len(self.visual_grid[0]))])
-
-    def get_group_color(self, group_id: int) -> str:
+        """Prepare a visual representation of the maze graph. Every cell and the walls around it start as wall,
+        the visual is 2 * width + 1 columns by 2 * height + 1 rows."""
+        self.visual_grid = FrameBuffer(
+            self.grid.width * 2 + 1, self.grid.height * 2 + 1, self.wall_glyph, self.wall_color, Palette.NO_COLOR
+        )
+
+    def get_group_color(self, group_id: int) -> int:
         """If the group id has an assigned color, return the assigned color, else get a random
         color from the color pool, assign it to the group, and return the color int.
 
@@ -116,19 +190,19 @@ class Visual:
             group_id (int): id for cell group
 
         Returns:
-            str: colorterm.fg() color string
+            int: xterm color code
         """
         color = self.group_color_map.get(group_id)
-        if color:
-            return colorterm.fg(color)
+        if color is not None:
+            return color
 
-        color = self.group_color_pool.pop(random.randint(0, len(self.group_color_pool) - 1))
+        color = self.group_color_pool.pop(self.random.randint(0, len(self.group_color_pool) - 1))
         self.group_color_map[group_id] = color
 
         if not self.group_color_pool:
             self.group_color_pool = list(range(0, 256))
 
-        return colorterm.fg(self.group_color_map[group_id])
+        return self.group_color_map[group_id]
 
     def modify_link_state(self, cell_a: Cell, cell_b: Cell, unlink=False) -> None:
         """Replace characters for linked cells and the wall between them.
@@ -139,9 +213,11 @@ class Visual:
         cell_b : Cell being (un)linked to
         unlink : bool
         """
-        character = self.path
+        glyph, color = self.path_glyph, self.path_color
         if unlink:
-            character = self.wall
+            glyph, color = self.wall_glyph, self.wall_color
+        visual_grid = self.visual_grid
+        self.changed_links.append((cell_a, cell_b))
 
         # replace character on cells with wall/path for (un)linked cells
         cell_a_translated = self.translate_cell_coords(cell_a)
@@ -151,219 +227,231 @@ class Visual:
             cell_b: cell_b_translated,
         }.items():
             row, column = visual_coordinates
-            if not cell.links:
-                self.visual_grid[row][column] = self.wall
+            index = row * visual_grid.width + column
+            if not self.grid.state[cell.id] & LINKED:
+                visual_grid.glyphs[index], visual_grid.fg[index] = self.wall_glyph, self.wall_color
             else:
-                self.visual_grid[row][column] = self.path
-
-        # replace character between cells
-        offsets = {"north": (-1, 0), "south": (1, 0), "west": (0, -1), "east": (0, 1)}
-        for direction, offset in offsets.items():
-            row_offset, column_offset = offset
-            cell_row, cell_column = cell_a_translated
-
-            if cell_b is cell_a.neighbors[direction]:
-                passage_row = cell_row + row_offset
-                passage_column = cell_column + column_offset
-                self.visual_grid[passage_row][passage_column] = character
-                if unlink:
-                    self.passage_map[cell_a_translated].discard((passage_row, passage_column))
-                    self.passage_map[cell_b_translated].discard((passage_row, passage_column))
-                    self.passages.discard((passage_row, passage_column))
-                else:
-                    self.passage_map[(cell_row, cell_column)].add((passage_row, passage_column))
-                    self.passages.add((passage_row, passage_column))
-                return
-
-    def add_visual_effects(self, visual_effects: dict[str, ve.VisualEffect], verbosity: int) -> list[list[str]]:
+                visual_grid.glyphs[index], visual_grid.fg[index] = self.path_glyph, self.path_color
+            self.base_changed_cells.add(index)
+
+        # replace character between cells, the passage is one visual cell from cell_a towards cell_b
+        row_offset, column_offset = cell_b.row - cell_a.row, cell_b.column - cell_a.column
+        if (row_offset, column_offset) not in OFFSET_BITS:
+            return
+        cell_row, cell_column = cell_a_translated
+        passage_row = cell_row + row_offset
+        passage_column = cell_column + column_offset
+        index = passage_row * visual_grid.width + passage_column
+        visual_grid.glyphs[index], visual_grid.fg[index] = glyph, color
+        self.base_changed_cells.add(index)
+        if unlink:
+            self.passage_map[cell_a_translated].discard((passage_row, passage_column))
+            self.passage_map[cell_b_translated].discard((passage_row, passage_column))
+            self.passages.discard((passage_row, passage_column))
+        else:
+            self.passage_map[(cell_row, cell_column)].add((passage_row, passage_column))
+            self.passages.add((passage_row, passage_column))
+
+    def draw_links(self) -> None:
+        """Draw the links already present in the grid. Used when the Visual is created after the maze was
+        generated headless."""
+        for cell in self.grid.each_cell(ignore_mask=True):
+            for neighbor in cell.links:
+                if neighbor.id > cell.id:
+                    self.modify_link_state(cell, neighbor)
+
+    def add_visual_effects(self, visual_effects: dict[str, ve.VisualEffect], verbosity: int) -> FrameBuffer:
         """Apply color to cells and passage_map to show logic.
 
+        Every effect paints into its own layer. The composited grid is kept between frames and only the cells
+        whose layers or links changed since the previous frame are recomposited, by applying the layers over
+        visual_grid in effect layer order. Tracked cell, group and animation effects keep their layer between
+        frames and only repaint the cells added, removed, regrouped or whose animation frame changed. The
+        recomposited cells are left in dirty_cells for the renderer.
+
         Args:
             visual_effects (dict[str, ve.VisualEffect]): Effects for cells to be colorterm
             verbosity : Determines which effects are applied
 
         Returns:
-            list[list[str]]: visual grid with colorterm cells
+            FrameBuffer: visual grid with colorterm cells
         """
-        colored_visual_grid = [line.copy() for line in self.visual_grid]
-        pending_effects = sorted(visual_effects.values())
-        while pending_effects:
-            current_effect = pending_effects.pop(0)
+        composited_grid = self.composited_grid
+        dirty_cells = self.base_changed_cells
+        viewport = self.viewport
+        if composited_grid is None:
+            if viewport is None:
+                composited_grid = self.composited_grid = self.visual_grid.copy()
+            else:
+                composited_grid = self.composited_grid = FrameBuffer(viewport.width, viewport.height)
+                viewport.moved = True
+            dirty_cells = set()
+        self.base_changed_cells = set()
+        changed_links, self.changed_links = self.changed_links, list()
+
+        layers: dict[ve.VisualEffect, Layer] = dict()
+        for current_effect in sorted(visual_effects.values()):
             if verbosity not in current_effect.verbosity:
                 continue
+            previous_layer = self.effect_layers.get(current_effect)
+
+            if isinstance(current_effect, (ve.ModifyTrackedCells, ve.RandomColorGroup, ve.Animation)):
+                layer = previous_layer if previous_layer is not None else dict()
+                repaint = previous_layer is None
+                if isinstance(current_effect, ve.ModifyTrackedCells):
+                    dirty_cells |= self.color_tracked_cells(layer, current_effect, changed_links, repaint)
+                elif isinstance(current_effect, ve.RandomColorGroup):
+                    dirty_cells |= self.color_cell_groups(layer, current_effect, changed_links, repaint)
+                else:
+                    dirty_cells |= self.animate_cells(layer, current_effect, changed_links, repaint)
+                layers[current_effect] = layer
+                continue
 
+            layer = dict()
             if isinstance(current_effect, ve.ModifySingleCell):
-                colored_visual_grid = self.color_single_cell(colored_visual_grid, current_effect)
+                self.color_single_cell(layer, current_effect)
 
             elif isinstance(current_effect, ve.ModifyMultipleCells):
-                colored_visual_grid = self.color_multiple_cells(colored_visual_grid, current_effect)
-
-            elif isinstance(current_effect, ve.RandomColorGroup):
-                if current_effect.groups:
-                    self.last_groups = current_effect.groups
-                    colored_visual_grid = self.color_cell_groups(colored_visual_grid)
+                self.color_multiple_cells(layer, current_effect)
 
-            elif isinstance(current_effect, ve.Animation):
-                colored_visual_grid = self.animate_cells(colored_visual_grid, current_effect)
+            layers[current_effect] = layer
+            if previous_layer is None:
+                dirty_cells.update(layer)
+            else:
+                dirty_cells.update(previous_layer.keys() - layer.keys())
+                dirty_cells.update(index for index, value in layer.items() if previous_layer.get(index) != value)
+
+        for effect, layer in self.effect_layers.items():
+            if effect not in layers:
+                dirty_cells.update(layer)
+        self.effect_layers = layers
+        if viewport is None:
+            self.composite(composited_grid, ((index, index) for index in dirty_cells), list(layers.values()))
+            self.dirty_cells = dirty_cells
+            return composited_grid
+
+        if viewport.moved:
+            visible = viewport.visible(viewport.indexes())
+            viewport.moved = False
+        else:
+            visible = viewport.visible(dirty_cells)
+        self.composite(composited_grid, visible, list(layers.values()))
+        self.dirty_cells = {target for _, target in visible}
+        return composited_grid
 
-        return colored_visual_grid
+    def composite(
+        self, composited_grid: FrameBuffer, cells: Iterable[tuple[int, int]], layers: list[Layer]
+    ) -> None:
+        """Recompute the given cells of the composited grid from visual_grid and the effect layers. Cells painted
+        by any layer are drawn on the wall color background.
 
-    def animate_cells(self, colored_visual_grid: list[list[str]], visual_effect: ve.Animation) -> list[list[str]]:
+        Args:
+            composited_grid (FrameBuffer): grid to update, the visual grid or a viewport window of it
+            cells (Iterable[tuple[int, int]]): visual grid index to recompute and its index in composited_grid
+            layers (list[Layer]): effect layers, lowest first
+        """
+        base_glyphs, base_fg, base_bg = self.visual_grid.glyphs, self.visual_grid.fg, self.visual_grid.bg
+        glyphs, fg, bg = composited_grid.glyphs, composited_grid.fg, composited_grid.bg
+        wall_color = self.wall_color
+        for index, target in cells:
+            cell_glyph, cell_fg, cell_bg = base_glyphs[index], base_fg[index], base_bg[index]
+            for layer in layers:
+                value = layer.get(index)
+                if value is not None:
+                    if value[0] is not None:
+                        cell_glyph = value[0]
+                    if value[1] is not None:
+                        cell_fg = value[1]
+                    cell_bg = wall_color
+            glyphs[target], fg[target], bg[target] = cell_glyph, cell_fg, cell_bg
+
+    def animate_cells(
+        self,
+        layer: Layer,
+        visual_effect: ve.Animation,
+        changed_links: list[tuple[Cell, Cell]],
+        repaint: bool = False,
+    ) -> set[int]:
         """
-        Modify cells in the grid to the character and color specified in the animation visual effect. Track
-        cells being animated, including passage_map, and frame position.
+        Play the frame of every cell the animation is animating, starting the animation on the cells added since
+        the previous frame. The passage between two linked cells starts animating once both cells are animating,
+        a passage that completed its animation is not animated again by the effect.
+
+        The animation is compiled into an AnimationTimeline the first time it is played. Like tracked cell effects
+        the layer is kept between frames, only cells whose paint changed are written.
 
         Parameters
         ----------
-        colored_visual_grid : List[List[str]] :
+        layer : Layer : Layer the effect painted in the previous frame
         visual_effect : terminalmaze.visual.visualeffects.Animation
+        changed_links : list[tuple[Cell, Cell]] : Cells (un)linked since the previous frame
+        repaint : bool : Paint every animating cell into an empty layer
 
         Returns
         -------
-        List[List[str]] : Maze grid with color and character changes applied.
-        """
-
-        def get_value_at_animation_state_index(state_index: int, collection):
-            """
-            Get the character, color, and frame duration for a given state_index.
-
-            Parameters
-            ----------
-            state_index : int
-            collection : List[List[str]]
-
-            Returns
-            -------
-            Tuple[str, str, int]
-            """
-            if state_index >= len(collection):
-                return None, None, 0
-            color_value, character_symbol, frame_duration_at_state_index = collection[state_index]
-            if isinstance(color_value, list):
-                color_value = random.choice(color_value)
-            if isinstance(character_symbol, list):
-                character_symbol = random.choice(character_symbol)
-            if isinstance(frame_duration_at_state_index, list):
-                frame_duration_at_state_index = random.choice(frame_duration_at_state_index)
-            return color_value, character_symbol, int(frame_duration_at_state_index)
-
-        color = character = None
-        translated_cells = set()
+        set[int] : visual grid indexes of the cells and passages that were painted or cleared
+        """
+        timeline = self.animation_timelines.get(visual_effect)
+        if timeline is None:
+            timeline = self.animation_timelines[visual_effect] = AnimationTimeline(
+                visual_effect.animation_details, visual_effect.cycles, self.palette, self.random
+            )
+        animating = visual_effect.animating
+        width = self.visual_grid.width
+        painted = animating.clear_retired(layer)
+
+        new_cells: dict[int, Cell] = dict()
         for cell in visual_effect.cells:
             if cell:
-                translated_cells.add(self.translate_cell_coords(cell))
-
+                index = (cell.row * 2 + 1) * width + cell.column * 2 + 1
+                if index not in animating:
+                    new_cells[index] = cell
         visual_effect.cells.clear()
 
-        cells_and_passages = set()
-        cells_to_animate = translated_cells | visual_effect.animating.keys()
-        for visual_coordinate in cells_to_animate:
-            for passage in self.passage_map.get(visual_coordinate, set()):
-                if (
-                    len(
-                        {
-                            (passage[0], passage[1] + 1),
-                            (passage[0], passage[1] - 1),
-                            (passage[0] + 1, passage[1]),
-                            (passage[0] - 1, passage[1]),
-                        }
-                        & cells_to_animate
-                    )
-                    == 2
-                ):
-                    cells_and_passages.add(passage)
-        cells_and_passages |= translated_cells
-        cells_and_passages -= visual_effect.animating.keys()
-        cells_and_passages -= visual_effect.animation_completed_passages
-
-        new_cells_initialization = {}
-        for visual_coordinates in cells_and_passages:
-            animation_state = SimpleNamespace()
-            (
-                initial_color,
-                initial_character,
-                initial_frame_duration,
-            ) = get_value_at_animation_state_index(0, visual_effect.animation_details)
-            animation_state.animation_state_index = 0
-            if isinstance(visual_effect.cycles, list):
-                animation_state.cycles_remaining = random.choice(visual_effect.cycles)
-            else:
-                animation_state.cycles_remaining = visual_effect.cycles - 1
-            animation_state.frame_counter = initial_frame_duration
-            animation_state.persistent_character = ""
-            animation_state.final_state_index = len(visual_effect.animation_details) - 1
-            new_cells_initialization[visual_coordinates] = animation_state
-        visual_effect.animating |= new_cells_initialization
-
-        animation_complete = []
-        for visual_coordinate, animation_state in visual_effect.animating.items():
-            if animation_state.frame_counter:
-                animation_state.frame_counter -= 1
-                color, character, frame_duration = get_value_at_animation_state_index(
-                    animation_state.animation_state_index,
-                    visual_effect.animation_details,
-                )
-                if len(character) > 1:
-                    if not animation_state.persistent_character:
-                        character = random.choice(character)
-                        animation_state.persistent_character = character
-                    else:
-                        character = animation_state.persistent_character
-
-            if animation_state.frame_counter == 0:
-                if (
-                    animation_state.animation_state_index == animation_state.final_state_index
-                    and animation_state.cycles_remaining > 0
-                ):
-                    animation_state.animation_state_index = 0
-                    animation_state.cycles_remaining -= 1
-
-                if animation_state.animation_state_index < animation_state.final_state_index:
-                    animation_state.animation_state_index += 1
-                    animation_state.frame_counter = get_value_at_animation_state_index(
-                        animation_state.animation_state_index,
-                        visual_effect.animation_details,
-                    )[2]
-                else:
-                    animation_complete.append(visual_coordinate)
-                animation_state.persistent_character = ""
-
-            if character or color:
-                if color:
-                    color = colorterm.fg(color)
-                colored_visual_grid = self.apply_cell_modification(
-                    colored_visual_grid,
-                    visual_coordinate,
-                    character=character,
-                    color=color,
-                )
-                color = character = None
-        for visual_coordinate in animation_complete:
-            if visual_coordinate in self.passages:
-                visual_effect.animation_completed_passages.add(visual_coordinate)
-            del visual_effect.animating[visual_coordinate]
-        return colored_visual_grid
-
-    def color_multiple_cells(
-        self,
-        colored_visual_grid: list[list[str]],
-        visual_effect: ve.ModifyMultipleCells,
-    ) -> list[list[str]]:
+        def animating_or_new(cell: Cell) -> bool:
+            index = (cell.row * 2 + 1) * width + cell.column * 2 + 1
+            return index in animating or index in new_cells
+
+        new_passages: set[int] = set()
+
+        def add_passage(cell_a: Cell, cell_b: Cell) -> None:
+            index = (cell_a.row + cell_b.row + 1) * width + cell_a.column + cell_b.column + 1
+            if index not in animating and index not in animating.completed_passages and animating_or_new(cell_b):
+                new_passages.add(index)
+
+        for cell in new_cells.values():
+            for neighbor in cell.links:
+                add_passage(cell, neighbor)
+        for cell_a, cell_b in changed_links:
+            if animating_or_new(cell_a) and cell_a.is_linked(cell_b):
+                add_passage(cell_a, cell_b)
+
+        for index in new_cells:
+            animating.add(index, timeline)
+        for index in new_passages:
+            animating.add(index, timeline)
+        painted |= animating.play(layer, timeline, repaint)
+
+        for index in animating.advance():
+            if divmod(index, width) in self.passages:
+                animating.completed_passages.add(index)
+        return painted
+
+    def color_multiple_cells(self, layer: Layer, visual_effect: ve.ModifyMultipleCells) -> Layer:
         """Color multiple cells the same color.
 
         Args:
-            colored_visual_grid (list[list[str]]): List of cells to be colored.
+            layer (Layer): Layer the effect paints into.
             visual_effect (ve.Multiple): Dataclass
 
         Returns:
-            list[list[str]]: colorterm visual grid.
+            Layer: layer with the cells colored.
         """
         if not visual_effect.cells:
-            return colored_visual_grid
+            return layer
         translated_cells = set(self.translate_cell_coords(cell) for cell in visual_effect.cells)
-        color_str = colorterm.fg(visual_effect.color)
         for visual_coordinates in translated_cells:
-            colored_visual_grid = self.apply_cell_modification(colored_visual_grid, visual_coordinates, color_str)
+            layer = self.apply_cell_modification(layer, visual_coordinates, visual_effect.color)
             for passage in self.passage_map.get(visual_coordinates, set()):
                 if (
                     len(
@@ -377,86 +465,159 @@ class Visual:
                     )
                     == 2
                 ):
-                    colored_visual_grid = self.apply_cell_modification(colored_visual_grid, passage, color_str)
-        return colored_visual_grid
+                    layer = self.apply_cell_modification(layer, passage, visual_effect.color)
+        return layer
+
+    def color_tracked_cells(
+        self,
+        layer: Layer,
+        visual_effect: ve.ModifyTrackedCells,
+        changed_links: list[tuple[Cell, Cell]],
+        repaint: bool = False,
+    ) -> set[int]:
+        """Update the layer of a tracked cell effect with the cells added or removed since the previous frame.
+        Like color_multiple_cells, the passage between two linked cells is colored when both cells are in the
+        effect.
+
+        Args:
+            layer (Layer): Layer the effect painted in the previous frame.
+            visual_effect (ve.ModifyTrackedCells): Effect with the changed cells.
+            changed_links (list[tuple[Cell, Cell]]): Cells (un)linked since the previous frame.
+            repaint (bool): Paint every cell in the effect into an empty layer.
 
-    def color_single_cell(
-        self, colored_visual_grid: list[list[str]], visual_effect: ve.ModifySingleCell
-    ) -> list[list[str]]:
+        Returns:
+            set[int]: visual grid indexes of the cells and passages that were repainted.
+        """
+        cells = visual_effect.cells
+        changed_cells = list(cells) if repaint else visual_effect.changed_cells
+        color = (None, self.palette.color_id(visual_effect.color))
+        width = self.visual_grid.width
+        repainted: set[int] = set()
+
+        def paint_passage(cell_a: Cell, cell_b: Cell) -> None:
+            index = (cell_a.row + cell_b.row + 1) * width + cell_a.column + cell_b.column + 1
+            if cell_a in cells and cell_b in cells and cell_a.is_linked(cell_b):
+                layer[index] = color
+            else:
+                layer.pop(index, None)
+            repainted.add(index)
+
+        for cell in changed_cells:
+            index = (cell.row * 2 + 1) * width + cell.column * 2 + 1
+            if cell in cells:
+                layer[index] = color
+            else:
+                layer.pop(index, None)
+            repainted.add(index)
+            for neighbor in cell.links:
+                paint_passage(cell, neighbor)
+        for cell_a, cell_b in changed_links:
+            paint_passage(cell_a, cell_b)
+        visual_effect.changed_cells.clear()
+        return repainted
+
+    def color_single_cell(self, layer: Layer, visual_effect: ve.ModifySingleCell) -> Layer:
         """Color a single cell the given color.
 
         Args:
-            colored_visual_grid (list[list[str]]): Copy of visual_grid.
+            layer (Layer): Layer the effect paints into.
             visual_effect (ve.Single): Dataclass for visual effects.
 
         Raises:
             ValueError: color int must be 0 <= color <= 256
 
         Returns:
-            list[list[str]]: colorterm visual grid
+            Layer: layer with the cell colored
         """
         if not visual_effect.cell:
-            return colored_visual_grid
+            return layer
 
         visual_coordinates = self.translate_cell_coords(visual_effect.cell)
-        color_str = colorterm.fg(visual_effect.color)
-        colored_visual_grid = self.apply_cell_modification(colored_visual_grid, visual_coordinates, color_str)
+        layer = self.apply_cell_modification(layer, visual_coordinates, visual_effect.color)
 
-        return colored_visual_grid
+        return layer
 
-    def color_cell_groups(self, colored_visual_grid: list[list[str]]) -> list[list[str]]:
-        """Color cell groups.
+    def color_cell_groups(
+        self,
+        layer: Layer,
+        visual_effect: ve.RandomColorGroup,
+        changed_links: list[tuple[Cell, Cell]],
+        repaint: bool = False,
+    ) -> set[int]:
+        """Update the layer of a group effect with the cells whose group changed since the previous frame. A cell
+        and the passages to its linked neighbors are colored with the color of the cell's group.
 
-        Args: colored_visual_grid (list[list[str]]): Copy of visual_grid. visual_effect (Optional[
-        ve.RandomColorGroup], optional): Dict mapping group ID's to lists of cells. Defaults to None.
+        Args:
+            layer (Layer): Layer the effect painted in the previous frame.
+            visual_effect (ve.RandomColorGroup): Effect with the changed cells.
+            changed_links (list[tuple[Cell, Cell]]): Cells (un)linked since the previous frame.
+            repaint (bool): Paint every grouped cell into an empty layer.
 
         Returns:
-            list[list[str]]: colorterm visual grid
+            set[int]: visual grid indexes of the cells and passages that were repainted.
         """
-
-        for group, cells in self.last_groups.items():
-            group_color = self.get_group_color(group)
-            translated_cells = set(self.translate_cell_coords(cell) for cell in cells)
-            # cells_and_passages = self.find_passages(translated_cells)
-            for visual_coordinates in translated_cells:
-                colored_visual_grid = self.apply_cell_modification(colored_visual_grid, visual_coordinates, group_color)
-                for passage in self.passage_map.get(visual_coordinates, set()):
-                    colored_visual_grid = self.apply_cell_modification(colored_visual_grid, passage, group_color)
-        return colored_visual_grid
+        cell_groups = visual_effect.cell_groups
+        changed_cells = cell_groups if repaint else visual_effect.changed_cells
+        width = self.visual_grid.width
+        repainted: set[int] = set()
+
+        def paint_passage(cell_a: Cell, cell_b: Cell, color: tuple[None, int]) -> None:
+            index = (cell_a.row + cell_b.row + 1) * width + cell_a.column + cell_b.column + 1
+            if cell_a.is_linked(cell_b):
+                layer[index] = color
+            else:
+                layer.pop(index, None)
+            repainted.add(index)
+
+        for cell, group in changed_cells.items():
+            color = (None, self.palette.color_id(self.get_group_color(group)))
+            index = (cell.row * 2 + 1) * width + cell.column * 2 + 1
+            layer[index] = color
+            repainted.add(index)
+            for neighbor in cell.links:
+                paint_passage(cell, neighbor, color)
+        for cell_a, cell_b in changed_links:
+            group = cell_groups.get(cell_a)
+            if group is not None:
+                paint_passage(cell_a, cell_b, (None, self.palette.color_id(self.get_group_color(group))))
+        visual_effect.changed_cells.clear()
+        return repainted
 
     def apply_cell_modification(
         self,
-        colored_visual_grid: list[list[str]],
+        layer: Layer,
         visual_coordinates: tuple[int, int],
-        color: str | None = None,
+        color: int | str | None = None,
         character: str | None = None,
-    ) -> list[list[str]]:
+    ) -> Layer:
         """
-        Change the character and/or color of the value at the given visual_coordinate in the colored_visual_grid.
+        Change the character and/or color of the value at the given visual_coordinate in the layer. A value
+        not given keeps what the layer already painted at the coordinate, or what is below the layer.
 
         Parameters
         ----------
-        colored_visual_grid : List[List[str]]
+        layer : Layer
         visual_coordinates : Tuple[int, int]
-        color : str
+        color : int | str : xterm color code or hex color string
         character : str
 
         Returns
         -------
-        List[List[str]]
+        Layer
         """
 
         y, x = visual_coordinates
-        current_character = colored_visual_grid[y][x].replace(colorterm.RESET, "")[-1]
-        current_color = colored_visual_grid[y][x].replace(colorterm.RESET, "")[:-1]
-        if character:
-            current_character = character
-        if color:
-            current_color = color
-        colored_visual_grid[y][x] = (
-            f"{colorterm.bg(self.theme.wall.color)}{current_color}{current_character}{colorterm.RESET}"
-        )
-        return colored_visual_grid
+        index = y * self.visual_grid.width + x
+        glyph = self.palette.glyph_id(character) if character else None
+        fg = self.palette.color_id(color) if color is not None else None
+        painted = layer.get(index)
+        if painted is not None:
+            if glyph is None:
+                glyph = painted[0]
+            if fg is None:
+                fg = painted[1]
+        layer[index] = (glyph, fg)
+        return layer
 
     def format_status(self, status_text: dict[str, str | int | None]) -> str:
         """
@@ -490,6 +651,43 @@ class Visual:
         seconds = int(seconds % 60)
         return f"{minutes}m {seconds}s"
 
+    def start_render_thread(self) -> RenderThread:
+        """Start drawing frames on a RenderThread at target_fps. show then publishes frames instead of writing them.
+
+        Returns:
+            RenderThread: the running render thread
+        """
+        if self.render_thread is None:
+            self.render_thread = RenderThread(self.renderer, self.target_fps)
+            self.render_thread.start()
+        return self.render_thread
+
+    def stop_render_thread(self) -> None:
+        """Stop the render thread, if one is running, once it finished writing its current frame."""
+        if self.render_thread is not None:
+            self.render_thread.stop()
+            self.render_thread = None
+
+    def start_recording(self, path: str) -> FrameRecorder:
+        """Record every frame drawn from now on to a file, for terminalmaze replay.
+
+        Args:
+            path (str): recording file, replaced if it exists
+
+        Returns:
+            FrameRecorder: the recorder the renderer writes to
+        """
+        self.stop_recording()
+        self.renderer.recorder = FrameRecorder(path, self.palette)
+        return self.renderer.recorder
+
+    def stop_recording(self) -> None:
+        """Finish the recording, if one is being made, once the render thread stopped drawing."""
+        if self.renderer.recorder is not None:
+            self.stop_render_thread()
+            self.renderer.recorder.close()
+            self.renderer.recorder = None
+
     def show(
         self,
         visual_effects: dict[str, ve.VisualEffect],
@@ -500,39 +698,138 @@ class Visual:
         redrawdelay: float = 0.015,
     ) -> None:
         """
+        Composite the visual effects into a frame and draw it. When target_fps is set, frames are published to a
+        render thread that draws the latest one at that rate, intermediate frames are dropped when the terminal
+        cannot keep up. The complete frame is always drawn in full before show returns.
 
         Parameters
         ----------
-        nostatus :
         visual_effects : Effects to be applied to the maze
         status_text : Status texts to display below the maze
         verbosity : Determines which visual effects are shown
         complete : Indicates the maze is complete, final image of the maze
         nostatus : Determines if the status text is shown below the maze
-        redrawdelay : The minimum time between screen redraws
+        redrawdelay : The minimum time between shown steps, with a render thread the frame scheduler holds the steps
 
         Returns
         -------
 
         """
-        if verbosity == 0:
-            print(self.format_status(status_text), end="\r")
-            if not complete:
+        start = time.perf_counter()
+        if not self.terminal_prepared:
+            self.prep_terminal()
+        try:
+            if verbosity == 0:
+                print(self.format_status(status_text), end="\r")
+                if not complete:
+                    return
+
+            if self.viewport is not None:
+                self.move_viewport(visual_effects)
+
+            if self.target_fps > 0 and not complete:
+                render_thread = self.start_render_thread()
+                with render_thread.lock:
+                    maze_visual = self.compose_frame(visual_effects, verbosity)
+                    render_thread.publish(maze_visual, self.status_line(status_text, nostatus), self.dirty_cells)
                 return
 
-        maze_visual = self.add_visual_effects(visual_effects, verbosity)
-        lines = ["".join(line) for line in maze_visual]
+            self.stop_render_thread()
+            maze_visual = self.compose_frame(visual_effects, verbosity)
+            self.wait_for_next_step(redrawdelay)
+            status = self.status_line(status_text, nostatus)
+            sys.stdout.write(self.renderer.render(maze_visual, status, full=complete, candidates=self.dirty_cells))
+            sys.stdout.flush()
+        finally:
+            self.render_time += time.perf_counter() - start
+            self.frames_rendered += 1
+
+    def compose_frame(self, visual_effects: dict[str, ve.VisualEffect], verbosity: int) -> FrameBuffer:
+        """
+        Composite the visual effects and pack the result with the minimap, if one is used. dirty_cells is left
+        with the indexes of the frame that changed.
+
+        Parameters
+        ----------
+        visual_effects : Effects to be applied to the maze
+        verbosity : Determines which visual effects are shown
+
+        Returns
+        -------
+        FrameBuffer : frame to draw
+        """
+        frame = self.add_visual_effects(visual_effects, verbosity)
+        if self.minimap is not None:
+            frame, self.dirty_cells = self.minimap.pack(frame, self.dirty_cells)
+        return frame
+
+    def move_viewport(self, visual_effects: dict[str, ve.VisualEffect]) -> None:
+        """Pan the viewport for the keys pressed since the previous frame and let it follow the working cell.
+
+        Parameters
+        ----------
+        visual_effects : Effects to be applied to the maze, the working cell is taken from them
+        """
+        viewport = self.viewport
+        if viewport is None:
+            return
+        for key in self.key_reader.read_keys():
+            viewport.press(key)
+        cell = self.working_cell(visual_effects)
+        if cell is not None:
+            viewport.follow(cell.row * 2 + 1, cell.column * 2 + 1)
+
+    def working_cell(self, visual_effects: dict[str, ve.VisualEffect]) -> Cell | None:
+        """
+        Find the cell the algorithm is working on: the cell of its working cell or position effect, else the cell
+        most recently linked or unlinked.
+
+        Parameters
+        ----------
+        visual_effects : Effects to be applied to the maze
+
+        Returns
+        -------
+        Cell | None : the working cell, None if there is no indication of one
+        """
+        for name in ("working_cell", "position"):
+            effect = visual_effects.get(name)
+            if isinstance(effect, ve.ModifySingleCell) and effect.cell:
+                return effect.cell
+            if isinstance(effect, ve.Animation) and effect.cells and effect.cells[-1]:
+                return effect.cells[-1]
+        if self.changed_links:
+            return self.changed_links[-1][1]
+        return None
+
+    def status_line(self, status_text: dict[str, str | int | None], nostatus: bool) -> str | None:
+        """
+        Add the elapsed time and the size of the last frame to the status text and format it.
+
+        Parameters
+        ----------
+        status_text : dict of label:value pairs for status updates
+        nostatus : Determines if the status text is shown below the maze
+
+        Returns
+        -------
+        str | None : status string, None when the status text is not shown
+        """
+        status_text["Time Elapsed"] = self.time_elapsed()
+        status_text["Frame Bytes"] = self.renderer.frame_bytes
+        if self.viewport is not None:
+            status_text["View"] = self.viewport.describe()
+        return None if nostatus else self.format_status(status_text)
+
+    def wait_for_next_step(self, redrawdelay: float) -> None:
+        """
+        Sleep until redrawdelay seconds passed since the previous call.
+
+        Parameters
+        ----------
+        redrawdelay : The minimum time between shown steps
+        """
         time_since_last_show = time.time() - self.last_show_time
         if time_since_last_show < redrawdelay:
             time.sleep(redrawdelay - time_since_last_show)
-        status_text["Time Elapsed"] = self.time_elapsed()
-        output = "\n".join(lines)
-        if not nostatus:
-            output += f"\n{colorterm.RESET}{self.format_status(status_text)}"
-        sys.stdout.write(ansitools.DEC_RESTORE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.DEC_SAVE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.MOVE_CURSOR_UP(len(self.visual_grid) + 2))
-        sys.stdout.write(output)
-        sys.stdout.flush()
-
         self.last_show_time = time.time()